@@ -14,17 +14,12 @@ if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(line_buffering=True)  # type: ignore[union-attr]
 
 import json
-from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.table import Table
-
-from debussy.config import get_orchestrator_dir
-from debussy.core.models import CompletionSignal, PhaseStatus, RunStatus
-from debussy.core.state import StateManager
 
 __version__ = "0.1.1"
 
@@ -35,6 +30,37 @@ app = typer.Typer(
 )
 console = Console()
 
+# Rich colors for run/phase statuses. Keyed by the enum values (RunStatus and
+# PhaseStatus are str enums, so members look up directly) to keep
+# debussy.core.models out of CLI startup.
+_RUN_STATUS_COLORS = MappingProxyType(
+    {
+        "running": "blue",
+        "completed": "green",
+        "failed": "red",
+        "paused": "yellow",
+    }
+)
+_PHASE_STATUS_COLORS = MappingProxyType(
+    {
+        "pending": "dim",
+        "running": "blue",
+        "validating": "cyan",
+        "completed": "green",
+        "failed": "red",
+        "blocked": "yellow",
+        "awaiting_human": "magenta",
+    }
+)
+
+# Column headers for the status/history tables
+_PHASE_EXECUTION_COLUMNS = ("Phase", "Attempt", "Status", "Duration")
+_HISTORY_COLUMNS = ("Run ID", "Plan", "Status", "Started", "Duration")
+
+# Past this many rows, history drops the table borders (Rich renders borders
+# per row, so long listings print noticeably faster without them)
+_COMPACT_HISTORY_ROWS = 100
+
 # ---------------------------------------------------------------------------
 # Register command modules
 # ---------------------------------------------------------------------------
@@ -209,8 +235,8 @@ def audit(
     # Display issues grouped by severity
     from debussy.core.audit import AuditSeverity
 
-    errors = [i for i in result.issues if i.severity == AuditSeverity.ERROR]
-    warnings = [i for i in result.issues if i.severity == AuditSeverity.WARNING]
+    errors = result.errors
+    warnings = result.warnings
     infos = [i for i in result.issues if i.severity == AuditSeverity.INFO]
 
     if errors:
@@ -274,33 +300,13 @@ def done(
     ] = None,
 ) -> None:
     """Signal phase completion (called by Claude worker)."""
-    orchestrator_dir = get_orchestrator_dir()
-    state = StateManager(orchestrator_dir / "state.db")
+    from debussy.worker_cli import record_done
 
-    # Get current run
-    current_run = state.get_current_run()
-    if current_run is None:
-        console.print("[red]No active orchestration run found[/red]")
-        raise typer.Exit(1)
-
-    # Parse report if provided
-    report_dict = None
-    if report:
-        try:
-            report_dict = json.loads(report)
-        except json.JSONDecodeError as e:
-            console.print(f"[red]Invalid JSON report: {e}[/red]")
-            raise typer.Exit(1) from e
-
-    # Record completion signal
-    signal = CompletionSignal(
-        phase_id=phase,
-        status=status,  # type: ignore[arg-type]
-        reason=reason,
-        report=report_dict,
-        signaled_at=datetime.now(),
-    )
-    state.record_completion_signal(current_run.id, signal)
+    try:
+        record_done(phase, status, reason, report)
+    except (RuntimeError, ValueError) as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1) from e
 
     console.print(f"[green]Completion signal recorded for phase {phase}[/green]")
     console.print(f"  Status: {status}")
@@ -325,15 +331,14 @@ def progress(
     ],
 ) -> None:
     """Log progress during execution (for stuck detection)."""
-    orchestrator_dir = get_orchestrator_dir()
-    state = StateManager(orchestrator_dir / "state.db")
+    from debussy.worker_cli import record_progress
 
-    current_run = state.get_current_run()
-    if current_run is None:
-        console.print("[red]No active orchestration run found[/red]")
-        raise typer.Exit(1)
+    try:
+        record_progress(phase, step)
+    except RuntimeError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(1) from e
 
-    state.log_progress(current_run.id, phase, step)
     console.print(f"[dim]Progress logged: {phase} - {step}[/dim]")
 
 
@@ -364,6 +369,11 @@ def status(
     """Show current orchestration status."""
     import asyncio
 
+    from rich.table import Table
+
+    from debussy.config import get_orchestrator_dir
+    from debussy.core.state import StateManager
+
     orchestrator_dir = get_orchestrator_dir()
     state_mgr = StateManager(orchestrator_dir / "state.db")
 
@@ -374,13 +384,7 @@ def status(
         return
 
     # Run info
-    status_colors = {
-        RunStatus.RUNNING: "blue",
-        RunStatus.COMPLETED: "green",
-        RunStatus.FAILED: "red",
-        RunStatus.PAUSED: "yellow",
-    }
-    color = status_colors.get(run_state.status, "white")
+    color = _RUN_STATUS_COLORS.get(run_state.status, "white")
 
     console.print(f"\n[bold]Run {run_state.id}[/bold]")
     console.print(f"  Status: [{color}]{run_state.status.value}[/{color}]")
@@ -394,24 +398,10 @@ def status(
     # Phase executions table
     if run_state.phase_executions:
         console.print("\n[bold]Phase Executions[/bold]")
-        table = Table()
-        table.add_column("Phase")
-        table.add_column("Attempt")
-        table.add_column("Status")
-        table.add_column("Duration")
-
-        phase_colors = {
-            PhaseStatus.PENDING: "dim",
-            PhaseStatus.RUNNING: "blue",
-            PhaseStatus.VALIDATING: "cyan",
-            PhaseStatus.COMPLETED: "green",
-            PhaseStatus.FAILED: "red",
-            PhaseStatus.BLOCKED: "yellow",
-            PhaseStatus.AWAITING_HUMAN: "magenta",
-        }
+        table = Table(*_PHASE_EXECUTION_COLUMNS)
 
         for exec in run_state.phase_executions:
-            p_color = phase_colors.get(exec.status, "white")
+            p_color = _PHASE_STATUS_COLORS.get(exec.status, "white")
             duration = ""
             if exec.started_at and exec.completed_at:
                 delta = exec.completed_at - exec.started_at
@@ -446,6 +436,11 @@ def history(
     ] = 10,
 ) -> None:
     """List past orchestration runs."""
+    from rich.table import Table
+
+    from debussy.config import get_orchestrator_dir
+    from debussy.core.state import StateManager
+
     orchestrator_dir = get_orchestrator_dir()
     state = StateManager(orchestrator_dir / "state.db")
 
@@ -454,22 +449,13 @@ def history(
         console.print("[yellow]No orchestration runs found[/yellow]")
         return
 
-    table = Table(title="Orchestration History")
-    table.add_column("Run ID")
-    table.add_column("Plan")
-    table.add_column("Status")
-    table.add_column("Started")
-    table.add_column("Duration")
-
-    status_colors = {
-        RunStatus.RUNNING: "blue",
-        RunStatus.COMPLETED: "green",
-        RunStatus.FAILED: "red",
-        RunStatus.PAUSED: "yellow",
-    }
+    if len(runs) > _COMPACT_HISTORY_ROWS:
+        table = Table(*_HISTORY_COLUMNS, title="Orchestration History", box=None, show_edge=False, pad_edge=False)
+    else:
+        table = Table(*_HISTORY_COLUMNS, title="Orchestration History")
 
     for run_entry in runs:
-        color = status_colors.get(run_entry.status, "white")
+        color = _RUN_STATUS_COLORS.get(run_entry.status, "white")
         duration = ""
         if run_entry.completed_at:
             delta = run_entry.completed_at - run_entry.started_at
@@ -7,18 +7,12 @@ from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-
-from debussy.config import get_orchestrator_dir
-from debussy.core.models import PhaseStatus
-from debussy.core.orchestrator import run_orchestration
-from debussy.core.state import StateManager
-from debussy.parsers.master import parse_master_plan
-from debussy.ui.controller import OrchestrationController
 
 console = Console()
 
+# Column headers for the --dry-run phase table
+_DRY_RUN_COLUMNS = ("ID", "Title", "Status", "Dependencies", "Gates", "Required Agents")
+
 BANNER = r"""
 
 ██████╗ ███████╗██████╗ ██╗   ██╗███████╗███████╗██╗   ██╗
@@ -40,6 +34,11 @@ def _display_banner(
     interactive: bool = True,
 ) -> None:
     """Display the startup banner with plan info."""
+    from rich.table import Table
+    from rich.text import Text
+
+    from debussy.core.models import PhaseStatus
+
     # ASCII art
     console.print(Text(BANNER, style="bold cyan"))
 
@@ -94,6 +93,9 @@ def _get_resumable_run_info(
     Returns:
         Tuple of (run_id, completed_phase_ids) or None if no resumable run
     """
+    from debussy.config import get_orchestrator_dir
+    from debussy.core.state import StateManager
+
     orchestrator_dir = get_orchestrator_dir()
     state = StateManager(orchestrator_dir / "state.db")
     existing = state.find_resumable_run(master_plan)
@@ -153,6 +155,7 @@ def _run_with_tui(
     """
     from debussy.config import Config
     from debussy.core.orchestrator import Orchestrator
+    from debussy.ui.controller import OrchestrationController
     from debussy.ui.tui import DebussyTUI
 
     if config is None:
@@ -193,6 +196,10 @@ def _run_with_tui(
 
 def _dry_run(master_plan: Path) -> None:
     """Perform a dry run - parse and validate without executing."""
+    from rich.table import Table
+
+    from debussy.parsers.master import parse_master_plan
+
     console.print("[bold]Dry Run - Parsing and Validating[/bold]\n")
 
     try:
@@ -203,13 +210,7 @@ def _dry_run(master_plan: Path) -> None:
 
         # Parse each phase
         console.print("\n[bold]Phases:[/bold]")
-        table = Table()
-        table.add_column("ID")
-        table.add_column("Title")
-        table.add_column("Status")
-        table.add_column("Dependencies")
-        table.add_column("Gates")
-        table.add_column("Required Agents")
+        table = Table(*_DRY_RUN_COLUMNS)
 
         from debussy.parsers.phase import parse_phase
 
@@ -484,6 +485,9 @@ def register(app: typer.Typer) -> None:
                     raise typer.Exit(0)
 
         # Parse plan and display banner (skip for TUI - it has its own header)
+        from debussy.core.orchestrator import run_orchestration
+        from debussy.parsers.master import parse_master_plan
+
         plan = parse_master_plan(master_plan)
 
         try:
@@ -529,6 +533,10 @@ def register(app: typer.Typer) -> None:
     @app.command()
     def resume() -> None:
         """Resume a paused orchestration run."""
+        from debussy.config import get_orchestrator_dir
+        from debussy.core.orchestrator import run_orchestration
+        from debussy.core.state import StateManager
+
         orchestrator_dir = get_orchestrator_dir()
         state = StateManager(orchestrator_dir / "state.db")
 
@@ -8,13 +8,10 @@ from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
-from rich.table import Table
-
-from debussy.config import get_orchestrator_dir
-from debussy.core.state import StateManager
 
 if TYPE_CHECKING:
     from debussy.core.models import RunState
+    from debussy.core.state import StateManager
 
 console = Console()
 
@@ -138,6 +135,8 @@ async def _display_issue_status(
                 console.print(f"[dim]Cached {avg_age:.0f}s ago, use --refresh to update[/dim]")
 
         # Issue table
+        from rich.table import Table
+
         issue_table = Table()
         issue_table.add_column("Issue")
         issue_table.add_column("Platform")
@@ -329,6 +328,9 @@ def register(app: typer.Typer) -> None:
         """
         import asyncio
 
+        from debussy.config import get_orchestrator_dir
+        from debussy.core.state import StateManager
+
         orchestrator_dir = get_orchestrator_dir()
         state = StateManager(orchestrator_dir / "state.db")
 
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-import yaml
 from pydantic import BaseModel, Field
 
 
@@ -126,20 +126,30 @@ class Config(BaseModel):
             # Look for config in .debussy/config.yaml
             config_path = Path(".debussy/config.yaml")
 
-        if config_path.exists():
-            with config_path.open() as f:
-                data = yaml.safe_load(f) or {}
-            return cls.model_validate(data)
-
-        return cls()
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            return cls()
+        return cls.model_validate(_read_yaml(config_path.absolute(), stat.st_mtime_ns, stat.st_size))
 
     def save(self, config_path: Path) -> None:
         """Save configuration to file."""
+        import yaml
+
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with config_path.open("w") as f:
             yaml.dump(self.model_dump(), f, default_flow_style=False)
 
 
+@lru_cache(maxsize=4)
+def _read_yaml(path: Path, mtime_ns: int, size: int) -> dict[str, Any]:  # noqa: ARG001
+    """Parse a YAML config file; cached until its mtime or size changes."""
+    import yaml
+
+    with path.open() as f:
+        return yaml.safe_load(f) or {}
+
+
 def get_orchestrator_dir(project_root: Path | None = None) -> Path:
     """Get the .debussy directory, creating if needed."""
     if project_root is None:
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-
-from pydantic import BaseModel
+from typing import Final
 
 
 class AuditSeverity(str, Enum):
@@ -15,7 +16,23 @@ class AuditSeverity(str, Enum):
     INFO = "info"  # Suggestions
 
 
-class AuditIssue(BaseModel):
+# Issue codes. Interned so that code comparisons hit the identity fast path.
+BUILTIN_AGENT: Final = sys.intern("BUILTIN_AGENT")
+CIRCULAR_DEPENDENCY: Final = sys.intern("CIRCULAR_DEPENDENCY")
+CUSTOM_AGENT: Final = sys.intern("CUSTOM_AGENT")
+MASTER_NOT_FOUND: Final = sys.intern("MASTER_NOT_FOUND")
+MASTER_PARSE_ERROR: Final = sys.intern("MASTER_PARSE_ERROR")
+MISSING_AGENT: Final = sys.intern("MISSING_AGENT")
+MISSING_DEPENDENCY: Final = sys.intern("MISSING_DEPENDENCY")
+MISSING_GATES: Final = sys.intern("MISSING_GATES")
+NO_NOTES_OUTPUT: Final = sys.intern("NO_NOTES_OUTPUT")
+NO_PHASES: Final = sys.intern("NO_PHASES")
+PHASE_NOT_FOUND: Final = sys.intern("PHASE_NOT_FOUND")
+PHASE_PARSE_ERROR: Final = sys.intern("PHASE_PARSE_ERROR")
+
+
+@dataclass(slots=True, frozen=True)
+class AuditIssue:
     """An issue found during plan audit."""
 
     severity: AuditSeverity
@@ -25,7 +42,8 @@ class AuditIssue(BaseModel):
     suggestion: str | None = None  # Suggested fix for the issue
 
 
-class AuditSummary(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AuditSummary:
     """Summary of audit results."""
 
     master_plan: str
@@ -36,9 +54,27 @@ class AuditSummary(BaseModel):
     warnings: int
 
 
-class AuditResult(BaseModel):
-    """Result of auditing a plan."""
+@dataclass(slots=True, frozen=True)
+class AuditResult:
+    """Result of auditing a plan.
+
+    ``errors`` and ``warnings`` hold the issues of that severity, split once
+    at construction.
+    """
 
     passed: bool
     issues: list[AuditIssue]
     summary: AuditSummary
+    errors: tuple[AuditIssue, ...] = field(init=False, repr=False, compare=False)
+    warnings: tuple[AuditIssue, ...] = field(init=False, repr=False, compare=False)
+    _error_codes: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        errors = tuple(i for i in self.issues if i.severity is AuditSeverity.ERROR)
+        object.__setattr__(self, "errors", errors)
+        object.__setattr__(self, "warnings", tuple(i for i in self.issues if i.severity is AuditSeverity.WARNING))
+        object.__setattr__(self, "_error_codes", frozenset(i.code for i in errors))
+
+    def has_error(self, code: str) -> bool:
+        """Return True if an error-severity issue with this code was found."""
+        return code in self._error_codes
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from debussy.core import audit
 from debussy.core.audit import AuditIssue, AuditResult, AuditSeverity, AuditSummary
 from debussy.parsers.master import parse_master_plan
 from debussy.parsers.phase import parse_phase
@@ -39,6 +45,35 @@ SUBAGENT_YAML_PATTERN = re.compile(r"subagent_type:\s*([a-zA-Z0-9_-]+)", re.IGNO
 SUBAGENT_JSON_PATTERN = re.compile(r'subagent_type\s*[=:]\s*["\']([a-zA-Z0-9_-]+)["\']', re.IGNORECASE)
 
 
+def _read_plan_file(path: Path) -> str:
+    """Read a plan file, reusing the cached text while it is unchanged on disk."""
+    stat = path.stat()
+    return _read_plan_text(path.absolute(), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _read_plan_text(path: Path, mtime_ns: int, size: int) -> str:  # noqa: ARG001
+    """Read a plan file; cached until its mtime or size changes."""
+    return path.read_text(encoding="utf-8")
+
+
+def _prefetch_plan_files(paths: list[Path]) -> None:
+    """Read plan files on a thread pool to warm the plan file cache.
+
+    Unreadable files are skipped here; the sequential pass reports them.
+    Set DEBUSSY_AUDIT_SEQUENTIAL=1 to read files one at a time instead.
+    """
+    if len(paths) < 2 or os.environ.get("DEBUSSY_AUDIT_SEQUENTIAL") == "1":
+        return
+
+    def read(path: Path) -> None:
+        with contextlib.suppress(OSError, UnicodeDecodeError):
+            _read_plan_file(path)
+
+    with ThreadPoolExecutor(max_workers=min(16, len(paths))) as pool:
+        list(pool.map(read, paths))
+
+
 class PlanAuditor:
     """Auditor for validating plan structure deterministically."""
 
@@ -74,7 +109,7 @@ class PlanAuditor:
             issues.append(
                 AuditIssue(
                     severity=AuditSeverity.ERROR,
-                    code="MASTER_NOT_FOUND",
+                    code=audit.MASTER_NOT_FOUND,
                     message=f"Master plan not found: {master_plan_path}",
                     location=str(master_plan_path),
                     suggestion="Create a master plan file with a '## Phases' table listing all phase files",
@@ -96,7 +131,7 @@ class PlanAuditor:
             issues.append(
                 AuditIssue(
                     severity=AuditSeverity.ERROR,
-                    code="MASTER_PARSE_ERROR",
+                    code=audit.MASTER_PARSE_ERROR,
                     message=f"Failed to parse master plan: {e}",
                     location=str(master_plan_path),
                     suggestion="Check the master plan format. Ensure it has a '## Phases' table with columns: Phase, Title, Focus, Risk, Status",
@@ -123,6 +158,8 @@ class PlanAuditor:
         gates_total = 0
         parsed_phases: list[Phase] = []
 
+        _prefetch_plan_files([phase.path for phase in master.phases])
+
         for phase in master.phases:
             phase_issues = self._check_phase_file(phase)
             issues.extend(phase_issues)
@@ -130,7 +167,7 @@ class PlanAuditor:
             # Only parse if phase file exists
             if phase.path.exists():
                 try:
-                    detailed_phase = parse_phase(phase.path, phase.id)
+                    detailed_phase = parse_phase(phase.path, phase.id, content=_read_plan_file(phase.path))
                     parsed_phases.append(detailed_phase)
 
                     # Check gates and notes paths
@@ -144,7 +181,7 @@ class PlanAuditor:
                     issues.append(
                         AuditIssue(
                             severity=AuditSeverity.ERROR,
-                            code="PHASE_PARSE_ERROR",
+                            code=audit.PHASE_PARSE_ERROR,
                             message=f"Failed to parse phase: {e}",
                             location=str(phase.path),
                             suggestion="Check the phase file format. Ensure it has '## Gates' and '## Tasks' sections",
@@ -191,7 +228,7 @@ class PlanAuditor:
             issues.append(
                 AuditIssue(
                     severity=AuditSeverity.ERROR,
-                    code="NO_PHASES",
+                    code=audit.NO_PHASES,
                     message="Master plan has no phases defined",
                     location=str(master.path),
                     suggestion="Add rows to the '## Phases' table. Each row should link to a phase file: | 1 | [Phase Title](phase-1.md) | Focus | Risk | Pending |",
@@ -215,7 +252,7 @@ class PlanAuditor:
             issues.append(
                 AuditIssue(
                     severity=AuditSeverity.ERROR,
-                    code="PHASE_NOT_FOUND",
+                    code=audit.PHASE_NOT_FOUND,
                     message=f"Phase file not found: {phase.path.name}",
                     location=str(phase.path),
                     suggestion=f"Create the phase file at '{phase.path.name}' or update the master plan to point to an existing file",
@@ -239,7 +276,7 @@ class PlanAuditor:
             issues.append(
                 AuditIssue(
                     severity=AuditSeverity.ERROR,
-                    code="MISSING_GATES",
+                    code=audit.MISSING_GATES,
                     message=f"Phase {phase.id} has no gates defined (critical for validation)",
                     location=str(phase.path),
                     suggestion="Add a '## Gates' section with validation commands, e.g.:\n- ruff: 0 errors (command: `uv run ruff check .`)\n- tests: pass (command: `uv run pytest tests/`)",
@@ -263,7 +300,7 @@ class PlanAuditor:
             issues.append(
                 AuditIssue(
                     severity=AuditSeverity.WARNING,
-                    code="NO_NOTES_OUTPUT",
+                    code=audit.NO_NOTES_OUTPUT,
                     message=f"Phase {phase.id} has no notes output path specified",
                     location=str(phase.path),
                     suggestion="Add '- [ ] Write notes to: `notes/NOTES_phase_X.md`' to the Process Wrapper section",
@@ -292,7 +329,7 @@ class PlanAuditor:
                     issues.append(
                         AuditIssue(
                             severity=AuditSeverity.WARNING,
-                            code="MISSING_DEPENDENCY",
+                            code=audit.MISSING_DEPENDENCY,
                             message=f"Phase {phase.id} depends on non-existent phase {dep_id}",
                             location=str(phase.path),
                             suggestion=f"Either add phase {dep_id} to the master plan, or remove the dependency from phase {phase.id}",
@@ -304,7 +341,7 @@ class PlanAuditor:
                 issues.append(
                     AuditIssue(
                         severity=AuditSeverity.ERROR,
-                        code="CIRCULAR_DEPENDENCY",
+                        code=audit.CIRCULAR_DEPENDENCY,
                         message=f"Phase {phase.id} depends on itself",
                         location=str(phase.path),
                         suggestion=f"Remove the self-dependency from phase {phase.id}'s 'Depends On' field",
@@ -327,56 +364,49 @@ class PlanAuditor:
         """
         issues: list[AuditIssue] = []
 
-        # Build adjacency list
+        # Kahn's algorithm: repeatedly remove phases whose dependencies are all
+        # satisfied; whatever remains is on, or depends on, a cycle. Iterative,
+        # so long dependency chains cannot hit the recursion limit.
         graph: dict[str, list[str]] = {p.id: p.depends_on for p in phases}
-
-        # DFS to detect cycles
-        visited: set[str] = set()
-        rec_stack: set[str] = set()
-
-        def has_cycle(node: str, path: list[str]) -> list[str] | None:
-            """DFS helper to detect cycles.
-
-            Args:
-                node: Current node ID.
-                path: Current path from root.
-
-            Returns:
-                Path forming the cycle if found, None otherwise.
-            """
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    cycle = has_cycle(neighbor, path[:])
-                    if cycle:
-                        return cycle
-                elif neighbor in rec_stack:
-                    # Found cycle
-                    cycle_start = path.index(neighbor)
-                    return [*path[cycle_start:], neighbor]
-
-            rec_stack.remove(node)
-            return None
-
-        # Check each unvisited node
-        for phase in phases:
-            if phase.id not in visited:
-                cycle = has_cycle(phase.id, [])
-                if cycle:
-                    cycle_str = " -> ".join(cycle)
-                    issues.append(
-                        AuditIssue(
-                            severity=AuditSeverity.ERROR,
-                            code="CIRCULAR_DEPENDENCY",
-                            message=f"Circular dependency detected: {cycle_str}",
-                            location=None,
-                            suggestion=f"Break the cycle by removing one of the dependencies in: {cycle_str}",
-                        )
-                    )
-                    break  # Only report first cycle found
+        dependents: dict[str, list[str]] = {phase_id: [] for phase_id in graph}
+        pending: dict[str, int] = dict.fromkeys(graph, 0)
+        for phase_id, deps in graph.items():
+            for dep_id in deps:
+                if dep_id in graph:  # Missing phases are reported separately
+                    dependents[dep_id].append(phase_id)
+                    pending[phase_id] += 1
+
+        ready = deque(phase_id for phase_id, count in pending.items() if count == 0)
+        while ready:
+            for dependent in dependents[ready.popleft()]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        blocked = [p.id for p in phases if pending[p.id] > 0]
+        if blocked:
+            # Every blocked phase has a blocked dependency, so following them
+            # from the first one must revisit a phase: that loop is the cycle
+            node = blocked[0]
+            path: list[str] = []
+            seen: dict[str, int] = {}
+            while node not in seen:
+                seen[node] = len(path)
+                path.append(node)
+                node = next(dep_id for dep_id in graph[node] if pending.get(dep_id, 0) > 0)
+            cycle = [*path[seen[node] :], node]
+
+            # Only report the first cycle found
+            cycle_str = " -> ".join(cycle)
+            issues.append(
+                AuditIssue(
+                    severity=AuditSeverity.ERROR,
+                    code=audit.CIRCULAR_DEPENDENCY,
+                    message=f"Circular dependency detected: {cycle_str}",
+                    location=None,
+                    suggestion=f"Break the cycle by removing one of the dependencies in: {cycle_str}",
+                )
+            )
 
         return issues
 
@@ -457,7 +487,7 @@ class PlanAuditor:
             if not phase.path.exists():
                 continue
 
-            content = phase.path.read_text(encoding="utf-8")
+            content = _read_plan_file(phase.path)
             agents = self._extract_agent_references(content)
 
             # Track which phases reference each agent
@@ -477,7 +507,7 @@ class PlanAuditor:
                     issues.append(
                         AuditIssue(
                             severity=AuditSeverity.INFO,
-                            code="BUILTIN_AGENT",
+                            code=audit.BUILTIN_AGENT,
                             message=f"Built-in agent '{agent}' referenced in: {', '.join(phase_files)}",
                             location=None,
                         )
@@ -490,7 +520,7 @@ class PlanAuditor:
                 issues.append(
                     AuditIssue(
                         severity=AuditSeverity.ERROR,
-                        code="MISSING_AGENT",
+                        code=audit.MISSING_AGENT,
                         message=f"Missing custom agent '{agent}'",
                         location=f"Referenced in: {', '.join(phase_files)}",
                         suggestion=f"Create the agent file at: {expected_path}",
@@ -500,7 +530,7 @@ class PlanAuditor:
                 issues.append(
                     AuditIssue(
                         severity=AuditSeverity.INFO,
-                        code="CUSTOM_AGENT",
+                        code=audit.CUSTOM_AGENT,
                         message=f"Custom agent '{agent}' found in: {', '.join(phase_files)}",
                         location=str(agents_dir / f"{agent}.md"),
                     )
@@ -131,6 +131,7 @@ class ExecutionResult(BaseModel):
     exit_code: int
     duration_seconds: float
     pid: int | None = None
+    session_log_path: Path | None = None  # Raw JSONL log on disk (file output mode)
 
 
 class CompletionSignal(BaseModel):
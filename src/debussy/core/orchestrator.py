@@ -29,7 +29,8 @@ from debussy.parsers.master import parse_master_plan
 from debussy.parsers.phase import parse_phase
 from debussy.runners.claude import ClaudeRunner, TokenStats
 from debussy.runners.gates import GateRunner
-from debussy.ui import NonInteractiveUI, OrchestratorUI, TextualUI, UIState, UserAction
+from debussy.ui import NonInteractiveUI, OrchestratorUI, UIState, UserAction
+from debussy.utils.event_loop import new_event_loop
 
 if TYPE_CHECKING:
     from debussy.sync.github_sync import GitHubSyncCoordinator
@@ -80,8 +81,13 @@ class Orchestrator(PhaseRunnerMixin, RetryHandlerMixin, CompletionMixin):
         # Initialize orchestrator event logger
         self._event_logger = get_orchestrator_logger(self.project_root)
 
-        # Initialize UI based on config
-        self.ui: OrchestratorUI = TextualUI() if self.config.interactive else NonInteractiveUI()
+        # Initialize UI based on config (Textual is only imported when needed)
+        if self.config.interactive:
+            from debussy.ui.tui import TextualUI
+
+            self.ui: OrchestratorUI = TextualUI()
+        else:
+            self.ui = NonInteractiveUI()
 
         # Connect UI to ClaudeRunner for log output routing
         self.claude.set_callbacks(
@@ -607,4 +613,4 @@ def run_orchestration(
     """
     orchestrator = Orchestrator(master_plan_path, config, project_root=project_root)
     orchestrator.load_plan()
-    return asyncio.run(orchestrator.run(start_phase, skip_phases))
+    return asyncio.run(orchestrator.run(start_phase, skip_phases), loop_factory=new_event_loop)
@@ -188,6 +188,8 @@ class PhaseRunnerMixin:
 
             # Spawn Claude worker (with restart logic for non-remediation runs)
             result = await self._execute_phase_internal(run_id, phase, prompt, is_remediation)
+            if result.session_log_path is not None:
+                self.state.set_phase_log_path(run_id, phase.id, result.session_log_path)
 
             if not result.success:
                 self.state.update_phase_status(
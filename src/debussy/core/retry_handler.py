@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import subprocess
 from typing import TYPE_CHECKING
 
@@ -13,6 +14,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_FILES_CHANGED_RE = re.compile(r"(\d+) files? changed")
+
 
 class RetryHandlerMixin:
     """Mixin for git auto-commit at phase boundaries.
@@ -60,18 +63,18 @@ class RetryHandlerMixin:
             True if there are changes, False if clean, None on error.
         """
         try:
+            # Only emptiness matters: NUL-terminated records need no decoding
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "status", "--porcelain=v1", "-z"],
                 capture_output=True,
-                text=True,
                 cwd=self.project_root,
                 timeout=10,
                 check=False,
             )
             if result.returncode != 0:
-                logger.warning(f"Git status failed: {result.stderr}")
+                logger.warning(f"Git status failed: {result.stderr.decode(errors='replace')}")
                 return None
-            return bool(result.stdout.strip())
+            return bool(result.stdout)
         except FileNotFoundError:
             logger.warning("Git not found, skipping auto-commit")
             return None
@@ -80,14 +83,12 @@ class RetryHandlerMixin:
             return None
 
     def _execute_git_commit(self, phase: Phase, success: bool) -> None:
-        """Execute git add and commit for a phase.
+        """Commit tracked changes (and phase notes) for a phase.
 
         Args:
             phase: The phase that completed
             success: Whether the phase completed successfully
         """
-        import re
-
         # Format commit message using template
         status_icon = "✓" if success else "⚠️"
         message = self.config.commit_message_template.format(
@@ -102,23 +103,10 @@ class RetryHandlerMixin:
 
         full_message = f"{message}\n\n{co_author}"
 
-        # Stage changes and commit
-        # Use -u to only stage modified/deleted tracked files, avoiding random untracked files
-        # Then explicitly add known phase artifacts (notes, plan status updates)
+        # Commit with -a, which stages modified/deleted tracked files only (like
+        # `git add -u`) without a separate git process, avoiding random untracked
+        # files. Known phase artifacts (notes) are added explicitly first.
         try:
-            # Stage modified tracked files only
-            add_result = subprocess.run(
-                ["git", "add", "-u"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-                timeout=30,
-                check=False,
-            )
-            if add_result.returncode != 0:
-                logger.warning(f"Git add -u failed: {add_result.stderr}")
-                return
-
             # Explicitly add phase notes file if it exists
             notes_dir = self.master_plan_path.parent / "notes"
             if notes_dir.exists():
@@ -131,9 +119,9 @@ class RetryHandlerMixin:
                     check=False,
                 )
 
-            # Commit with message
+            # Commit tracked changes with message
             commit_result = subprocess.run(
-                ["git", "commit", "-m", full_message],
+                ["git", "commit", "-a", "-m", full_message],
                 capture_output=True,
                 text=True,
                 cwd=self.project_root,
@@ -152,7 +140,7 @@ class RetryHandlerMixin:
 
             # Count files changed from commit output
             files_changed = 0
-            match = re.search(r"(\d+) files? changed", commit_result.stdout)
+            match = _FILES_CHANGED_RE.search(commit_result.stdout)
             if match:
                 files_changed = int(match.group(1))
 
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 import uuid
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -87,12 +88,26 @@ CREATE TABLE IF NOT EXISTS completed_features (
 );
 """
 
+# Lookup indexes for the per-run queries issued by the orchestrator and workers
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_runs_status_started ON runs(status, started_at)",
+    "CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at)",
+    "CREATE INDEX IF NOT EXISTS idx_gate_results_execution ON gate_results(phase_execution_id)",
+    "CREATE INDEX IF NOT EXISTS idx_signals_run_phase ON completion_signals(run_id, phase_id, signaled_at)",
+    "CREATE INDEX IF NOT EXISTS idx_progress_run_phase ON progress_log(run_id, phase_id, logged_at)",
+)
+
 
 class StateManager:
     """Manages orchestration state in SQLite."""
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
+        # One connection per manager keeps SQLite's page cache warm between
+        # queries; the lock serializes transactions across threads and is
+        # re-entrant because some queries call get_run() mid-transaction.
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
         self._init_db()
 
     def _init_db(self) -> None:
@@ -100,27 +115,58 @@ class StateManager:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         with self._connection() as conn:
             conn.executescript(SCHEMA)
+            for index in INDEXES:
+                # Databases from older versions may lack an indexed column; the
+                # index is an optimization, so skip it rather than fail to open
+                with suppress(sqlite3.OperationalError):
+                    conn.execute(index)
+            # Refresh planner statistics for the indexes (cheap no-op when current)
+            conn.execute("PRAGMA optimize")
 
     @contextmanager
     def _connection(self) -> Generator[sqlite3.Connection]:
-        """Context manager for database connections.
+        """Context manager for a transaction on the shared connection.
+
+        Each block is committed on exit (or rolled back on error), so writes
+        are visible to other processes as soon as the block returns.
 
         Uses PRAGMA synchronous=FULL to ensure data is written to disk.
         This is critical for Docker volume mounts on Windows where grpcfuse
         may delay syncing writes to the host filesystem.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        # Force full sync mode for Docker volume mount compatibility
-        # Without this, writes inside Docker may not be visible on host immediately
-        conn.execute("PRAGMA synchronous=FULL")
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return the manager's connection, opening it on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            # Force full sync mode for Docker volume mount compatibility
+            # Without this, writes inside Docker may not be visible on host immediately
+            conn.execute("PRAGMA synchronous=FULL")
+            conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __del__(self) -> None:
+        # Managers dropped without close() must not leak an open connection
+        conn = getattr(self, "_conn", None)
+        if conn is not None:
             conn.close()
 
     # =========================================================================
@@ -436,13 +482,20 @@ class StateManager:
 
     def log_progress(self, run_id: str, phase_id: str, step: str) -> None:
         """Log a progress step."""
+        self.log_progress_many(run_id, phase_id, [step])
+
+    def log_progress_many(self, run_id: str, phase_id: str, steps: list[str]) -> None:
+        """Log several progress steps in a single transaction.
+
+        Each step is stamped as it is queued, as with separate log_progress calls.
+        """
         with self._connection() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO progress_log (run_id, phase_id, step, logged_at)
                 VALUES (?, ?, ?, ?)
                 """,
-                (run_id, phase_id, step, datetime.now().isoformat()),
+                [(run_id, phase_id, step, datetime.now().isoformat()) for step in steps],
             )
 
     def get_progress(self, run_id: str, phase_id: str) -> list[tuple[str, datetime]]:
@@ -8,6 +8,33 @@ from pathlib import Path
 
 from debussy.core.models import MasterPlan, Phase, PhaseStatus
 
+_NAME_RE = re.compile(r"^#\s+(.+?)(?:\s*-\s*Master Plan)?$", re.MULTILINE)
+
+# Match a table row: | 1 | [Title](path.md) | Focus | Risk | Status |
+# Phase IDs can be integers (1, 2, 3) or decimals (3.1, 3.2)
+_PHASE_ROW_RE = re.compile(
+    r"\|\s*(\d+(?:\.\d+)?)\s*\|"  # Phase number (int or decimal)
+    r"\s*\[([^\]]+)\]\(([^)]+)\)\s*\|"  # [Title](path.md)
+    r"\s*[^|]*\|"  # Focus (skip)
+    r"\s*[^|]*\|"  # Risk (skip)
+    r"\s*(\w+)\s*\|",  # Status
+)
+
+_GITHUB_ISSUES_RES = (
+    re.compile(r"\*\*(?:GitHub\s*Issues?|github_issues)\*\*:\s*(.+?)(?:\n|$)", re.IGNORECASE),  # **GitHub Issues:** ...
+    re.compile(r"(?:GitHub\s*Issues?|github_issues):\s*(.+?)(?:\n|$)", re.IGNORECASE),  # GitHub Issues: ...
+)
+
+_GITHUB_REPO_RES = (
+    re.compile(r"\*\*(?:GitHub\s*Repo|github_repo)\*\*:\s*([^\s\n]+)", re.IGNORECASE),  # **GitHub Repo:** ...
+    re.compile(r"(?:GitHub\s*Repo|github_repo):\s*([^\s\n]+)", re.IGNORECASE),  # GitHub Repo: ...
+)
+
+_JIRA_ISSUES_RES = (
+    re.compile(r"\*\*(?:Jira\s*Issues?|jira_issues)\*\*:\s*(.+?)(?:\n|$)", re.IGNORECASE),  # **Jira Issues:** ...
+    re.compile(r"(?:Jira\s*Issues?|jira_issues):\s*(.+?)(?:\n|$)", re.IGNORECASE),  # Jira Issues: ...
+)
+
 
 def parse_master_plan(master_path: Path) -> MasterPlan:
     """Parse a master plan markdown file.
@@ -30,7 +57,7 @@ def parse_master_plan(master_path: Path) -> MasterPlan:
     content = master_path.read_text(encoding="utf-8")
 
     # Extract name from first H1
-    name_match = re.search(r"^#\s+(.+?)(?:\s*-\s*Master Plan)?$", content, re.MULTILINE)
+    name_match = _NAME_RE.search(content)
     name = name_match.group(1).strip() if name_match else master_path.stem
 
     # Find the phases table
@@ -58,19 +85,17 @@ def _parse_phases_table(content: str, base_dir: Path) -> list[Phase]:
     """Parse the phases table from markdown content."""
     phases: list[Phase] = []
 
-    # Find table with Phase column
-    # Match table rows: | 1 | [Title](path.md) | Focus | Risk | Status |
-    # Phase IDs can be integers (1, 2, 3) or decimals (3.1, 3.2)
-    table_pattern = re.compile(
-        r"^\|\s*(\d+(?:\.\d+)?)\s*\|"  # Phase number (int or decimal)
-        r"\s*\[([^\]]+)\]\(([^)]+)\)\s*\|"  # [Title](path.md)
-        r"\s*[^|]*\|"  # Focus (skip)
-        r"\s*[^|]*\|"  # Risk (skip)
-        r"\s*(\w+)\s*\|",  # Status
-        re.MULTILINE,
-    )
-
-    for match in table_pattern.finditer(content):
+    # No table at all: skip the line scan
+    if "|" not in content:
+        return phases
+
+    # Only table lines can be rows; match each one anchored at its start
+    for line in content.splitlines():
+        if not line.startswith("|"):
+            continue
+        match = _PHASE_ROW_RE.match(line)
+        if match is None:
+            continue
         phase_num = match.group(1)
         title = match.group(2).strip()
         rel_path = match.group(3).strip()
@@ -127,14 +152,8 @@ def _parse_github_issues(content: str) -> str | None:
     Returns:
         Raw issues string if found, None otherwise.
     """
-    # Match various formats for GitHub issues
-    patterns = [
-        r"\*\*(?:GitHub\s*Issues?|github_issues)\*\*:\s*(.+?)(?:\n|$)",  # **GitHub Issues:** ...
-        r"(?:GitHub\s*Issues?|github_issues):\s*(.+?)(?:\n|$)",  # GitHub Issues: ...
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in _GITHUB_ISSUES_RES:
+        match = pattern.search(content)
         if match:
             return match.group(1).strip()
 
@@ -155,14 +174,8 @@ def _parse_github_repo(content: str) -> str | None:
     Returns:
         Repository string (owner/repo) if found, None otherwise.
     """
-    # Match various formats for GitHub repo
-    patterns = [
-        r"\*\*(?:GitHub\s*Repo|github_repo)\*\*:\s*([^\s\n]+)",  # **GitHub Repo:** ...
-        r"(?:GitHub\s*Repo|github_repo):\s*([^\s\n]+)",  # GitHub Repo: ...
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in _GITHUB_REPO_RES:
+        match = pattern.search(content)
         if match:
             repo = match.group(1).strip()
             # Validate it looks like owner/repo
@@ -186,14 +199,8 @@ def _parse_jira_issues(content: str) -> str | None:
     Returns:
         Raw issues string if found, None otherwise.
     """
-    # Match various formats for Jira issues
-    patterns = [
-        r"\*\*(?:Jira\s*Issues?|jira_issues)\*\*:\s*(.+?)(?:\n|$)",  # **Jira Issues:** ...
-        r"(?:Jira\s*Issues?|jira_issues):\s*(.+?)(?:\n|$)",  # Jira Issues: ...
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, content, re.IGNORECASE)
+    for pattern in _JIRA_ISSUES_RES:
+        match = pattern.search(content)
         if match:
             return match.group(1).strip()
 
@@ -7,8 +7,58 @@ from pathlib import Path
 
 from debussy.core.models import Gate, Phase, PhaseStatus, Task
 
+_TITLE_RE = re.compile(r"^#\s+.+Phase\s+\d+:\s+(.+)$", re.MULTILINE)
+_PHASE_ID_RE = re.compile(r"phase[_-]?(\d+)", re.IGNORECASE)
+_STATUS_RE = re.compile(r"\*\*Status:\*\*\s*(\w+)")
+
+_DEPENDS_ON_FIELD = "**Depends On:**"
+_PHASE_REF_RE = re.compile(r"Phase\s+(\d+(?:\.\d+)?)")
+_DEPENDENCIES_SECTION_RE = re.compile(r"## Dependencies\s*\n(.*?)(?=\n##|\Z)", re.DOTALL | re.IGNORECASE)
+# Only lines that explicitly declare a dependency, not casual mentions
+# like "used by Phase X" or "output for Phase X"
+_EXPLICIT_DEP_RES = tuple(
+    re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+    for pattern in (
+        r"Previous phase:\s*Phase\s+(\d+(?:\.\d+)?)",
+        r"Depends on:\s*Phase\s+(\d+(?:\.\d+)?)",
+        r"Requires:\s*Phase\s+(\d+(?:\.\d+)?)",
+        r"^[-*]\s*Phase\s+(\d+(?:\.\d+)?)",  # Bullet point starting with Phase
+    )
+)
+
+_GATES_SECTION_RE = re.compile(r"## Gates.*?\n(.*?)(?=\n##|\Z)", re.DOTALL | re.IGNORECASE)
+# Gate lines: "- gate_name: requirement" or "- **gate_name**: requirement"
+# Note: [\w-]+ allows hyphenated names like "backend-lint", "type-check"
+_GATE_LINE_RE = re.compile(r"^[-*]\s+\*{0,2}([\w-]+)\*{0,2}:\s*(.+)$", re.MULTILINE)
+
+_TASKS_SECTION_RE = re.compile(r"## Tasks\s*\n(.*?)(?=\n##|\Z)", re.DOTALL | re.IGNORECASE)
+# Task lines: "- [ ] 1.1: Description" or "- [x] 1.1: Description"
+_TASK_LINE_RE = re.compile(r"^[-*]\s+\[([ xX])\]\s+(\d+\.\d+):\s*(.+)$", re.MULTILINE)
+
+# **AGENT:agent-name** or AGENT:agent-name
+_AGENT_MARKER_RE = re.compile(r"\*{0,2}AGENT:(\S+)\*{0,2}", re.IGNORECASE)
+_AGENTS_TABLE_RE = re.compile(r"## Agents to Use.*?\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_REQUIRED_AGENT_ROW_RE = re.compile(r"\|\s*`?(\S+)`?\s*\|[^|]*REQUIRED")
+
+_WRAPPER_SECTION_RE = re.compile(r"## Process Wrapper.*?\n(.*?)(?=\n##|\Z)", re.DOTALL | re.IGNORECASE)
+# Common process wrapper steps to look for
+_STEP_RES = tuple(
+    (re.compile(pattern, re.IGNORECASE), step_name)
+    for pattern, step_name in (
+        (r"Read previous notes", "read_previous_notes"),
+        (r"doc-sync-manager|AGENT:doc-sync-manager", "doc_sync_manager"),
+        (r"\[IMPLEMENTATION\]", "implementation"),
+        (r"Pre-validation|pre-validation", "pre_validation"),
+        (r"task-validator|AGENT:task-validator", "task_validator"),
+        (r"Write.*notes|notes.*output", "write_notes"),
+    )
+)
+
+_NOTES_INPUT_RE = re.compile(r"Read previous notes:\s*`([^`]+)`")
+_NOTES_OUTPUT_RE = re.compile(r"(?:Write|notes to:?)\s*`([^`]+)`", re.IGNORECASE)
+
 
-def parse_phase(phase_path: Path, phase_id: str | None = None) -> Phase:
+def parse_phase(phase_path: Path, phase_id: str | None = None, content: str | None = None) -> Phase:
     """Parse a phase plan markdown file.
 
     Expected format with markers for required elements:
@@ -32,11 +82,14 @@ def parse_phase(phase_path: Path, phase_id: str | None = None) -> Phase:
     ### 1. Task Group
     - [ ] 1.1: Do something
     ```
+
+    If ``content`` is given it is parsed instead of reading ``phase_path``.
     """
-    content = phase_path.read_text(encoding="utf-8")
+    if content is None:
+        content = phase_path.read_text(encoding="utf-8")
 
     # Extract title from first H1
-    title_match = re.search(r"^#\s+.+Phase\s+\d+:\s+(.+)$", content, re.MULTILINE)
+    title_match = _TITLE_RE.search(content)
     title = title_match.group(1).strip() if title_match else phase_path.stem
 
     # Extract phase ID from filename if not provided
@@ -44,7 +97,7 @@ def parse_phase(phase_path: Path, phase_id: str | None = None) -> Phase:
     if phase_id is not None:
         resolved_phase_id = phase_id
     else:
-        id_match = re.search(r"phase[_-]?(\d+)", phase_path.stem, re.IGNORECASE)
+        id_match = _PHASE_ID_RE.search(phase_path.stem)
         resolved_phase_id = id_match.group(1) if id_match else "1"
 
     # Extract status
@@ -85,7 +138,7 @@ def parse_phase(phase_path: Path, phase_id: str | None = None) -> Phase:
 
 def _parse_status_field(content: str) -> PhaseStatus:
     """Extract status from **Status:** field."""
-    match = re.search(r"\*\*Status:\*\*\s*(\w+)", content)
+    match = _STATUS_RE.search(content)
     if match:
         status_str = match.group(1).lower()
         status_map = {
@@ -117,33 +170,23 @@ def _parse_dependencies(content: str) -> list[str]:
     # Look for "Depends On:" field in header (most reliable)
     # Matches: **Depends On:** Phase 1, Phase 2, Phase 3
     # Also handles: **Depends On:** Phase 1 (description), Phase 2 (description)
-    dep_header = re.search(r"\*\*Depends On:\*\*\s*(.+?)(?:\n|$)", content)
-    if dep_header:
-        dep_line = dep_header.group(1).strip()
+    # The field has a fixed shape, so plain string splitting finds it: the
+    # value is the first non-blank line after the marker
+    _, found, rest = content.partition(_DEPENDS_ON_FIELD)
+    if found:
+        dep_line = rest.lstrip().partition("\n")[0].strip()
         # Skip if explicitly no dependencies (N/A, None, etc.)
         if not dep_line.lower().startswith(("n/a", "none", "-", "no ")):
             # Find all Phase references in the Depends On line (may have multiple)
-            phase_refs = re.findall(r"Phase\s+(\d+(?:\.\d+)?)", dep_line)
+            phase_refs = _PHASE_REF_RE.findall(dep_line)
             deps.extend(phase_refs)
 
     # Check dependency section for explicit dependency declarations only
-    dep_section = re.search(r"## Dependencies\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
+    dep_section = _DEPENDENCIES_SECTION_RE.search(content)
     if dep_section:
         section_content = dep_section.group(1)
-        # Only match lines that explicitly declare a dependency:
-        # - Previous phase: Phase X
-        # - Depends on: Phase X
-        # - Requires: Phase X
-        # NOT casual mentions like "used by Phase X" or "output for Phase X"
-        explicit_dep_patterns = [
-            r"Previous phase:\s*Phase\s+(\d+(?:\.\d+)?)",
-            r"Depends on:\s*Phase\s+(\d+(?:\.\d+)?)",
-            r"Requires:\s*Phase\s+(\d+(?:\.\d+)?)",
-            r"^[-*]\s*Phase\s+(\d+(?:\.\d+)?)",  # Bullet point starting with Phase
-        ]
-        for pattern in explicit_dep_patterns:
-            matches = re.findall(pattern, section_content, re.MULTILINE | re.IGNORECASE)
-            deps.extend(matches)
+        for pattern in _EXPLICIT_DEP_RES:
+            deps.extend(pattern.findall(section_content))
 
     return list(set(deps))  # Deduplicate
 
@@ -153,16 +196,13 @@ def _parse_gates(content: str) -> list[Gate]:
     gates: list[Gate] = []
 
     # Find Gates section
-    gates_section = re.search(r"## Gates.*?\n(.*?)(?=\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
+    gates_section = _GATES_SECTION_RE.search(content)
     if not gates_section:
         return gates
 
     section_content = gates_section.group(1)
 
-    # Parse gate lines: "- gate_name: requirement" or "- **gate_name**: requirement"
-    # Note: [\w-]+ allows hyphenated names like "backend-lint", "type-check"
-    gate_pattern = re.compile(r"^[-*]\s+\*{0,2}([\w-]+)\*{0,2}:\s*(.+)$", re.MULTILINE)
-    for match in gate_pattern.finditer(section_content):
+    for match in _GATE_LINE_RE.finditer(section_content):
         name = match.group(1).strip()
         requirement = match.group(2).strip()
 
@@ -199,15 +239,13 @@ def _parse_tasks(content: str) -> list[Task]:
     tasks: list[Task] = []
 
     # Find Tasks section
-    tasks_section = re.search(r"## Tasks\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
+    tasks_section = _TASKS_SECTION_RE.search(content)
     if not tasks_section:
         return tasks
 
     section_content = tasks_section.group(1)
 
-    # Parse task lines: "- [ ] 1.1: Description" or "- [x] 1.1: Description"
-    task_pattern = re.compile(r"^[-*]\s+\[([ xX])\]\s+(\d+\.\d+):\s*(.+)$", re.MULTILINE)
-    for match in task_pattern.finditer(section_content):
+    for match in _TASK_LINE_RE.finditer(section_content):
         completed = match.group(1).lower() == "x"
         task_id = match.group(2)
         description = match.group(3).strip()
@@ -222,18 +260,16 @@ def _parse_required_agents(content: str) -> list[str]:
     agents: list[str] = []
 
     # Look for AGENT: markers in process wrapper
-    # Pattern: **AGENT:agent-name** or AGENT:agent-name
-    agent_pattern = re.compile(r"\*{0,2}AGENT:(\S+)\*{0,2}", re.IGNORECASE)
-    for match in agent_pattern.finditer(content):
+    for match in _AGENT_MARKER_RE.finditer(content):
         agent_name = match.group(1).strip("*").strip()
         if agent_name not in agents:
             agents.append(agent_name)
 
     # Also look in "Agents to Use" table for REQUIRED agents
-    agents_table = re.search(r"## Agents to Use.*?\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
+    agents_table = _AGENTS_TABLE_RE.search(content) if "## Agents to Use" in content else None
     if agents_table:
         # Find rows with REQUIRED
-        required_rows = re.findall(r"\|\s*`?(\S+)`?\s*\|[^|]*REQUIRED", agents_table.group(1))
+        required_rows = _REQUIRED_AGENT_ROW_RE.findall(agents_table.group(1))
         for agent in required_rows:
             if agent not in agents:
                 agents.append(agent)
@@ -246,24 +282,14 @@ def _parse_required_steps(content: str) -> list[str]:
     steps: list[str] = []
 
     # Find Process Wrapper section
-    wrapper_section = re.search(r"## Process Wrapper.*?\n(.*?)(?=\n##|\Z)", content, re.DOTALL | re.IGNORECASE)
+    wrapper_section = _WRAPPER_SECTION_RE.search(content)
     if not wrapper_section:
         return steps
 
     section_content = wrapper_section.group(1)
 
-    # Common steps to look for
-    step_patterns = [
-        (r"Read previous notes", "read_previous_notes"),
-        (r"doc-sync-manager|AGENT:doc-sync-manager", "doc_sync_manager"),
-        (r"\[IMPLEMENTATION\]", "implementation"),
-        (r"Pre-validation|pre-validation", "pre_validation"),
-        (r"task-validator|AGENT:task-validator", "task_validator"),
-        (r"Write.*notes|notes.*output", "write_notes"),
-    ]
-
-    for pattern, step_name in step_patterns:
-        if re.search(pattern, section_content, re.IGNORECASE):
+    for pattern, step_name in _STEP_RES:
+        if pattern.search(section_content):
             steps.append(step_name)
 
     return steps
@@ -274,15 +300,19 @@ def _parse_notes_paths(content: str) -> tuple[Path | None, Path | None]:
     notes_input = None
     notes_output = None
 
+    # Both paths are backtick-quoted: skip the scans when there are none
+    if "`" not in content:
+        return notes_input, notes_output
+
     # Look for notes input: "Read previous notes: `path`"
-    input_match = re.search(r"Read previous notes:\s*`([^`]+)`", content)
+    input_match = _NOTES_INPUT_RE.search(content)
     if input_match:
         path_str = input_match.group(1)
         if path_str.lower() not in ("n/a", "none", "n/a (first phase)"):
             notes_input = Path(path_str)
 
     # Look for notes output: "Write `path`" or "notes to: `path`"
-    output_match = re.search(r"(?:Write|notes to:?)\s*`([^`]+)`", content, re.IGNORECASE)
+    output_match = _NOTES_OUTPUT_RE.search(content)
     if output_match:
         notes_output = Path(output_match.group(1))
 
@@ -15,11 +15,13 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from rich.console import Console
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
     from debussy.core.audit import AuditResult
     from debussy.planners.analyzer import AnalysisReport
     from debussy.planners.models import IssueSet
@@ -382,6 +384,8 @@ def _fetch_phase(
     labels: list[str] | None,
     console: Console,
     verbose: bool,
+    *,
+    runner: Callable[[Coroutine[Any, Any, IssueSet]], IssueSet] = asyncio.run,
 ) -> IssueSet:
     """Execute the fetch phase.
 
@@ -391,6 +395,7 @@ def _fetch_phase(
         labels: Filter by label names.
         console: Rich console for output.
         verbose: Enable verbose output.
+        runner: Runs the fetch coroutine to completion. Defaults to asyncio.run.
 
     Returns:
         IssueSet containing fetched issues.
@@ -405,12 +410,12 @@ def _fetch_phase(
 
     # Run async fetch in sync context
     if milestone:
-        issues = asyncio.run(fetch_issues_by_milestone(repo, milestone))
+        issues = runner(fetch_issues_by_milestone(repo, milestone))
     elif labels:
-        issues = asyncio.run(fetch_issues_by_labels(repo, labels))
+        issues = runner(fetch_issues_by_labels(repo, labels))
     else:
         # Fetch all open issues
-        issues = asyncio.run(fetch_issues_by_labels(repo, []))
+        issues = runner(fetch_issues_by_labels(repo, []))
 
     return issues
 
@@ -617,6 +622,9 @@ def _audit_loop(
     max_retries: int,
     console: Console,
     verbose: bool,
+    *,
+    audit: Callable[[Path], AuditResult] | None = None,
+    regenerate: Callable[[Path, list[str], Console, bool], None] | None = None,
 ) -> tuple[bool, int]:
     """Execute the audit loop with retries.
 
@@ -625,10 +633,15 @@ def _audit_loop(
         max_retries: Maximum retry attempts.
         console: Rich console for output.
         verbose: Enable verbose output.
+        audit: Audits the master plan. Defaults to _run_audit.
+        regenerate: Regenerates plans from audit errors. Defaults to
+            _regenerate_with_errors.
 
     Returns:
         Tuple of (passed, attempts).
     """
+    audit = audit or _run_audit
+    regenerate = regenerate or _regenerate_with_errors
     master_plan_path = output_dir / "MASTER_PLAN.md"
 
     for attempt in range(1, max_retries + 1):
@@ -636,7 +649,7 @@ def _audit_loop(
             console.print(f"  [dim]Audit attempt {attempt}/{max_retries}...[/dim]")
 
         # Run audit
-        audit_result = _run_audit(master_plan_path)
+        audit_result = audit(master_plan_path)
 
         if audit_result.passed:
             return True, attempt
@@ -655,7 +668,7 @@ def _audit_loop(
 
         # Regenerate with error feedback
         console.print(f"  [yellow]Attempt {attempt} failed, regenerating...[/yellow]")
-        _regenerate_with_errors(output_dir, errors, console, verbose)
+        regenerate(output_dir, errors, console, verbose)
 
     return False, max_retries
 
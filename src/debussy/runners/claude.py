@@ -9,12 +9,13 @@ import os
 import signal
 import subprocess
 import sys
+import tempfile
 import time
 from collections.abc import Callable
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, TextIO
+from typing import IO, TYPE_CHECKING, Literal, TextIO
 
 from debussy.core.models import ComplianceIssue, ExecutionResult, Phase
 from debussy.runners.docker_builder import DockerCommandBuilder
@@ -35,6 +36,22 @@ logger = logging.getLogger(__name__)
 # Docker sandbox image name
 SANDBOX_IMAGE = "debussy-sandbox:latest"
 
+# Terminal output is flushed once this many characters are buffered, or when
+# this many seconds have passed since the last flush (newlines always flush)
+_STDOUT_FLUSH_BYTES = 4096
+_STDOUT_FLUSH_INTERVAL = 0.05
+
+# Seconds a Claude process tree gets to exit after SIGTERM before SIGKILL
+_KILL_GRACE_PERIOD = 2.0
+
+# Upper bound on waiting for a killed Claude process to be reaped. Process.wait()
+# only returns once the stdout/stderr pipes close, which a grandchild that
+# escaped the process group can hold open indefinitely.
+_KILL_WAIT_TIMEOUT = 5.0
+
+# Raw stream-json output stays in memory up to this size, then spills to disk
+_SESSION_LOG_SPOOL_BYTES = 1024 * 1024
+
 
 def _is_sandbox_image_available() -> bool:
     """Check if the debussy-sandbox Docker image is built."""
@@ -253,6 +270,7 @@ class ClaudeRunner(StreamingMixin):
         self.log_dir = log_dir or (project_root / ".debussy" / "logs")
         self._current_log_file: TextIO | None = None
         self._current_jsonl_file: TextIO | None = None  # Raw JSONL stream for debugging
+        self._current_jsonl_path: Path | None = None
         self._output_callback = output_callback
         self._token_stats_callback = token_stats_callback
         self._agent_change_callback = agent_change_callback
@@ -277,6 +295,10 @@ class ClaudeRunner(StreamingMixin):
         self._tool_use_callback: Callable[[dict], None] | None = None
         # Graceful stop flag for context restart
         self._should_stop: bool = False
+        # Terminal output coalesced by _emit_stdout() (see _STDOUT_FLUSH_*)
+        self._stdout_buffer: list[str] = []
+        self._stdout_buffered: int = 0
+        self._last_stdout_flush: float = 0.0
 
     def _create_parser(self) -> JsonStreamParser:
         """Create a configured stream parser for the current session."""
@@ -443,8 +465,7 @@ class ClaudeRunner(StreamingMixin):
             self._output_callback(text)
         elif self.output_mode in ("terminal", "both"):
             # Only write to stdout if no callback (non-interactive or YOLO mode)
-            sys.stdout.write(output)
-            sys.stdout.flush()
+            self._emit_stdout(output)
 
         if self.output_mode in ("file", "both") and self._current_log_file:
             self._current_log_file.write(output)
@@ -455,6 +476,27 @@ class ClaudeRunner(StreamingMixin):
             self._sandbox_log_file.write(output)
             self._sandbox_log_file.flush()
 
+    def _emit_stdout(self, output: str) -> None:
+        """Buffer terminal output, flushing on newline, size or elapsed time.
+
+        Streaming text deltas arrive as many tiny writes; coalescing them
+        avoids a write()+flush() syscall pair per delta.
+        """
+        self._stdout_buffer.append(output)
+        self._stdout_buffered += len(output)
+        if output.endswith("\n") or self._stdout_buffered >= _STDOUT_FLUSH_BYTES or time.monotonic() - self._last_stdout_flush >= _STDOUT_FLUSH_INTERVAL:
+            self._flush_stdout()
+
+    def _flush_stdout(self) -> None:
+        """Write any buffered terminal output."""
+        if not self._stdout_buffer:
+            return
+        sys.stdout.write("".join(self._stdout_buffer))
+        sys.stdout.flush()
+        self._stdout_buffer.clear()
+        self._stdout_buffered = 0
+        self._last_stdout_flush = time.monotonic()
+
     def _open_log_file(self, run_id: str, phase_id: str) -> None:
         """Open log files for the current phase.
 
@@ -496,6 +538,7 @@ class ClaudeRunner(StreamingMixin):
             jsonl_path = self.log_dir / f"run_{run_id}_phase_{phase_id}.jsonl"
             jsonl_mode = "a" if jsonl_path.exists() else "w"
             self._current_jsonl_file = jsonl_path.open(jsonl_mode, encoding="utf-8")
+            self._current_jsonl_path = jsonl_path
 
     def _write_completion_banner(self, success: bool, duration: float | None = None) -> None:
         """Write phase completion banner to log file."""
@@ -629,7 +672,7 @@ class ClaudeRunner(StreamingMixin):
 
                 # Give it time to exit gracefully
                 try:
-                    await asyncio.wait_for(process.wait(), timeout=2.0)
+                    await asyncio.wait_for(process.wait(), timeout=_KILL_GRACE_PERIOD)
                 except TimeoutError:
                     # Force kill if still alive
                     with suppress(ProcessLookupError, OSError):
@@ -641,9 +684,13 @@ class ClaudeRunner(StreamingMixin):
             # Process already dead or inaccessible
             pass
 
-        # Final wait to ensure cleanup
-        with suppress(Exception):
-            await process.wait()
+        # Final wait to ensure cleanup, bounded so a leaked pipe can't hang us
+        try:
+            await asyncio.wait_for(process.wait(), timeout=_KILL_WAIT_TIMEOUT)
+        except TimeoutError:
+            logger.warning(f"PID {pid} still not reaped {_KILL_WAIT_TIMEOUT:.0f}s after kill; continuing without waiting")
+        except Exception as e:
+            logger.debug(f"Error waiting for PID {pid} after kill: {e}")
 
     async def execute_phase(
         self,
@@ -676,6 +723,7 @@ class ClaudeRunner(StreamingMixin):
             self._context_estimator.add_prompt(prompt)
 
         # Open log file if using file output
+        self._current_jsonl_path = None
         if run_id:
             self._open_log_file(run_id, phase.id)
 
@@ -684,6 +732,9 @@ class ClaudeRunner(StreamingMixin):
 
         start_time = time.time()
         process: asyncio.subprocess.Process | None = None
+        raw_output = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+            max_size=_SESSION_LOG_SPOOL_BYTES, mode="w+", encoding="utf-8"
+        )
         try:
             cmd = self._build_claude_command(prompt)
             logger.debug(f"Running command: {' '.join(cmd[:10])}...")
@@ -697,7 +748,6 @@ class ClaudeRunner(StreamingMixin):
             pid_registry.register(process.pid)
             logger.debug(f"Started Claude process with PID {process.pid}")
 
-            raw_output: list[str] = []
             stderr_lines: list[str] = []
             was_stopped = False
 
@@ -725,9 +775,7 @@ class ClaudeRunner(StreamingMixin):
                     self._close_sandbox_log()
                     self._display_sandbox_log()
 
-                    session_log = "".join(raw_output)
-                    if stderr_lines:
-                        session_log += f"\n\nSTDERR:\n{''.join(stderr_lines)}"
+                    session_log = self._read_session_log(raw_output, stderr_lines)
 
                     # Use special marker for context limit restart
                     self._close_log_file(success=False)
@@ -737,6 +785,7 @@ class ClaudeRunner(StreamingMixin):
                         exit_code=-2,  # Special exit code for context restart
                         duration_seconds=time.time() - start_time,
                         pid=process.pid,
+                        session_log_path=self._current_jsonl_path,
                     )
 
                 await process.wait()
@@ -752,6 +801,7 @@ class ClaudeRunner(StreamingMixin):
                     exit_code=-1,
                     duration_seconds=time.time() - start_time,
                     pid=process.pid,
+                    session_log_path=self._current_jsonl_path,
                 )
             except asyncio.CancelledError:
                 # User cancelled (e.g., quit from TUI) - kill subprocess and re-raise
@@ -766,9 +816,7 @@ class ClaudeRunner(StreamingMixin):
             pid_registry.unregister(process.pid)
 
             # Use raw JSON output for session log (compliance checker can parse it)
-            session_log = "".join(raw_output)
-            if stderr_lines:
-                session_log += f"\n\nSTDERR:\n{''.join(stderr_lines)}"
+            session_log = self._read_session_log(raw_output, stderr_lines)
 
             if self.stream_output:
                 self._write_output("\n")  # Newline after streaming output
@@ -785,6 +833,7 @@ class ClaudeRunner(StreamingMixin):
                 exit_code=process.returncode or 0,
                 duration_seconds=time.time() - start_time,
                 pid=process.pid,
+                session_log_path=self._current_jsonl_path,
             )
 
         except FileNotFoundError:
@@ -810,6 +859,27 @@ class ClaudeRunner(StreamingMixin):
                 duration_seconds=time.time() - start_time,
                 pid=process.pid if process else None,
             )
+        finally:
+            raw_output.close()
+            # Don't leave a partial line sitting in the terminal buffer
+            self._flush_stdout()
+
+    @staticmethod
+    def _read_session_log(raw_output: IO[str], stderr_lines: list[str]) -> str:
+        """Build the session log from the spooled stream-json output.
+
+        Args:
+            raw_output: Spool the stream reader wrote raw JSON lines to
+            stderr_lines: Captured stderr lines
+
+        Returns:
+            Raw JSON output, followed by any stderr output
+        """
+        raw_output.seek(0)
+        session_log = raw_output.read()
+        if stderr_lines:
+            session_log += f"\n\nSTDERR:\n{''.join(stderr_lines)}"
+        return session_log
 
     def _build_phase_prompt(self, phase: Phase, with_anima: bool = False) -> str:
         """Build the prompt for a phase execution.
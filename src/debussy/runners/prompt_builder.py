@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,52 +15,31 @@ def _to_posix(p: Path | None) -> str:
     return str(p).replace("\\", "/") if p else ""
 
 
-def build_phase_prompt(phase: Phase, with_anima: bool = False) -> str:
-    """Build the prompt for a phase execution.
-
-    Args:
-        phase: The phase to build a prompt for.
-        with_anima: Whether to include Anima (long-term memory) recall/save steps.
-
-    Returns:
-        The fully-formatted prompt string.
-    """
-    notes_context = ""
-    if phase.notes_input and phase.notes_input.exists():
-        notes_input_str = _to_posix(phase.notes_input)
-        notes_context = f"""
+# Phase prompt sections. Only the values change between phases, so the text is
+# kept here once and filled in with str.format().
+_NOTES_INPUT_SECTION = """
 ## Previous Phase Notes
-Use the Read tool to read context from the previous phase: {notes_input_str}
+Use the Read tool to read context from the previous phase: {notes_input}
 """
 
-    required_agents = ""
-    if phase.required_agents:
-        agents_list = ", ".join(phase.required_agents)
-        required_agents = f"""
+_REQUIRED_AGENTS_SECTION = """
 ## Required Agents
 You MUST invoke these agents using the Task tool: {agents_list}
 """
 
-    notes_output = ""
-    if phase.notes_output:
-        notes_output_str = _to_posix(phase.notes_output)
-        notes_output = f"""
+_NOTES_OUTPUT_SECTION = """
 ## Notes Output
-Use the Write tool to write notes to: {notes_output_str}
+Use the Write tool to write notes to: {notes_output}
 """
 
-    # Anima context recall for non-first phases
-    ltm_recall = ""
-    if with_anima and phase.notes_input:
-        ltm_recall = f"""
+# Anima context recall for non-first phases
+_LTM_RECALL_SECTION = """
 ## Recall Previous Learnings
-Run `/recall phase:{phase.id}` to retrieve learnings from previous runs of this phase.
+Run `/recall phase:{phase_id}` to retrieve learnings from previous runs of this phase.
 """
 
-    # Anima learnings section - ADD to Process Wrapper steps
-    ltm_learnings = ""
-    if with_anima:
-        ltm_learnings = f"""
+# Anima learnings section - ADD to Process Wrapper steps
+_LTM_LEARNINGS_SECTION = """
 ## ADDITIONAL Process Wrapper Step (Anima Enabled)
 **IMPORTANT**: Add this step to the Process Wrapper BEFORE signaling completion:
 
@@ -71,45 +51,41 @@ Run `/recall phase:{phase.id}` to retrieve learnings from previous runs of this
 
 - [ ] **Save each learning** using `/remember`:
   ```
-  /remember --priority MEDIUM --tags phase:{phase.id},agent:Debussy "learning content"
+  /remember --priority MEDIUM --tags phase:{phase_id},agent:Debussy "learning content"
   ```
 
 This step is MANDATORY when Anima is enabled. Do not skip it.
 """
 
-    # Build completion steps - vary based on Anima
-    if with_anima:
-        completion_steps = f"""
+_COMPLETION_WITH_ANIMA = """
 ## Completion
 
 When the phase is complete (all tasks done, all gates passing):
 1. Write notes to the specified output path (include `## Learnings` section!)
 2. Call `/remember` for each learning you documented
-3. Signal completion: `/debussy-done {phase.id}`
+3. Signal completion: `/debussy-done {phase_id}`
 
 **Do NOT signal completion until you have saved your learnings with /remember.**
 
 Fallback (if slash commands unavailable):
-- `uv run debussy done --phase {phase.id} --status completed`
+- `uv run debussy-worker done --phase {phase_id} --status completed`
 """
-    else:
-        completion_steps = f"""
+
+_COMPLETION = """
 ## Completion
 
 When the phase is complete (all tasks done, all gates passing):
 1. Write notes to the specified output path
-2. Signal completion: `/debussy-done {phase.id}`
+2. Signal completion: `/debussy-done {phase_id}`
 
 If you encounter a blocker:
-- `/debussy-done {phase.id} blocked "reason for blocker"`
+- `/debussy-done {phase_id} blocked "reason for blocker"`
 
 Fallback (if slash commands unavailable):
-- `uv run debussy done --phase {phase.id} --status completed`
+- `uv run debussy-worker done --phase {phase_id} --status completed`
 """
 
-    phase_path_str = _to_posix(phase.path)
-
-    return f"""Execute the implementation phase defined in the file: {phase_path_str}
+_PHASE_PROMPT = """Execute the implementation phase defined in the file: {phase_path}
 
 **IMPORTANT: Use the Read tool to read this file path. Do NOT try to execute paths as commands.**
 
@@ -129,6 +105,52 @@ Read the phase plan file and follow the Process Wrapper EXACTLY.
 """
 
 
+def build_phase_prompt(phase: Phase, with_anima: bool = False) -> str:
+    """Build the prompt for a phase execution.
+
+    Args:
+        phase: The phase to build a prompt for.
+        with_anima: Whether to include Anima (long-term memory) recall/save steps.
+
+    Returns:
+        The fully-formatted prompt string.
+    """
+    # Resolve the filesystem check here so the cached render only sees plain values
+    notes_input = _to_posix(phase.notes_input) if phase.notes_input and phase.notes_input.exists() else None
+    return _render_phase_prompt(
+        phase.id,
+        _to_posix(phase.path),
+        notes_input,
+        tuple(phase.required_agents),
+        _to_posix(phase.notes_output) if phase.notes_output else None,
+        recall=with_anima and phase.notes_input is not None,
+        with_anima=with_anima,
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_phase_prompt(
+    phase_id: str,
+    phase_path: str,
+    notes_input: str | None,
+    required_agents: tuple[str, ...],
+    notes_output: str | None,
+    *,
+    recall: bool,
+    with_anima: bool,
+) -> str:
+    """Fill the phase prompt templates; remediation restarts hit the cache."""
+    return _PHASE_PROMPT.format(
+        phase_path=phase_path,
+        notes_context=_NOTES_INPUT_SECTION.format(notes_input=notes_input) if notes_input else "",
+        ltm_recall=_LTM_RECALL_SECTION.format(phase_id=phase_id) if recall else "",
+        required_agents=_REQUIRED_AGENTS_SECTION.format(agents_list=", ".join(required_agents)) if required_agents else "",
+        notes_output=_NOTES_OUTPUT_SECTION.format(notes_output=notes_output) if notes_output else "",
+        ltm_learnings=_LTM_LEARNINGS_SECTION.format(phase_id=phase_id) if with_anima else "",
+        completion_steps=(_COMPLETION_WITH_ANIMA if with_anima else _COMPLETION).format(phase_id=phase_id),
+    )
+
+
 def build_remediation_prompt(phase: Phase, issues: list[ComplianceIssue], with_anima: bool = False) -> str:
     """Build a remediation prompt for a failed compliance check.
 
@@ -197,7 +219,7 @@ Use the Read tool to read: {phase_path_str}
 ## When Complete
 Use the Skill tool to signal completion: /debussy-done {phase.id}
 
-Fallback: `uv run debussy done --phase {phase.id} --status completed`
+Fallback: `uv run debussy-worker done --phase {phase.id} --status completed`
 
 IMPORTANT: This is a remediation session. Follow the template EXACTLY.
 All required agents MUST be invoked via the Task tool - do not do their work yourself."""
@@ -2,14 +2,45 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TextIO
 
+# orjson is an optional speedup (``pip install claude-debussy[orjson]``); its
+# JSONDecodeError subclasses the stdlib one, so callers handle both the same way
+try:
+    from orjson import JSONDecodeError, loads  # pyright: ignore[reportMissingImports]  # ty: ignore[unresolved-import]
+except ImportError:
+    from json import JSONDecodeError, loads
+
 logger = logging.getLogger(__name__)
 
+# Event types _handle_event() acts on; everything else (system, message_start,
+# content_block_start/stop, ...) is dropped without being parsed
+_HANDLED_EVENT_TYPES = frozenset({"assistant", "content_block_delta", "user", "result"})
+_TYPE_KEY_PREFIX = '{"type":'
+
+
+def _peek_event_type(line: str) -> str | None:
+    """Read the event type from a line whose first key is "type", without parsing it.
+
+    Returns:
+        The event type, or None if the line does not start with a "type" key
+        (the caller then falls back to a full JSON parse).
+    """
+    if not line.startswith(_TYPE_KEY_PREFIX):
+        return None
+    start = len(_TYPE_KEY_PREFIX)
+    if line[start : start + 1] == " ":
+        start += 1
+    if line[start : start + 1] != '"':
+        return None
+    end = line.find('"', start + 1)
+    if end < 0:
+        return None
+    return line[start + 1 : end]
+
 
 @dataclass
 class StreamParserCallbacks:
@@ -57,6 +88,13 @@ class JsonStreamParser:
         self._pending_task_ids: dict[str, str] = {}  # tool_use_id -> agent_type
         self._needs_line_prefix = True
         self._full_text: list[str] = []
+        # Event type -> handler, resolved once instead of an if/elif chain per event
+        self._event_handlers: dict[str, Callable[[dict], str | None]] = {
+            "assistant": self._handle_assistant_event,
+            "content_block_delta": self._handle_content_block_delta,
+            "user": self._handle_user_event,
+            "result": self._handle_result_event,
+        }
 
     @property
     def current_agent(self) -> str:
@@ -81,47 +119,39 @@ class JsonStreamParser:
         if not line:
             return None
 
-        # Write raw JSONL to file for debugging (captures everything)
-        if self._jsonl_file:
-            self._jsonl_file.write(line + "\n")
-            self._jsonl_file.flush()
+        self.record_line(line)
+
+        # Skip events we never display before paying for a full JSON parse
+        event_type = _peek_event_type(line)
+        if event_type is not None and event_type not in _HANDLED_EVENT_TYPES:
+            return None
 
         try:
-            event = json.loads(line)
+            event = loads(line)
             return self._handle_event(event)
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             # Not JSON, just return as-is
             if self._stream_output and self._callbacks.on_text:
                 self._callbacks.on_text(line, True)
             self._full_text.append(line)
             return line
 
+    def record_line(self, line: str) -> None:
+        """Write a raw stream line to the JSONL debug file, if one is open."""
+        if self._jsonl_file:
+            self._jsonl_file.write(line + "\n")
+            self._jsonl_file.flush()
+
     def _handle_event(self, event: dict) -> str | None:
         """Handle a parsed JSON event.
 
         Returns:
             Text content if this event contained assistant text, None otherwise.
         """
-        event_type = event.get("type", "")
-        text_result: str | None = None
-
-        # Handle assistant text output
-        if event_type == "assistant":
-            text_result = self._handle_assistant_event(event)
-
-        # Handle content block deltas (streaming chunks)
-        elif event_type == "content_block_delta":
-            text_result = self._handle_content_block_delta(event)
-
-        # Handle tool results from user messages
-        elif event_type == "user":
-            self._handle_user_event(event)
-
-        # Handle result event (final) - extract token stats
-        elif event_type == "result":
-            self._handle_result_event(event)
-
-        return text_result
+        handler = self._event_handlers.get(event.get("type", ""))
+        if handler is None:
+            return None
+        return handler(event)
 
     def _handle_assistant_event(self, event: dict) -> str | None:
         """Handle assistant message events.
@@ -252,7 +282,7 @@ class JsonStreamParser:
     def _display_file_tool(self, tool_name: str, tool_input: dict) -> None:
         """Display Read/Write/Edit tool use."""
         file_path = tool_input.get("file_path", "")
-        filename = file_path.split("/")[-1].split("\\")[-1] if file_path else "?"
+        filename = file_path.rpartition("/")[2].rpartition("\\")[2] if file_path else "?"
         self._emit_text(f"[{tool_name}: {filename}]\n")
 
     def _display_bash_tool(self, tool_input: dict) -> None:
@@ -11,9 +11,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import IO
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per read from the Claude stdout pipe; every complete line
+# in a chunk is handled before the reader awaits again
+_STREAM_READ_SIZE = 64 * 1024
+
 
 class StreamingMixin:
     """Mixin providing stream-reading and event-display methods.
@@ -42,10 +47,15 @@ class StreamingMixin:
     async def _stream_json_reader(
         self,
         stream: asyncio.StreamReader,
-        output_list: list[str],
+        output: IO[str],
     ) -> tuple[str, bool]:
         """Read JSON stream and display content in real-time.
 
+        The pipe is read in chunks and every complete line in a chunk is
+        handled before awaiting again, instead of one await per line. Each raw
+        line is written to ``output`` so the session log never has to be held
+        as a list of lines and joined afterwards.
+
         Returns:
             Tuple of (full_text_content, was_stopped)
             - full_text_content: The session log text
@@ -54,29 +64,60 @@ class StreamingMixin:
         # Create parser for this session
         self._parser = self._create_parser()  # type: ignore[attr-defined]
         was_stopped = False
+        pending = bytearray()
+        # Without terminal output or token stats nothing consumes parsed
+        # events, so lines are only recorded and never decoded as JSON.
+        parse_events = self.stream_output or self._token_stats_callback is not None  # type: ignore[attr-defined]
 
-        while True:
+        while not was_stopped:
             # Check for graceful stop request
             if self._should_stop:  # type: ignore[attr-defined]
                 logger.info("Graceful stop: terminating stream read")
                 was_stopped = True
                 break
 
-            line = await stream.readline()
-            if not line:
+            chunk = await stream.read(_STREAM_READ_SIZE)
+            if not chunk:
+                # EOF - the last line may not be newline-terminated
+                if pending:
+                    self._handle_stream_line(bytes(pending), output, parse=parse_events)
                 break
 
-            decoded = line.decode("utf-8", errors="replace").strip()
-            output_list.append(decoded + "\n")
-
-            if not decoded:
+            pending += chunk
+            end = pending.rfind(b"\n")
+            if end < 0:
                 continue
+            lines = bytes(pending[:end]).split(b"\n")
+            del pending[: end + 1]
 
-            # Parser handles JSON parsing and emits callbacks
-            self._parser.parse_line(decoded)  # type: ignore[union-attr]
+            for line in lines:
+                # A parsed event may have requested a stop (context limit)
+                if self._should_stop:  # type: ignore[attr-defined]
+                    logger.info("Graceful stop: terminating stream read")
+                    was_stopped = True
+                    break
+                self._handle_stream_line(line, output, parse=parse_events)
+
+            # Don't hold a partial delta back while Claude is quiet (thinking, long tools)
+            self._flush_stdout()  # type: ignore[attr-defined]
 
         return self._parser.get_full_text(), was_stopped  # type: ignore[union-attr]
 
+    def _handle_stream_line(self, line: bytes, output: IO[str], *, parse: bool = True) -> None:
+        """Record one raw stdout line and, if ``parse``, hand it to the parser."""
+        decoded = line.decode("utf-8", errors="replace").strip()
+        output.write(decoded + "\n")
+
+        if not decoded:
+            return
+
+        if not parse:
+            self._parser.record_line(decoded)  # type: ignore[union-attr]
+            return
+
+        # Parser handles JSON parsing and emits callbacks
+        self._parser.parse_line(decoded)  # type: ignore[union-attr]
+
     async def _stream_stderr(
         self,
         stream: asyncio.StreamReader,
@@ -219,7 +260,7 @@ class StreamingMixin:
     def _display_file_tool(self, tool_name: str, tool_input: dict) -> None:
         """Display Read/Write/Edit tool use."""
         file_path = tool_input.get("file_path", "")
-        filename = file_path.split("/")[-1].split("\\")[-1] if file_path else "?"
+        filename = file_path.rpartition("/")[2].rpartition("\\")[2] if file_path else "?"
         self._write_output(f"[{tool_name}: {filename}]\n")  # type: ignore[attr-defined]
 
     def _display_bash_tool(self, tool_input: dict) -> None:
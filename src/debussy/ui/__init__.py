@@ -1,9 +1,25 @@
-"""Interactive UI components."""
+"""Interactive UI components.
+
+OrchestrationController and TextualUI are loaded on first access so that
+non-interactive code paths do not pay for importing Textual.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from debussy.ui.base import OrchestratorUI, UIContext, UIState, UserAction
-from debussy.ui.controller import OrchestrationController
 from debussy.ui.interactive import NonInteractiveUI
-from debussy.ui.tui import TextualUI
+
+if TYPE_CHECKING:
+    from debussy.ui.controller import OrchestrationController
+    from debussy.ui.tui import TextualUI
+
+# Textual-backed exports, imported lazily by __getattr__ (PEP 562)
+_LAZY_EXPORTS = {
+    "OrchestrationController": "debussy.ui.controller",
+    "TextualUI": "debussy.ui.tui",
+}
 
 __all__ = [
     "NonInteractiveUI",
@@ -14,3 +30,15 @@ __all__ = [
     "UIState",
     "UserAction",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import Textual-backed exports on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -114,7 +114,7 @@ class UIContext:
     total_phases: int = 0
     phase_index: int = 0
     state: UIState = UIState.IDLE
-    start_time: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=time.monotonic)  # time.monotonic() reference, not wall clock
     verbose: bool = True
     last_action: UserAction = UserAction.NONE
     # Token usage tracking (cumulative across all phases)
@@ -35,6 +35,9 @@ from debussy.ui.messages import (
 if TYPE_CHECKING:
     from debussy.core.models import Phase
 
+# Pending user actions kept before the oldest is dropped
+_ACTION_QUEUE_MAX = 64
+
 
 class OrchestrationController:
     """Manages orchestration state and emits UI messages.
@@ -51,7 +54,9 @@ class OrchestrationController:
         """
         self._app = app
         self.context = UIContext()
-        self._action_queue: deque[UserAction] = deque()
+        # Single producer (key handlers) / single consumer (orchestrator poll);
+        # append/popleft are atomic, and maxlen bounds unconsumed actions
+        self._action_queue: deque[UserAction] = deque(maxlen=_ACTION_QUEUE_MAX)
 
     def _post(self, message: Message) -> None:
         """Post a message to the TUI.
@@ -76,7 +81,7 @@ class OrchestrationController:
         """
         self.context.plan_name = plan_name
         self.context.total_phases = total_phases
-        self.context.start_time = time.time()
+        self.context.start_time = time.monotonic()
         self.context.state = UIState.RUNNING
         self._post(OrchestrationStarted(plan_name, total_phases))
 
@@ -94,7 +99,7 @@ class OrchestrationController:
         self.context.current_phase = phase.id
         self.context.phase_title = phase.title
         self.context.phase_index = index
-        self.context.start_time = time.time()
+        self.context.start_time = time.monotonic()
         self._post(
             PhaseChanged(
                 phase_id=phase.id,
@@ -204,11 +209,12 @@ class OrchestrationController:
         Returns:
             The next action, or UserAction.NONE if queue is empty
         """
-        if self._action_queue:
+        try:
             action = self._action_queue.popleft()
-            self.context.last_action = action
-            return action
-        return UserAction.NONE
+        except IndexError:
+            return UserAction.NONE
+        self.context.last_action = action
+        return action
 
     # =========================================================================
     # Verbose Toggle
@@ -233,9 +239,15 @@ class OrchestrationController:
     def log_message(self, message: str) -> None:
         """Log a message (respects verbose setting).
 
+        Non-verbose messages are dropped here rather than posted, so they never
+        reach the Textual message queue. The TUI handler keeps its own verbose
+        check for messages already in flight when verbose is toggled.
+
         Args:
             message: Message to log
         """
+        if not self.context.verbose:
+            return
         self._post(LogMessage(message, raw=False))
 
     def log_message_raw(self, message: str) -> None:
@@ -253,14 +265,14 @@ class OrchestrationController:
     def show_status_popup(self, details: dict[str, str]) -> None:
         """Show status details in the log.
 
+        The header and all detail lines are posted as one message so the
+        log panel handles a single entry instead of one per line.
+
         Args:
             details: Key-value pairs to display
         """
-        self._post(LogMessage("", raw=True))
-        self._post(LogMessage("[bold]Current Status[/bold]", raw=True))
-        for key, value in details.items():
-            self._post(LogMessage(f"  {key}: {value}", raw=True))
-        self._post(LogMessage("", raw=True))
+        lines = ["[bold]Current Status[/bold]", *(f"  {key}: {value}" for key, value in details.items())]
+        self._post(LogMessage("\n".join(lines), raw=True))
 
     def confirm(self, message: str) -> bool:
         """Ask for user confirmation (auto-confirms in TUI mode).
@@ -30,13 +30,13 @@ class NonInteractiveUI:
         """Start the UI (no-op for non-interactive)."""
         self.context.plan_name = plan_name
         self.context.total_phases = total_phases
-        self.context.start_time = time.time()
+        self.context.start_time = time.monotonic()
         self.console.print(f"[bold]Starting orchestration:[/bold] {plan_name}")
         self.console.print(f"[dim]Total phases: {total_phases}[/dim]\n")
 
     def stop(self) -> None:
         """Stop the UI (no-op for non-interactive)."""
-        elapsed = time.time() - self.context.start_time
+        elapsed = time.monotonic() - self.context.start_time
         self.console.print(f"\n[dim]Completed in {elapsed:.1f}s[/dim]")
 
     def set_phase(self, phase: Phase, index: int) -> None:
@@ -14,13 +14,17 @@ import asyncio
 import logging
 import re
 import time
+from collections import deque
 from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from rich.errors import MarkupError
+from rich.text import Text
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, VerticalScroll
+from textual.timer import Timer
 from textual.widgets import RichLog
 from textual.worker import Worker, WorkerState
 
@@ -42,9 +46,24 @@ from debussy.ui.messages import (  # noqa: TC001
     VerboseToggled,
 )
 from debussy.ui.widgets import HotkeyBar, HUDHeader, QuitConfirmScreen, ResumeConfirmScreen
+from debussy.utils.event_loop import new_event_loop
 
 logger = logging.getLogger(__name__)
 
+# Tool lines from the stream parser: optional indent, [Tool: content], rest
+_TOOL_LINE_RE = re.compile(r"^(\s*)\[([A-Z][a-zA-Z]*):(.*?)\](.*)$", re.DOTALL)
+
+# Log buffer bounds: oldest lines are dropped past _LOG_BUFFER_MAX, and each
+# flush tick writes at most _LOG_FLUSH_BATCH lines to keep the UI responsive
+_LOG_BUFFER_MAX = 10_000
+_LOG_FLUSH_BATCH = 500
+
+# Lines kept by the log panel; older lines scroll out so long runs stay bounded
+_LOG_MAX_LINES = 5_000
+
+# (label, style) for every UIState, resolved once so handlers index directly
+_STATUS_LOOKUP: dict[UIState, tuple[str, str]] = {state: STATUS_MAP.get(state, ("Unknown", "white")) for state in UIState}
+
 if TYPE_CHECKING:
     from debussy.core.models import Phase
 
@@ -124,6 +143,16 @@ class DebussyTUI(App):
         self._run_id: str | None = None
         self._shutting_down: bool = False  # Prevent re-entrance during shutdown
         self._auto_scroll: bool = False  # Log panel auto-scroll state
+        self._last_elapsed_sec: int = -1  # Last whole second shown in the HUD timer
+        self._worker_done = asyncio.Event()  # Set when the orchestration worker finishes
+        self._previous_task_factory: Any = None  # Restored on unmount (eager factory is set on mount)
+        self._clear_timer: Timer | None = None  # Pending HUD message clear (one at a time)
+        self._elapsed_timer: Timer | None = None  # 1 Hz HUD timer, paused while not running
+        self._log_buffer: deque[str] = deque(maxlen=_LOG_BUFFER_MAX)  # Lines waiting for _flush_log()
+        # Widgets resolved once on first use (see _header/_hotkey_bar/_log_panel)
+        self._cached_header: HUDHeader | None = None
+        self._cached_hotkey_bar: HotkeyBar | None = None
+        self._cached_log: RichLog | None = None
 
     def set_controller(self, controller: OrchestrationController) -> None:
         """Inject the controller (set by TextualUI wrapper).
@@ -136,6 +165,23 @@ class DebussyTUI(App):
         """
         self._controller = controller
 
+    def run(self, **kwargs: Any) -> Any:
+        """Run the app on a dedicated event loop (uvloop when installed).
+
+        Args:
+            **kwargs: Forwarded to App.run()
+
+        Returns:
+            The app return value
+        """
+        if "loop" in kwargs:
+            return super().run(**kwargs)
+        loop = new_event_loop()
+        try:
+            return super().run(loop=loop, **kwargs)
+        finally:
+            loop.close()
+
     @property
     def ui_context(self) -> UIContext:
         """Return the controller's UIContext (single source of truth).
@@ -156,17 +202,44 @@ class DebussyTUI(App):
             raise RuntimeError(msg)
         return self._controller
 
+    @property
+    def _header(self) -> HUDHeader:
+        """Return the HUD header widget, querying the DOM only once."""
+        if self._cached_header is None:
+            self._cached_header = self.query_one("#hud-header", HUDHeader)
+        return self._cached_header
+
+    @property
+    def _hotkey_bar(self) -> HotkeyBar:
+        """Return the hotkey bar widget, querying the DOM only once."""
+        if self._cached_hotkey_bar is None:
+            self._cached_hotkey_bar = self.query_one("#hotkey-bar", HotkeyBar)
+        return self._cached_hotkey_bar
+
+    @property
+    def _log_panel(self) -> RichLog:
+        """Return the log panel widget, querying the DOM only once."""
+        if self._cached_log is None:
+            self._cached_log = self.query_one("#log", RichLog)
+        return self._cached_log
+
     def compose(self) -> ComposeResult:
         """Compose the app layout."""
         with Container(id="hud-container"):
             yield HUDHeader(id="hud-header")
             yield HotkeyBar(id="hotkey-bar")
         with VerticalScroll(id="log-container"):
-            yield RichLog(id="log", highlight=True, markup=True, wrap=True, auto_scroll=False)
+            yield RichLog(id="log", max_lines=_LOG_MAX_LINES, highlight=True, markup=True, wrap=True, auto_scroll=False)
 
     def on_mount(self) -> None:
         """Start timer and orchestration when app mounts."""
-        self.set_interval(1.0, self._update_timer)
+        # Run new tasks eagerly: coroutines that finish without suspending
+        # (message handlers, call_later callbacks) skip a scheduler round-trip
+        loop = asyncio.get_running_loop()
+        self._previous_task_factory = loop.get_task_factory()
+        loop.set_task_factory(asyncio.eager_task_factory)
+        self._elapsed_timer = self.set_interval(1.0, self._update_timer)
+        self.set_interval(1 / 30, self._flush_log)
         self.update_hud()
 
         # Check for resumable run first
@@ -193,17 +266,21 @@ class DebussyTUI(App):
         if self._orchestration_coro:
             self._worker = self._start_orchestration()
 
-    def on_unmount(self) -> None:
+    async def on_unmount(self) -> None:
         """Cleanup when app unmounts (including crashes)."""
         logger.debug("TUI unmounting, running cleanup")
-        self._cleanup_all_processes()
+        await self._cleanup_all_processes()
+        asyncio.get_running_loop().set_task_factory(self._previous_task_factory)
 
-    def _cleanup_all_processes(self) -> None:
+    async def _cleanup_all_processes(self) -> None:
         """Cancel worker and kill any orphaned Claude processes.
 
         This is the primary cleanup method, called from multiple places:
         - on_unmount (normal exit, crashes)
-        - _handle_quit_confirmation (user quit)
+        - _graceful_shutdown (user quit)
+
+        PIDRegistry.kill_all() blocks (signals plus a grace period per PID),
+        so it runs in a thread to keep the event loop responsive.
         """
         # Cancel the worker if running
         if self._worker and self._worker.is_running:
@@ -214,17 +291,17 @@ class DebussyTUI(App):
         active_pids = pid_registry.get_active_pids()
         if active_pids:
             logger.warning(f"Found {len(active_pids)} orphaned PIDs, killing: {active_pids}")
-            killed = pid_registry.kill_all()
+            killed = await asyncio.to_thread(pid_registry.kill_all)
             if killed:
                 logger.info(f"Killed orphaned PIDs: {killed}")
 
-    def _verify_cleanup_complete(self) -> bool:
+    async def _verify_cleanup_complete(self) -> bool:
         """Verify all Claude processes are dead. Returns True if clean."""
         still_alive = pid_registry.verify_all_dead()
         if still_alive:
             logger.error(f"PIDs still alive after cleanup: {still_alive}")
             # Try one more time
-            pid_registry.kill_all()
+            await asyncio.to_thread(pid_registry.kill_all)
             still_alive = pid_registry.verify_all_dead()
             if still_alive:
                 logger.critical(f"FAILED to kill PIDs: {still_alive}")
@@ -240,6 +317,11 @@ class DebussyTUI(App):
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Handle worker state changes."""
+        if event.worker is self._worker and event.state in (WorkerState.SUCCESS, WorkerState.ERROR, WorkerState.CANCELLED):
+            self._worker_done.set()
+            # Nothing left to time once orchestration has finished
+            self._set_elapsed_timer_running(False)
+
         if event.state == WorkerState.SUCCESS:
             self._run_id = event.worker.result
             self.write_log("[green]Orchestration completed successfully[/green]")
@@ -250,109 +332,160 @@ class DebussyTUI(App):
             self.write_log("[yellow]Orchestration cancelled[/yellow]")
 
     def _update_timer(self) -> None:
-        """Update the elapsed time display."""
-        elapsed = time.time() - self.ui_context.start_time
-        header = self.query_one("#hud-header", HUDHeader)
-        header.elapsed = format_duration(elapsed)
+        """Update the elapsed time display.
 
-    def update_hud(self) -> None:
-        """Update the HUD with current context."""
-        header = self.query_one("#hud-header", HUDHeader)
-        hotkey_bar = self.query_one("#hotkey-bar", HotkeyBar)
+        Skips formatting and the reactive write when the interval fires
+        early and the whole-second value has not changed.
+        """
+        sec = int(time.monotonic() - self.ui_context.start_time)
+        if sec == self._last_elapsed_sec:
+            return
+        self._last_elapsed_sec = sec
+        header = self._header
+        header.elapsed = format_duration(sec)
 
-        # Update phase info
-        ctx = self.ui_context
-        title = ctx.phase_title or "Starting..."
-        header.phase_info = f"{ctx.phase_index}/{ctx.total_phases}: {title}"
+    def _set_elapsed_timer_running(self, running: bool) -> None:
+        """Pause or resume the 1 Hz HUD timer."""
+        if self._elapsed_timer is None:
+            return
+        if running:
+            self._elapsed_timer.resume()
+        else:
+            self._elapsed_timer.pause()
 
-        # Update status
-        status_text, status_style = STATUS_MAP.get(ctx.state, ("Unknown", "white"))
-        header.status = status_text
-        header.status_style = status_style
+    def update_hud(self) -> None:
+        """Populate the HUD from the current context.
 
-        # Update verbose state
-        hotkey_bar.verbose = ctx.verbose
+        Only used to initialize the HUD on mount; afterwards the controller's
+        messages drive every HUD update through the on_* handlers.
+        """
+        header = self._header
+        hotkey_bar = self._hotkey_bar
+        ctx = self.ui_context
 
-        # Update token stats - show session tokens (live) + run total cost
+        # Token stats - show session tokens (live) + run total cost
         session_tokens = ctx.session_input_tokens + ctx.session_output_tokens
-        header.total_tokens = session_tokens
-        header.cost_usd = ctx.total_cost_usd
 
         # Calculate context percentage from current session
+        context_pct = 0
         if ctx.context_window > 0 and ctx.current_context_tokens > 0:
-            header.context_pct = int((ctx.current_context_tokens / ctx.context_window) * 100)
-        else:
-            header.context_pct = 0
+            context_pct = int((ctx.current_context_tokens / ctx.context_window) * 100)
+
+        # Several reactives change at once: suppress repaints until all are set
+        with self.batch_update():
+            title = ctx.phase_title or "Starting..."
+            header.phase_info = f"{ctx.phase_index}/{ctx.total_phases}: {title}"
+            header.status_tuple = _STATUS_LOOKUP[ctx.state]
+            hotkey_bar.verbose = ctx.verbose
+            header.total_tokens = session_tokens
+            header.cost_usd = ctx.total_cost_usd
+            header.context_pct = context_pct
 
     def write_log(self, message: str) -> None:
-        """Add a message to the log panel."""
+        """Queue a message for the log panel.
+
+        Messages are appended to a bounded deque and written by _flush_log()
+        in one RichLog write per tick, so bursts of output cost one render
+        instead of one per line. Safe to call before the app is mounted.
+        """
         # Skip empty messages (RichLog.write adds newline, so empty = blank line)
         if not message:
             return
-        log = self.query_one("#log", RichLog)
+        self._log_buffer.append(message)
+
+    def _flush_log(self) -> None:
+        """Write buffered log messages to the log panel in a single write.
+
+        Writes at most _LOG_FLUSH_BATCH lines per call; the rest stay queued
+        for the next tick.
+        """
+        buffer = self._log_buffer
+        if not buffer:
+            return
+        log = self._log_panel
+        count = min(len(buffer), _LOG_FLUSH_BATCH)
+        lines = [self._render_log_line(log, buffer.popleft()) for _ in range(count)]
+        log.write(Text("\n").join(lines))
+
+    @staticmethod
+    def _render_log_line(log: RichLog, message: str) -> Text:
+        """Convert a log message to Text, matching RichLog's markup/highlight handling."""
         # Style tool commands like [Read: file.py] or [ERROR: ...] in italic dim
         # Match pattern: [CapitalizedWord: ...] or indented [ERROR: ...]
-        if re.match(r"^\s*\[[A-Z][a-zA-Z]*:", message):
-            # Transform [Tool: content] to styled markup
-            # Replace brackets to avoid Rich markup conflicts
-            styled = re.sub(
-                r"\[([A-Z][a-zA-Z]*):(.*?)\]",
-                r"[italic dim]⟨\1:\2⟩[/italic dim]",
-                message,
-            )
-            log.write(styled)
-        else:
-            log.write(message)
+        # Only run the regex when the first non-blank chars look like "[X" -
+        # markup lines ("[bold]...") and plain output are rejected by two
+        # character checks instead of a regex scan
+        head = message.lstrip()[:2]
+        match = _TOOL_LINE_RE.match(message) if head[:1] == "[" and head[1:].isupper() else None
+        if match:
+            # Tool lines are plain text from the stream parser: build the Text
+            # directly instead of rewriting to markup and re-parsing it
+            indent, tool, content, rest = match.groups()
+            return Text.assemble(indent, (f"⟨{tool}:{content}⟩", "italic dim"), rest)
+        try:
+            text = Text.from_markup(message)
+        except MarkupError:
+            text = Text(message)
+        return log.highlighter(text) if log.highlight else text
 
     def set_hud_message(self, message: str) -> None:
         """Set a transient message in the HUD hotkey bar."""
-        hotkey_bar = self.query_one("#hotkey-bar", HotkeyBar)
+        hotkey_bar = self._hotkey_bar
         hotkey_bar.message = message
 
     def clear_hud_message(self) -> None:
         """Clear the HUD message after a delay."""
         self.set_hud_message("")
 
+    def _schedule_hud_clear(self, delay: float) -> None:
+        """Clear the HUD message after delay, replacing any pending clear.
+
+        Keeps a single timer so an earlier clear cannot wipe a newer message.
+        """
+        if self._clear_timer is not None:
+            self._clear_timer.stop()
+        self._clear_timer = self.set_timer(delay, self.clear_hud_message)
+
     def action_show_status(self) -> None:
         """Handle status action - show status summary in HUD."""
         ctx = self.ui_context
-        elapsed = time.time() - ctx.start_time
+        elapsed = time.monotonic() - ctx.start_time
         elapsed_str = format_duration(elapsed)
 
         # Show compact status in HUD message
         status_msg = f"{ctx.plan_name} | {ctx.state.value} | {elapsed_str}"
         self.set_hud_message(status_msg)
         # Clear message after 5 seconds
-        self.set_timer(5.0, self.clear_hud_message)
+        self._schedule_hud_clear(5.0)
 
     def action_toggle_pause(self) -> None:
         """Handle pause/resume action."""
         state = self.ui_context.state
         action = UserAction.PAUSE if state == UIState.RUNNING else UserAction.RESUME
         self._require_controller().queue_action(action)
-        self.set_timer(3.0, self.clear_hud_message)
+        self._schedule_hud_clear(3.0)
 
     def action_toggle_verbose(self) -> None:
         """Handle verbose toggle - apply immediately in TUI."""
         self._require_controller().toggle_verbose()
-        self.set_timer(3.0, self.clear_hud_message)
+        self._schedule_hud_clear(3.0)
 
     def action_toggle_autoscroll(self) -> None:
         """Handle auto-scroll toggle for the log panel."""
         self._auto_scroll = not self._auto_scroll
-        log = self.query_one("#log", RichLog)
+        log = self._log_panel
         log.auto_scroll = self._auto_scroll
         # Update hotkey bar display
-        hotkey_bar = self.query_one("#hotkey-bar", HotkeyBar)
+        hotkey_bar = self._hotkey_bar
         hotkey_bar.auto_scroll = self._auto_scroll
         state_str = "ON" if self._auto_scroll else "OFF"
         self.set_hud_message(f"Auto-scroll: {state_str}")
-        self.set_timer(3.0, self.clear_hud_message)
+        self._schedule_hud_clear(3.0)
 
     def action_skip_phase(self) -> None:
         """Handle skip action."""
         self._require_controller().queue_action(UserAction.SKIP)
-        self.set_timer(3.0, self.clear_hud_message)
+        self._schedule_hud_clear(3.0)
 
     def action_quit_orchestration(self) -> None:
         """Handle quit action - show confirmation dialog."""
@@ -367,18 +500,22 @@ class DebussyTUI(App):
     def on_orchestration_started(self, message: OrchestrationStarted) -> None:
         """Handle orchestration started message from controller.
 
-        Updates the HUD to reflect the new orchestration run.
+        Updates the HUD to reflect the new orchestration run. The controller
+        switches to RUNNING on start without a separate StateChanged message,
+        so the status indicator is updated here too.
         Note: The welcome banner is written by start() method directly.
         """
-        header = self.query_one("#hud-header", HUDHeader)
+        header = self._header
         header.phase_info = f"0/{message.total_phases}: Starting..."
+        header.status_tuple = _STATUS_LOOKUP[UIState.RUNNING]
+        self._set_elapsed_timer_running(True)
 
     def on_phase_changed(self, message: PhaseChanged) -> None:
         """Handle phase change message from controller.
 
         Updates the HUD header with new phase information.
         """
-        header = self.query_one("#hud-header", HUDHeader)
+        header = self._header
         header.phase_info = f"{message.phase_index}/{message.total_phases}: {message.phase_title}"
 
     def on_state_changed(self, message: StateChanged) -> None:
@@ -386,20 +523,21 @@ class DebussyTUI(App):
 
         Updates the HUD status indicator with the new state.
         """
-        header = self.query_one("#hud-header", HUDHeader)
-        status_text, status_style = STATUS_MAP.get(message.state, ("Unknown", "white"))
-        header.status = status_text
-        header.status_style = status_style
+        header = self._header
+        header.status_tuple = _STATUS_LOOKUP[message.state]
+        # Only tick the elapsed display while running (not paused/waiting)
+        self._set_elapsed_timer_running(message.state == UIState.RUNNING)
 
     def on_token_stats_updated(self, message: TokenStatsUpdated) -> None:
         """Handle token stats update message from controller.
 
         Updates the HUD with current token usage and cost.
         """
-        header = self.query_one("#hud-header", HUDHeader)
-        header.total_tokens = message.session_input_tokens
-        header.cost_usd = message.total_cost_usd
-        header.context_pct = message.context_pct
+        header = self._header
+        with self.batch_update():
+            header.total_tokens = message.session_input_tokens
+            header.cost_usd = message.total_cost_usd
+            header.context_pct = message.context_pct
 
     def on_log_message(self, message: LogMessage) -> None:
         """Handle log message from controller.
@@ -416,14 +554,14 @@ class DebussyTUI(App):
         """
         self.set_hud_message(message.message)
         if message.clear_after > 0:
-            self.set_timer(message.clear_after, self.clear_hud_message)
+            self._schedule_hud_clear(message.clear_after)
 
     def on_verbose_toggled(self, message: VerboseToggled) -> None:
         """Handle verbose toggle message from controller.
 
         Updates the hotkey bar to reflect the new verbose state.
         """
-        hotkey_bar = self.query_one("#hotkey-bar", HotkeyBar)
+        hotkey_bar = self._hotkey_bar
         hotkey_bar.verbose = message.is_verbose
 
     def on_orchestration_completed(self, message: OrchestrationCompleted) -> None:
@@ -441,14 +579,14 @@ class DebussyTUI(App):
 
         Updates the HUD header to show which agent is currently working.
         """
-        header = self.query_one("#hud-header", HUDHeader)
+        header = self._header
         header.active_agent = message.agent
 
     def _handle_quit_confirmation(self, confirmed: bool | None) -> None:
         """Handle the result of quit confirmation dialog."""
         if not confirmed:
             self.set_hud_message("Quit cancelled")
-            self.set_timer(2.0, self.clear_hud_message)
+            self._schedule_hud_clear(2.0)
             return
 
         # Prevent re-entrance
@@ -470,28 +608,26 @@ class DebussyTUI(App):
         # Cancel the worker (this will trigger CancelledError in Claude runner)
         if self._worker and self._worker.is_running:
             self._worker.cancel()
-            self.call_later(self.write_log, "[dim]Waiting for Claude processes to terminate...[/dim]")
+            self.write_log("[dim]Waiting for Claude processes to terminate...[/dim]")
 
             # Wait for worker to actually finish (with timeout)
-            for _ in range(50):  # Max 5 seconds
-                if not self._worker.is_running:
-                    break
-                await asyncio.sleep(0.1)
+            try:
+                await asyncio.wait_for(self._worker_done.wait(), timeout=5.0)
+            except TimeoutError:
+                logger.warning("Orchestration worker did not finish within 5s")
 
         # Cleanup any orphaned processes
-        self._cleanup_all_processes()
+        await self._cleanup_all_processes()
 
         # Verify everything is dead
-        if self._verify_cleanup_complete():
-            self.call_later(self.write_log, "[green]All Claude instances terminated. Cleanup complete.[/green]")
+        if await self._verify_cleanup_complete():
+            self.write_log("[green]All Claude instances terminated. Cleanup complete.[/green]")
         else:
-            self.call_later(
-                self.write_log,
-                "[red]WARNING: Some processes may still be running. Check manually.[/red]",
-            )
+            self.write_log("[red]WARNING: Some processes may still be running. Check manually.[/red]")
 
-        # Brief delay to show messages, then exit
-        await asyncio.sleep(0.5)
+        # write_log only appends to the buffer; flush it, then exit on the next
+        # loop iteration - no need to hold the quit for a fixed delay
+        self.call_later(self._flush_log)
         self.call_later(self.exit)
 
     # =========================================================================
@@ -505,7 +641,6 @@ class DebussyTUI(App):
         so direct method calls are safe - no call_later() needed.
         """
         self._require_controller().start(plan_name, total_phases)
-        self.update_hud()
         self._write_welcome_banner(plan_name, total_phases)
 
     def _write_welcome_banner(self, plan_name: str, total_phases: int) -> None:
@@ -518,10 +653,8 @@ class DebussyTUI(App):
 ██████╔╝███████╗██████╔╝╚██████╔╝███████║███████║   ██║
 ╚═════╝ ╚══════╝╚═════╝  ╚═════╝ ╚══════╝╚══════╝   ╚═╝
 [/bold cyan]"""
-        self.write_log(banner)
-        self.write_log(f"[bold]Plan:[/bold] {plan_name}")
-        self.write_log(f"[bold]Phases:[/bold] {total_phases}")
-        self.write_log("")
+        # Single write: one RichLog render instead of one per line
+        self.write_log(f"{banner}\n[bold]Plan:[/bold] {plan_name}\n[bold]Phases:[/bold] {total_phases}")
 
     def stop(self) -> None:
         """Stop the UI (no-op, app controls its own lifecycle)."""
@@ -530,12 +663,10 @@ class DebussyTUI(App):
     def set_phase(self, phase: Phase, index: int) -> None:
         """Update the current phase being executed."""
         self._require_controller().set_phase(phase, index)
-        self.update_hud()
 
     def set_state(self, state: UIState) -> None:
         """Update the UI state."""
         self._require_controller().set_state(state)
-        self.update_hud()
 
     def log_message(self, message: str) -> None:
         """Add a log message to the scrolling output."""
@@ -556,9 +687,7 @@ class DebussyTUI(App):
 
     def toggle_verbose(self) -> bool:
         """Toggle verbose logging."""
-        result = self._require_controller().toggle_verbose()
-        self.update_hud()
-        return result
+        return self._require_controller().toggle_verbose()
 
     def update_token_stats(
         self,
@@ -574,15 +703,11 @@ class DebussyTUI(App):
         Final result (with cost > 0) adds session totals to run totals.
         """
         self._require_controller().update_token_stats(input_tokens, output_tokens, cost_usd, context_tokens, context_window)
-        self.update_hud()
 
     def show_status_popup(self, details: dict[str, str]) -> None:
-        """Show a detailed status popup."""
-        self.write_log("")
-        self.write_log("[bold]Current Status[/bold]")
-        for key, value in details.items():
-            self.write_log(f"  {key}: {value}")
-        self.write_log("")
+        """Show a detailed status popup as a single log entry."""
+        lines = ["[bold]Current Status[/bold]", *(f"  {key}: {value}" for key, value in details.items())]
+        self.write_log("\n".join(lines))
 
     def confirm(self, message: str) -> bool:
         """Ask for user confirmation (auto-confirms in TUI mode)."""
@@ -591,12 +716,12 @@ class DebussyTUI(App):
 
     def set_active_agent(self, agent: str) -> None:
         """Update the active agent display in the HUD."""
-        header = self.query_one("#hud-header", HUDHeader)
+        header = self._header
         header.active_agent = agent
 
     def set_model(self, model: str) -> None:
         """Update the model name display in the HUD."""
-        header = self.query_one("#hud-header", HUDHeader)
+        header = self._header
         header.model = model
 
 
@@ -621,6 +746,15 @@ class TextualUI:
             raise RuntimeError("TextualUI.context accessed before app was created")
         return self._controller.context
 
+    @property
+    def verbose(self) -> bool:
+        """Return whether verbose logging is on (False before the app exists).
+
+        Hot-path callers can check this before formatting a message that
+        log() would drop anyway.
+        """
+        return self._controller is not None and self._controller.context.verbose
+
     def create_app(self, orchestration_coro: Callable[[], Coroutine[Any, Any, str]] | None = None) -> DebussyTUI:
         """Create and return the Textual app with controller.
 
@@ -671,13 +805,13 @@ class TextualUI:
             self._app.set_state(state)
 
     def log(self, message: str) -> None:
-        """Add a log message."""
-        if self._app:
+        """Add a log message (dropped here when verbose is off)."""
+        if self._app and self.verbose:
             self._app.log_message(message)
 
     def log_message(self, message: str) -> None:
         """Add a log message (alias for log)."""
-        if self._app:
+        if self._app and self.verbose:
             self._app.log_message(message)
 
     def log_raw(self, message: str) -> None:
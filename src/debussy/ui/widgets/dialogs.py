@@ -11,7 +11,7 @@ from textual.widgets import Button, Static
 class ResumeConfirmScreen(ModalScreen[bool]):
     """Modal confirmation screen for resuming a previous run."""
 
-    CSS = """
+    DEFAULT_CSS = """
     ResumeConfirmScreen {
         align: center middle;
     }
@@ -81,7 +81,7 @@ class ResumeConfirmScreen(ModalScreen[bool]):
 class QuitConfirmScreen(ModalScreen[bool]):
     """Modal confirmation screen for quitting."""
 
-    CSS = """
+    DEFAULT_CSS = """
     QuitConfirmScreen {
         align: center middle;
     }
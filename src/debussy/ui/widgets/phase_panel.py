@@ -10,9 +10,13 @@ from textual.widgets import Static
 class HUDHeader(Static):
     """Fixed header widget showing phase info, status, timer, and token usage."""
 
+    # Widget already has a __dict__ (reactives live there); slots only make the
+    # render-cache attributes read on every render() cheaper to access.
+    __slots__ = ("_render_cache", "_render_result")
+
     phase_info = reactive("Phase 0/0: Starting...")
-    status = reactive("Running")
-    status_style = reactive("green")
+    # (label, style) pair - a single reactive so a state change triggers one refresh
+    status_tuple: reactive[tuple[str, str]] = reactive(("Running", "green"))
     elapsed = reactive("00:00:00")
     context_pct = reactive(0)
     total_tokens = reactive(0)
@@ -20,8 +24,36 @@ class HUDHeader(Static):
     active_agent = reactive("Debussy")  # Current agent (Debussy, Explore, etc.)
     model = reactive("")  # Current Claude model (e.g., "opus", "sonnet", "haiku")
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the header with an empty render cache."""
+        super().__init__(*args, **kwargs)
+        # Last rendered Text, keyed by the reactive values it was built from.
+        # Textual may call render() on resize/focus without any value changing.
+        self._render_cache: tuple | None = None
+        self._render_result: Text | None = None
+
     def render(self) -> Text:
-        """Render the HUD header."""
+        """Render the HUD header (memoized on the reactive values)."""
+        key = (
+            self.phase_info,
+            self.status_tuple,
+            self.elapsed,
+            self.context_pct,
+            self.total_tokens,
+            self.cost_usd,
+            self.active_agent,
+            self.model,
+        )
+        if key == self._render_cache and self._render_result is not None:
+            return self._render_result
+
+        text = self._build_text()
+        self._render_cache = key
+        self._render_result = text
+        return text
+
+    def _build_text(self) -> Text:
+        """Build the HUD header Text from the current reactive values."""
         text = Text()
 
         # Phase info
@@ -30,7 +62,8 @@ class HUDHeader(Static):
         text.append("  |  ", style="dim")
 
         # Status indicator
-        text.append(f"● {self.status}", style=self.status_style)
+        status, status_style = self.status_tuple
+        text.append(f"● {status}", style=status_style)
         text.append("  |  ", style="dim")
 
         # Active agent with model (highlighted when not Debussy)
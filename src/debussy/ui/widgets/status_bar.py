@@ -10,41 +10,59 @@ from textual.widgets import Static
 class HotkeyBar(Static):
     """Hotkey bar showing available actions and status message."""
 
+    __slots__ = ("_render_cache", "_render_result", "_static_middle", "_static_prefix", "_static_suffix")
+
     verbose = reactive(True)
     auto_scroll = reactive(False)
     message = reactive("")  # Transient status message
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the hotkey bar with prebuilt static segments."""
+        super().__init__(*args, **kwargs)
+        self._render_cache: tuple | None = None
+        self._render_result: Text | None = None
+        # Only the on/off states and the message change between renders;
+        # the hotkey labels around them are built once here.
+        self._static_prefix = self._hotkeys(("", "s", "tatus  "), ("", "p", "ause  "), ("", "v", "erbose "))
+        self._static_middle = self._hotkeys(("", "a", "utoscroll "))
+        self._static_suffix = self._hotkeys(("s", "k", "ip  "), ("", "q", "uit"))
+
+    @staticmethod
+    def _hotkeys(*labels: tuple[str, str, str]) -> Text:
+        """Build styled hotkey labels from (before, key, after) parts."""
+        text = Text()
+        for before, key, after in labels:
+            text.append(f"{before}[", style="dim")
+            text.append(key, style="bold yellow")
+            text.append(f"]{after}", style="dim")
+        return text
+
     def render(self) -> Text:
-        """Render the hotkey bar."""
-        bar = Text()
-        bar.append("[", style="dim")
-        bar.append("s", style="bold yellow")
-        bar.append("]tatus  ", style="dim")
-        bar.append("[", style="dim")
-        bar.append("p", style="bold yellow")
-        bar.append("]ause  ", style="dim")
-        bar.append("[", style="dim")
-        bar.append("v", style="bold yellow")
-        bar.append("]erbose ", style="dim")
+        """Render the hotkey bar (memoized on the reactive values)."""
+        key = (self.verbose, self.auto_scroll, self.message)
+        if key == self._render_cache and self._render_result is not None:
+            return self._render_result
+
+        bar = self._build_text()
+        self._render_cache = key
+        self._render_result = bar
+        return bar
+
+    def _build_text(self) -> Text:
+        """Build the hotkey bar Text from the static segments and current state."""
+        bar = self._static_prefix.copy()
 
         # Show current verbose state
         v_state = "on" if self.verbose else "off"
         bar.append(f"({v_state})  ", style="dim italic")
 
-        bar.append("[", style="dim")
-        bar.append("a", style="bold yellow")
-        bar.append("]utoscroll ", style="dim")
+        bar.append_text(self._static_middle)
 
         # Show current auto-scroll state
         a_state = "on" if self.auto_scroll else "off"
         bar.append(f"({a_state})  ", style="dim italic")
 
-        bar.append("s[", style="dim")
-        bar.append("k", style="bold yellow")
-        bar.append("]ip  ", style="dim")
-        bar.append("[", style="dim")
-        bar.append("q", style="bold yellow")
-        bar.append("]uit", style="dim")
+        bar.append_text(self._static_suffix)
 
         # Show status message if any
         if self.message:
@@ -5,6 +5,7 @@ from debussy.utils.git import (
     check_working_directory,
     get_git_status,
     parse_git_status_output,
+    parse_git_status_z,
 )
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "check_working_directory",
     "get_git_status",
     "parse_git_status_output",
+    "parse_git_status_z",
 ]
@@ -5,29 +5,48 @@ from __future__ import annotations
 import platform
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
+# Platform is fixed for the life of the process
+_IS_WINDOWS = platform.system() == "Windows"
+
+
+@lru_cache(maxsize=1)
+def _which_docker() -> str | None:
+    """Locate the docker executable on PATH (looked up once per process)."""
+    return shutil.which("docker")
+
+
+@lru_cache(maxsize=1)
+def _docker_command() -> tuple[str, ...]:
+    """Resolve the docker command prefix once (see get_docker_command)."""
+    if _which_docker():
+        return ("docker",)
+    # On Windows, try docker through WSL
+    if _IS_WINDOWS and shutil.which("wsl"):
+        return ("wsl", "docker")
+    return ("docker",)  # Will fail, but gives clear error
+
 
 def get_docker_command() -> list[str]:
     """Get the docker command prefix, using WSL on Windows if needed.
 
+    The PATH lookups are cached for the life of the process; a fresh list is
+    returned on each call so callers may extend it.
+
     Returns:
         Command list suitable for subprocess calls.
         On Windows without native Docker, returns ["wsl", "docker"].
     """
-    if shutil.which("docker"):
-        return ["docker"]
-    # On Windows, try docker through WSL
-    if platform.system() == "Windows" and shutil.which("wsl"):
-        return ["wsl", "docker"]
-    return ["docker"]  # Will fail, but gives clear error
+    return list(_docker_command())
 
 
 def is_docker_available() -> bool:
     """Check if Docker is installed and the daemon is running."""
     docker_cmd = get_docker_command()
     # If using WSL, we don't need which() check
-    if docker_cmd[0] != "wsl" and not shutil.which("docker"):
+    if docker_cmd[0] != "wsl" and not _which_docker():
         return False
     try:
         result = subprocess.run(
@@ -56,14 +75,20 @@ def normalize_path_for_docker(path: Path, use_wsl: bool = False) -> str:
         - Windows + use_wsl=True:  C:\\Projects\\foo -> /mnt/c/Projects/foo
         - Unix: /home/user/foo -> /home/user/foo (unchanged)
     """
-    if platform.system() == "Windows":
-        path_str = str(path.resolve())
-        if len(path_str) >= 2 and path_str[1] == ":":
-            drive = path_str[0].lower()
-            rest = path_str[2:].replace("\\", "/")
-            if use_wsl:
-                return f"/mnt/{drive}{rest}"
-            return f"/{drive}{rest}"
+    if not _IS_WINDOWS:
+        return str(path)
+    return _windows_normalize(path, use_wsl)
+
+
+def _windows_normalize(path: Path, use_wsl: bool) -> str:
+    """Resolve a Windows path and rewrite its drive prefix for Docker."""
+    path_str = str(path.resolve())
+    if len(path_str) >= 2 and path_str[1] == ":":
+        drive = path_str[0].lower()
+        rest = path_str[2:].replace("\\", "/")
+        if use_wsl:
+            return f"/mnt/{drive}{rest}"
+        return f"/{drive}{rest}"
     return str(path)
 
 
@@ -0,0 +1,28 @@
+"""Asyncio event loop selection (uses uvloop when installed)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, preferring uvloop when it is available.
+
+    uvloop is an optional dependency (``pip install claude-debussy[uvloop]``)
+    and does not support Windows; the stock asyncio loop is used otherwise.
+
+    Returns:
+        A new, not-yet-running event loop. The caller owns it and must close it.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop  # pyright: ignore[reportMissingImports]  # ty: ignore[unresolved-import]
+
+            return uvloop.new_event_loop()
+        except ImportError:
+            logger.debug("uvloop not installed, using the default asyncio event loop")
+    return asyncio.new_event_loop()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
@@ -61,19 +62,18 @@ def parse_git_status_output(output: str) -> GitStatusResult:
     modified: list[str] = []
 
     for line in output.splitlines():
-        if not line or len(line) < 3:
+        if len(line) < 3:
             continue
 
-        # Extract the two-character status prefix
-        prefix = line[:2]
         # File path starts at position 3 (after "XY ")
         file_path = line[3:]
 
         # Handle renamed/copied files which have "old -> new" format
-        if " -> " in file_path:
-            file_path = file_path.split(" -> ", 1)[1]
+        _, sep, new_path = file_path.partition(" -> ")
+        if sep:
+            file_path = new_path
 
-        if prefix == "??":
+        if line.startswith("??"):
             # Untracked file
             untracked.append(file_path)
         else:
@@ -84,6 +84,45 @@ def parse_git_status_output(output: str) -> GitStatusResult:
     return GitStatusResult(untracked=untracked, modified=modified)
 
 
+# Status codes whose -z record is followed by a second record holding the source path
+_RENAME_CODES = frozenset(b"RC")
+
+
+def parse_git_status_z(output: bytes) -> GitStatusResult:
+    """Parse git status --porcelain=v1 -z output into structured result.
+
+    Records are NUL-terminated "XY path" entries with the same prefixes as
+    parse_git_status_output(). Paths are never quoted, and a rename or copy
+    is written as two records: the new path, then the original path.
+
+    Args:
+        output: Raw stdout bytes from `git status --porcelain=v1 -z`
+
+    Returns:
+        GitStatusResult with categorized file lists
+    """
+    untracked: list[str] = []
+    modified: list[str] = []
+
+    records = iter(output.split(b"\0"))
+    for record in records:
+        if len(record) < 4:
+            continue
+
+        # File path starts at position 3 (after "XY "); decode only the path
+        file_path = os.fsdecode(record[3:])
+
+        if record.startswith(b"??"):
+            untracked.append(file_path)
+        else:
+            modified.append(file_path)
+            # Skip the rename/copy source record that follows
+            if record[0] in _RENAME_CODES or record[1] in _RENAME_CODES:
+                next(records, None)
+
+    return GitStatusResult(untracked=untracked, modified=modified)
+
+
 def get_git_status(project_root: Path | None = None) -> GitStatusResult | None:
     """Get the current git status for a project.
 
@@ -98,9 +137,8 @@ def get_git_status(project_root: Path | None = None) -> GitStatusResult | None:
 
     try:
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
+            ["git", "status", "--porcelain=v1", "-z"],
             capture_output=True,
-            text=True,
             cwd=cwd,
             timeout=10,
             check=False,
@@ -110,7 +148,7 @@ def get_git_status(project_root: Path | None = None) -> GitStatusResult | None:
             # Git command failed (not a repo, etc.)
             return None
 
-        return parse_git_status_output(result.stdout)
+        return parse_git_status_z(result.stdout)
 
     except FileNotFoundError:
         # Git not installed
@@ -0,0 +1,184 @@
+"""Lightweight CLI for the commands Claude workers call during a phase.
+
+`debussy-worker done` and `debussy-worker progress` run on every phase
+boundary and heartbeat, so this entry point uses argparse and plain print()
+instead of Typer/Rich. The human-facing `debussy done`/`debussy progress`
+commands share the same implementation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+# orjson is an optional speedup (``pip install claude-debussy[orjson]``); its
+# JSONDecodeError subclasses the stdlib one, so both are handled the same way
+try:
+    from orjson import JSONDecodeError, loads  # pyright: ignore[reportMissingImports]  # ty: ignore[unresolved-import]
+except ImportError:
+    from json import JSONDecodeError, loads
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from debussy.core.state import StateManager
+
+COMPLETION_STATUSES = ("completed", "blocked", "failed")
+
+
+def _get_state() -> StateManager:
+    """Return the StateManager for the current project's state database."""
+    from debussy.config import get_orchestrator_dir
+
+    return _state_for(get_orchestrator_dir() / "state.db")
+
+
+@lru_cache(maxsize=4)
+def _state_for(db_path: Path) -> StateManager:
+    """Build a StateManager once per database path (schema setup runs once)."""
+    from debussy.core.state import StateManager
+
+    state = StateManager(db_path)
+    atexit.register(state.close)
+    return state
+
+
+def record_done(
+    phase: str,
+    status: str = "completed",
+    reason: str | None = None,
+    report: str | None = None,
+) -> None:
+    """Record a phase completion signal for the current run.
+
+    Args:
+        phase: Phase ID that completed
+        status: Completion status: completed, blocked, failed
+        reason: Reason for blocked/failed status
+        report: JSON completion report
+
+    Raises:
+        ValueError: If the report is not valid JSON
+        RuntimeError: If there is no active orchestration run
+    """
+    from debussy.core.models import CompletionSignal
+
+    # Parse report before touching the database
+    report_dict = None
+    if report:
+        try:
+            report_dict = loads(report)
+        except JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON report: {e}") from e
+        if not isinstance(report_dict, dict):
+            raise ValueError("Invalid JSON report: expected an object")
+
+    state = _get_state()
+    current_run = state.get_current_run()
+    if current_run is None:
+        raise RuntimeError("No active orchestration run found")
+
+    signal = CompletionSignal(
+        phase_id=phase,
+        status=status,  # type: ignore[arg-type]
+        reason=reason,
+        report=report_dict,
+        signaled_at=datetime.now(),
+    )
+    state.record_completion_signal(current_run.id, signal)
+
+
+def record_progress(phase: str, *steps: str) -> None:
+    """Log progress steps for the current run in one transaction.
+
+    Args:
+        phase: Phase ID
+        steps: Step names (e.g., 'implementation:started')
+
+    Raises:
+        RuntimeError: If there is no active orchestration run
+    """
+    state = _get_state()
+    current_run = state.get_current_run()
+    if current_run is None:
+        raise RuntimeError("No active orchestration run found")
+
+    state.log_progress_many(current_run.id, phase, list(steps))
+
+
+def _cmd_done(args: argparse.Namespace) -> int:
+    """Handle `debussy-worker done`."""
+    record_done(args.phase, args.status, args.reason, args.report)
+    print(f"Completion signal recorded for phase {args.phase}")
+    print(f"  Status: {args.status}")
+    if args.reason:
+        print(f"  Reason: {args.reason}")
+    return 0
+
+
+def _cmd_progress(args: argparse.Namespace) -> int:
+    """Handle `debussy-worker progress`."""
+    steps = args.step
+    if steps == ["-"]:
+        steps = [line.strip() for line in sys.stdin if line.strip()]
+    if not steps:
+        print("No progress steps given", file=sys.stderr)
+        return 1
+    record_progress(args.phase, *steps)
+    for step in steps:
+        print(f"Progress logged: {args.phase} - {step}")
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the worker commands."""
+    parser = argparse.ArgumentParser(
+        prog="debussy-worker",
+        description="Signal phase completion and progress to the Debussy orchestrator.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    done = subparsers.add_parser("done", help="Signal phase completion")
+    done.add_argument("--phase", "-p", required=True, help="Phase ID that completed")
+    done.add_argument("--status", "-s", default="completed", choices=COMPLETION_STATUSES, help="Completion status")
+    done.add_argument("--reason", "-r", help="Reason for blocked/failed status")
+    done.add_argument("--report", help="JSON completion report")
+    done.set_defaults(handler=_cmd_done)
+
+    progress = subparsers.add_parser("progress", help="Log progress during execution")
+    progress.add_argument("--phase", "-p", required=True, help="Phase ID")
+    progress.add_argument(
+        "--step",
+        "-s",
+        required=True,
+        action="append",
+        help="Step name (e.g., 'implementation:started'); repeat to log several, or '-' to read lines from stdin",
+    )
+    progress.set_defaults(handler=_cmd_progress)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the worker CLI.
+
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code
+    """
+    args = _build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (RuntimeError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
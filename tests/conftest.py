@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,7 +10,9 @@ from typing import TYPE_CHECKING
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
+
+    from click.testing import Result
 
 
 @pytest.fixture
@@ -36,6 +39,22 @@ def sample_phase2(fixtures_dir: Path) -> Path:
     return fixtures_dir / "sample_phase2.md"
 
 
+@pytest.fixture(scope="session")
+def cli_help() -> Callable[[str], Result]:
+    """Return `debussy <command> --help`, invoking each command once per session."""
+    from typer.testing import CliRunner
+
+    from debussy.cli import app
+
+    runner = CliRunner()
+
+    @functools.cache
+    def invoke(command: str) -> Result:
+        return runner.invoke(app, [command, "--help"])
+
+    return invoke
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path]:
     """Create a temporary directory for tests."""
@@ -2,21 +2,73 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from debussy.core.audit import AuditSeverity
-from debussy.core.auditor import PlanAuditor
+import pytest
+
+from debussy.core import audit
+from debussy.core.audit import AuditResult, AuditSeverity
+from debussy.core.auditor import PlanAuditor, _prefetch_plan_files, _read_plan_file, _read_plan_text
+from debussy.core.models import Phase, PhaseStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    PlanFactory = Callable[..., Path]
+
+VALID_PLAN = Path(__file__).parent / "fixtures" / "audit" / "valid_plan" / "MASTER_PLAN.md"
+
+SINGLE_PHASE_MASTER = """\
+# Test Plan
+
+## Phases
+
+| Phase | Title | Focus | Risk | Status |
+|-------|-------|-------|------|--------|
+| 1 | [Phase One](phase-1.md) | Setup | Low | Pending |
+"""
+
+
+@pytest.fixture(scope="session")
+def parsed_valid_plan() -> AuditResult:
+    """Audit the valid_plan fixture once for the tests that only read the result."""
+    return PlanAuditor().audit(VALID_PLAN)
+
+
+@pytest.fixture(scope="session")
+def plan_factory(tmp_path_factory: pytest.TempPathFactory) -> PlanFactory:
+    """Write a master plan (and optional phase-1.md) and return the master path.
+
+    Plans are stored in a session directory named after a hash of their
+    content, so identical plans are only written once per session.
+    """
+    root = tmp_path_factory.mktemp("plans")
+
+    def make_plan(master_content: str, phase_content: str | None = None) -> Path:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(master_content.encode())
+        if phase_content is not None:
+            digest.update(b"\0" + phase_content.encode())
+        plan_dir = root / digest.hexdigest()
+        master_path = plan_dir / "MASTER_PLAN.md"
+        if not master_path.exists():
+            plan_dir.mkdir()
+            if phase_content is not None:
+                (plan_dir / "phase-1.md").write_text(phase_content)
+            master_path.write_text(master_content)
+        return master_path
+
+    return make_plan
 
 
 class TestPlanAuditor:
     """Tests for PlanAuditor class."""
 
-    def test_audit_valid_plan(self, fixtures_dir: Path) -> None:
+    def test_audit_valid_plan(self, parsed_valid_plan: AuditResult) -> None:
         """Test that a valid plan passes audit."""
-        plan_path = fixtures_dir / "audit" / "valid_plan" / "MASTER_PLAN.md"
-        auditor = PlanAuditor()
-
-        result = auditor.audit(plan_path)
+        result = parsed_valid_plan
 
         assert result.passed
         assert result.summary.errors == 0
@@ -33,7 +85,7 @@ class TestPlanAuditor:
 
         assert not result.passed
         assert result.summary.errors == 1
-        assert any(i.code == "MASTER_NOT_FOUND" for i in result.issues)
+        assert any(i.code is audit.MASTER_NOT_FOUND for i in result.issues)
 
     def test_audit_missing_gates(self, fixtures_dir: Path) -> None:
         """Test that phase without gates returns error."""
@@ -44,8 +96,7 @@ class TestPlanAuditor:
 
         assert not result.passed
         assert result.summary.errors >= 1
-        errors = [i for i in result.issues if i.severity == AuditSeverity.ERROR]
-        assert any(i.code == "MISSING_GATES" for i in errors)
+        assert result.has_error(audit.MISSING_GATES)
 
     def test_audit_missing_phase_file(self, fixtures_dir: Path) -> None:
         """Test that missing phase file returns error."""
@@ -56,8 +107,7 @@ class TestPlanAuditor:
 
         assert not result.passed
         assert result.summary.errors >= 1
-        errors = [i for i in result.issues if i.severity == AuditSeverity.ERROR]
-        assert any(i.code == "PHASE_NOT_FOUND" for i in errors)
+        assert result.has_error(audit.PHASE_NOT_FOUND)
 
     def test_audit_circular_dependencies(self, fixtures_dir: Path) -> None:
         """Test that circular dependencies return error."""
@@ -68,24 +118,11 @@ class TestPlanAuditor:
 
         assert not result.passed
         assert result.summary.errors >= 1
-        errors = [i for i in result.issues if i.severity == AuditSeverity.ERROR]
-        assert any(i.code == "CIRCULAR_DEPENDENCY" for i in errors)
+        assert result.has_error(audit.CIRCULAR_DEPENDENCY)
 
-    def test_audit_missing_notes_output_warning(self, temp_dir: Path) -> None:
+    def test_audit_missing_notes_output_warning(self, plan_factory: PlanFactory) -> None:
         """Test that missing notes output path returns warning."""
-        # Create a plan with a phase that has no notes output
-        master_content = """\
-# Test Plan
-
-## Phases
-
-| Phase | Title | Focus | Risk | Status |
-|-------|-------|-------|------|--------|
-| 1 | [Phase One](phase-1.md) | Setup | Low | Pending |
-"""
-        master_path = temp_dir / "MASTER_PLAN.md"
-        master_path.write_text(master_content)
-
+        # A plan with a phase that has no notes output
         phase_content = """\
 # Phase 1: Phase One
 
@@ -100,19 +137,16 @@ class TestPlanAuditor:
 ### 1. Setup
 - [ ] 1.1: Do something
 """
-        phase_path = temp_dir / "phase-1.md"
-        phase_path.write_text(phase_content)
 
         auditor = PlanAuditor()
-        result = auditor.audit(master_path)
+        result = auditor.audit(plan_factory(SINGLE_PHASE_MASTER, phase_content))
 
         # Should pass (warnings don't fail audit)
         assert result.passed
         # Should have warning about missing notes output
-        warnings = [i for i in result.issues if i.severity == AuditSeverity.WARNING]
-        assert any(i.code == "NO_NOTES_OUTPUT" for i in warnings)
+        assert any(i.code is audit.NO_NOTES_OUTPUT for i in result.warnings)
 
-    def test_audit_empty_phases_table(self, temp_dir: Path) -> None:
+    def test_audit_empty_phases_table(self, plan_factory: PlanFactory) -> None:
         """Test that master plan with no phases returns error."""
         master_content = """\
 # Empty Plan
@@ -122,31 +156,16 @@ class TestPlanAuditor:
 | Phase | Title | Focus | Risk | Status |
 |-------|-------|-------|------|--------|
 """
-        master_path = temp_dir / "MASTER_PLAN.md"
-        master_path.write_text(master_content)
 
         auditor = PlanAuditor()
-        result = auditor.audit(master_path)
+        result = auditor.audit(plan_factory(master_content))
 
         assert not result.passed
         assert result.summary.errors >= 1
-        errors = [i for i in result.issues if i.severity == AuditSeverity.ERROR]
-        assert any(i.code == "NO_PHASES" for i in errors)
+        assert result.has_error(audit.NO_PHASES)
 
-    def test_audit_missing_dependency_warning(self, temp_dir: Path) -> None:
+    def test_audit_missing_dependency_warning(self, plan_factory: PlanFactory) -> None:
         """Test that dependency on non-existent phase returns warning."""
-        master_content = """\
-# Test Plan
-
-## Phases
-
-| Phase | Title | Focus | Risk | Status |
-|-------|-------|-------|------|--------|
-| 1 | [Phase One](phase-1.md) | Setup | Low | Pending |
-"""
-        master_path = temp_dir / "MASTER_PLAN.md"
-        master_path.write_text(master_content)
-
         # Phase depends on phase "99" which doesn't exist
         phase_content = """\
 # Phase 1: Phase One
@@ -167,31 +186,16 @@ class TestPlanAuditor:
 ### 1. Setup
 - [ ] 1.1: Do something
 """
-        phase_path = temp_dir / "phase-1.md"
-        phase_path.write_text(phase_content)
 
         auditor = PlanAuditor()
-        result = auditor.audit(master_path)
+        result = auditor.audit(plan_factory(SINGLE_PHASE_MASTER, phase_content))
 
         # Should pass (missing dependency is a warning, not error)
         assert result.passed
-        warnings = [i for i in result.issues if i.severity == AuditSeverity.WARNING]
-        assert any(i.code == "MISSING_DEPENDENCY" for i in warnings)
+        assert any(i.code is audit.MISSING_DEPENDENCY for i in result.warnings)
 
-    def test_audit_self_dependency(self, temp_dir: Path) -> None:
+    def test_audit_self_dependency(self, plan_factory: PlanFactory) -> None:
         """Test that phase depending on itself returns error."""
-        master_content = """\
-# Test Plan
-
-## Phases
-
-| Phase | Title | Focus | Risk | Status |
-|-------|-------|-------|------|--------|
-| 1 | [Phase One](phase-1.md) | Setup | Low | Pending |
-"""
-        master_path = temp_dir / "MASTER_PLAN.md"
-        master_path.write_text(master_content)
-
         # Phase depends on itself
         phase_content = """\
 # Phase 1: Phase One
@@ -208,56 +212,133 @@ class TestPlanAuditor:
 ### 1. Setup
 - [ ] 1.1: Do something
 """
-        phase_path = temp_dir / "phase-1.md"
-        phase_path.write_text(phase_content)
 
         auditor = PlanAuditor()
-        result = auditor.audit(master_path)
+        result = auditor.audit(plan_factory(SINGLE_PHASE_MASTER, phase_content))
 
         assert not result.passed
-        errors = [i for i in result.issues if i.severity == AuditSeverity.ERROR]
-        assert any(i.code == "CIRCULAR_DEPENDENCY" for i in errors)
+        assert result.has_error(audit.CIRCULAR_DEPENDENCY)
 
-    def test_audit_summary_counts(self, fixtures_dir: Path) -> None:
+    def test_audit_summary_counts(self, parsed_valid_plan: AuditResult) -> None:
         """Test that audit summary counts are accurate."""
-        plan_path = fixtures_dir / "audit" / "valid_plan" / "MASTER_PLAN.md"
-        auditor = PlanAuditor()
-
-        result = auditor.audit(plan_path)
+        result = parsed_valid_plan
 
         assert result.summary.master_plan == "Valid Test Plan"
         assert result.summary.phases_found == 2
         assert result.summary.phases_valid == 2
         assert result.summary.gates_total == 5
 
-    def test_audit_phase_parse_error(self, temp_dir: Path) -> None:
+    def test_audit_phase_parse_error(self, plan_factory: PlanFactory) -> None:
         """Test that malformed phase file returns error."""
-        master_content = """\
-# Test Plan
-
-## Phases
-
-| Phase | Title | Focus | Risk | Status |
-|-------|-------|-------|------|--------|
-| 1 | [Phase One](phase-1.md) | Setup | Low | Pending |
-"""
-        master_path = temp_dir / "MASTER_PLAN.md"
-        master_path.write_text(master_content)
-
         # Create a phase file that exists but will cause parse issues
         # (though our parser is quite forgiving, so this mainly tests the try/except)
         phase_content = "Not a valid phase file"
-        phase_path = temp_dir / "phase-1.md"
-        phase_path.write_text(phase_content)
 
         auditor = PlanAuditor()
-        result = auditor.audit(master_path)
+        result = auditor.audit(plan_factory(SINGLE_PHASE_MASTER, phase_content))
 
         # The phase file exists, so PHASE_NOT_FOUND won't trigger
         # But it has no gates, so MISSING_GATES will trigger
         assert not result.passed
-        errors = [i for i in result.issues if i.severity == AuditSeverity.ERROR]
-        assert any(i.code == "MISSING_GATES" for i in errors)
+        assert result.has_error(audit.MISSING_GATES)
+
+    def test_audit_regex_compiled_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Auditing uses the parsers' precompiled patterns, never the re module."""
+        monkeypatch.setattr("debussy.parsers.master.re", None)
+        monkeypatch.setattr("debussy.parsers.phase.re", None)
+
+        result = PlanAuditor().audit(VALID_PLAN)
+
+        assert result.passed
+
+
+def _chain(depends_on: dict[str, list[str]]) -> list[Phase]:
+    """Build phases with the given dependencies."""
+    return [Phase(id=phase_id, title=f"Phase {phase_id}", path=Path(f"phase-{phase_id}.md"), status=PhaseStatus.PENDING, depends_on=deps) for phase_id, deps in depends_on.items()]
+
+
+class TestDependencyCycles:
+    """Tests for dependency cycle detection."""
+
+    def test_audit_large_dag_no_recursion_error(self) -> None:
+        """A long dependency chain is checked without recursing per phase."""
+        phases = _chain({str(i): [str(i - 1)] if i else [] for i in range(10_000)})
+
+        assert PlanAuditor()._check_dependency_cycles(phases) == []
+
+    def test_cycle_path_reported(self) -> None:
+        """The reported path is the cycle itself, not the chain leading to it."""
+        phases = _chain({"1": ["2"], "2": ["3"], "3": ["4"], "4": ["2"]})
+
+        issues = PlanAuditor()._check_dependency_cycles(phases)
+
+        assert len(issues) == 1
+        assert issues[0].code is audit.CIRCULAR_DEPENDENCY
+        assert issues[0].message == "Circular dependency detected: 2 -> 3 -> 4 -> 2"
+
+    def test_missing_dependency_is_not_a_cycle(self) -> None:
+        """Dependencies on phases outside the plan are ignored here."""
+        phases = _chain({"1": ["99"], "2": ["1"]})
+
+        assert PlanAuditor()._check_dependency_cycles(phases) == []
+
+
+class TestPlanFileCache:
+    """Tests for the auditor's cached plan file reads."""
+
+    def test_unchanged_file_read_once(self, temp_dir: Path) -> None:
+        """Repeated reads of an unchanged file should come from the cache."""
+        path = temp_dir / "phase-1.md"
+        path.write_text("**AGENT:debussy**")
+        _read_plan_text.cache_clear()
+
+        _read_plan_file(path)
+        _read_plan_file(path)
+
+        assert _read_plan_text.cache_info().misses == 1
+        assert _read_plan_text.cache_info().hits == 1
+
+    def test_changed_file_reread(self, temp_dir: Path) -> None:
+        """Editing a file should invalidate its cached text."""
+        path = temp_dir / "phase-1.md"
+        path.write_text("old")
+        assert _read_plan_file(path) == "old"
+
+        path.write_text("new content")
+
+        assert _read_plan_file(path) == "new content"
+
+    def test_prefetch_warms_cache(self, temp_dir: Path) -> None:
+        """Prefetching should cache every readable file and skip missing ones."""
+        paths = [temp_dir / f"phase-{n}.md" for n in range(1, 4)]
+        for path in paths:
+            path.write_text(path.name)
+        _read_plan_text.cache_clear()
+
+        _prefetch_plan_files([*paths, temp_dir / "phase-99.md"])
+
+        assert _read_plan_text.cache_info().misses == 3
+        assert [_read_plan_file(path) for path in paths] == ["phase-1.md", "phase-2.md", "phase-3.md"]
+
+    def test_sequential_env_skips_prefetch(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """DEBUSSY_AUDIT_SEQUENTIAL=1 should leave reading to the sequential pass."""
+        monkeypatch.setenv("DEBUSSY_AUDIT_SEQUENTIAL", "1")
+        paths = [temp_dir / "phase-1.md", temp_dir / "phase-2.md"]
+        for path in paths:
+            path.write_text(path.name)
+        _read_plan_text.cache_clear()
+
+        _prefetch_plan_files(paths)
+
+        assert _read_plan_text.cache_info().currsize == 0
+
+    def test_audit_reads_each_phase_once(self) -> None:
+        """An audit should read each phase file from disk only once."""
+        _read_plan_text.cache_clear()
+
+        PlanAuditor().audit(VALID_PLAN)
+
+        assert _read_plan_text.cache_info().misses == 2
 
 
 class TestAuditSuggestions:
@@ -286,6 +367,34 @@ class TestAuditSuggestions:
         )
         assert issue.suggestion is None
 
+    def test_audit_result_severity_buckets(self) -> None:
+        """Test that AuditResult splits its issues by severity."""
+        from debussy.core.audit import AuditIssue, AuditSummary
+
+        error = AuditIssue(severity=AuditSeverity.ERROR, code=audit.MISSING_GATES, message="no gates")
+        warning = AuditIssue(severity=AuditSeverity.WARNING, code=audit.NO_NOTES_OUTPUT, message="no notes")
+        info = AuditIssue(severity=AuditSeverity.INFO, code=audit.CUSTOM_AGENT, message="custom agent")
+        summary = AuditSummary(master_plan="Plan", phases_found=1, phases_valid=0, gates_total=0, errors=1, warnings=1)
+
+        result = AuditResult(passed=False, issues=[info, warning, error], summary=summary)
+
+        assert result.errors == (error,)
+        assert result.warnings == (warning,)
+        assert result.has_error(audit.MISSING_GATES)
+        assert not result.has_error(audit.NO_NOTES_OUTPUT)
+
+    def test_audit_issue_is_frozen(self) -> None:
+        """Test that audit issues are immutable and carry no per-instance dict."""
+        from dataclasses import FrozenInstanceError
+
+        from debussy.core.audit import AuditIssue, AuditSeverity
+
+        issue = AuditIssue(severity=AuditSeverity.ERROR, code="TEST_CODE", message="Test message")
+
+        with pytest.raises(FrozenInstanceError):
+            issue.code = "OTHER"  # type: ignore[misc]
+        assert not hasattr(issue, "__dict__")
+
     def test_missing_gates_has_suggestion(self, fixtures_dir: Path) -> None:
         """Test that MISSING_GATES error includes suggestion."""
         plan_path = fixtures_dir / "audit" / "missing_gates" / "MASTER_PLAN.md"
@@ -293,7 +402,7 @@ class TestAuditSuggestions:
 
         result = auditor.audit(plan_path)
 
-        missing_gates_issues = [i for i in result.issues if i.code == "MISSING_GATES"]
+        missing_gates_issues = [i for i in result.issues if i.code is audit.MISSING_GATES]
         assert len(missing_gates_issues) > 0
         assert missing_gates_issues[0].suggestion is not None
         assert "## Gates" in missing_gates_issues[0].suggestion
@@ -305,7 +414,7 @@ class TestAuditSuggestions:
 
         result = auditor.audit(plan_path)
 
-        phase_not_found = [i for i in result.issues if i.code == "PHASE_NOT_FOUND"]
+        phase_not_found = [i for i in result.issues if i.code is audit.PHASE_NOT_FOUND]
         assert len(phase_not_found) > 0
         assert phase_not_found[0].suggestion is not None
         assert "Create" in phase_not_found[0].suggestion or "update" in phase_not_found[0].suggestion
@@ -317,25 +426,13 @@ class TestAuditSuggestions:
 
         result = auditor.audit(plan_path)
 
-        circular_deps = [i for i in result.issues if i.code == "CIRCULAR_DEPENDENCY"]
+        circular_deps = [i for i in result.issues if i.code is audit.CIRCULAR_DEPENDENCY]
         assert len(circular_deps) > 0
         assert circular_deps[0].suggestion is not None
 
-    def test_no_notes_output_has_suggestion(self, temp_dir: Path) -> None:
+    def test_no_notes_output_has_suggestion(self, plan_factory: PlanFactory) -> None:
         """Test that NO_NOTES_OUTPUT warning includes suggestion."""
-        # Create a plan with a phase that has no notes output
-        master_content = """\
-# Test Plan
-
-## Phases
-
-| Phase | Title | Focus | Risk | Status |
-|-------|-------|-------|------|--------|
-| 1 | [Phase One](phase-1.md) | Setup | Low | Pending |
-"""
-        master_path = temp_dir / "MASTER_PLAN.md"
-        master_path.write_text(master_content)
-
+        # A plan with a phase that has no notes output
         phase_content = """\
 # Phase 1: Phase One
 
@@ -350,13 +447,11 @@ class TestAuditSuggestions:
 ### 1. Setup
 - [ ] 1.1: Do something
 """
-        phase_path = temp_dir / "phase-1.md"
-        phase_path.write_text(phase_content)
 
         auditor = PlanAuditor()
-        result = auditor.audit(master_path)
+        result = auditor.audit(plan_factory(SINGLE_PHASE_MASTER, phase_content))
 
-        no_notes = [i for i in result.issues if i.code == "NO_NOTES_OUTPUT"]
+        no_notes = [i for i in result.issues if i.code is audit.NO_NOTES_OUTPUT]
         assert len(no_notes) > 0
         assert no_notes[0].suggestion is not None
         assert "notes" in no_notes[0].suggestion.lower()
@@ -379,14 +474,11 @@ class TestAuditIntegration:
         # so we expect PHASE_NOT_FOUND errors
         assert not result.passed
         assert result.summary.errors > 0
-        assert any(i.code == "PHASE_NOT_FOUND" for i in result.issues)
+        assert any(i.code is audit.PHASE_NOT_FOUND for i in result.issues)
 
-    def test_audit_result_structure(self, fixtures_dir: Path) -> None:
+    def test_audit_result_structure(self, parsed_valid_plan: AuditResult) -> None:
         """Test that audit result has proper structure."""
-        plan_path = fixtures_dir / "audit" / "valid_plan" / "MASTER_PLAN.md"
-        auditor = PlanAuditor()
-
-        result = auditor.audit(plan_path)
+        result = parsed_valid_plan
 
         # Check result structure
         assert hasattr(result, "passed")
@@ -2,20 +2,51 @@
 
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from debussy.config import Config
 from debussy.core.models import Phase, PhaseStatus
+from debussy.core.orchestrator import Orchestrator
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-def _noop_init(_self: Any, *_args: Any, **_kwargs: Any) -> None:
-    """No-op init for patching Orchestrator."""
-    pass
+    from click.testing import Result
+
+    OrchestratorFactory = Callable[..., Orchestrator]
+
+# Shared by tests that only read default settings; never mutate it
+_DEFAULT_CONFIG = Config()
+
+# Stand-in UI for tests that never assert on UI output
+_NULL_UI = SimpleNamespace(log=lambda *_a, **_k: None, log_raw=lambda *_a, **_k: None)
+
+
+@pytest.fixture
+def make_orchestrator() -> OrchestratorFactory:
+    """Build Orchestrators without running __init__, with a null UI and mocked logging."""
+
+    def make(config: Config | None = None) -> Orchestrator:
+        orchestrator = Orchestrator.__new__(Orchestrator)
+        orchestrator.config = config or Config()
+        orchestrator.project_root = Path("/test/project")
+        orchestrator.master_plan_path = Path("/test/project/plans/MASTER_PLAN.md")
+        orchestrator.ui = _NULL_UI
+        orchestrator._event_logger = MagicMock()
+        return orchestrator
+
+    return make
+
+
+def _completed(stdout: str | bytes = "", returncode: int = 0, stderr: str = "") -> subprocess.CompletedProcess:
+    """A finished git command, as returned by subprocess.run()."""
+    return subprocess.CompletedProcess(args=["git"], returncode=returncode, stdout=stdout, stderr=stderr)
 
 
 class TestAutoCommitConfig:
@@ -23,17 +54,17 @@ class TestAutoCommitConfig:
 
     def test_default_auto_commit_is_true(self) -> None:
         """Auto-commit is enabled by default."""
-        config = Config()
+        config = _DEFAULT_CONFIG
         assert config.auto_commit is True
 
     def test_default_commit_on_failure_is_false(self) -> None:
         """Commit on failure is disabled by default."""
-        config = Config()
+        config = _DEFAULT_CONFIG
         assert config.commit_on_failure is False
 
     def test_default_commit_message_template(self) -> None:
         """Default commit message template has expected format."""
-        config = Config()
+        config = _DEFAULT_CONFIG
         assert "{phase_id}" in config.commit_message_template
         assert "{phase_name}" in config.commit_message_template
         assert "{status}" in config.commit_message_template
@@ -58,15 +89,6 @@ class TestAutoCommitConfig:
 class TestAutoCommitPhase:
     """Tests for _auto_commit_phase() method."""
 
-    @pytest.fixture
-    def mock_orchestrator(self) -> MagicMock:
-        """Create a mock orchestrator with required attributes."""
-        orchestrator = MagicMock()
-        orchestrator.config = Config()
-        orchestrator.project_root = Path("/test/project")
-        orchestrator.ui = MagicMock()
-        return orchestrator
-
     @pytest.fixture
     def test_phase(self) -> Phase:
         """Create a test phase."""
@@ -78,132 +100,109 @@ class TestAutoCommitPhase:
         )
 
     @patch("subprocess.run")
-    def test_commits_on_successful_phase(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_commits_on_successful_phase(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase commits changes on successful phase."""
-        from debussy.core.orchestrator import Orchestrator
-
         # Mock git status showing changes
         mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="M src/file.py\n"),  # git status
-            MagicMock(returncode=0),  # git add
-            MagicMock(returncode=0, stdout="1 file changed"),  # git commit
+            _completed(b" M src/file.py\0"),  # git status
+            _completed("1 file changed"),  # git commit -a
         ]
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config()
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.master_plan_path = Path("/test/project/plans/MASTER_PLAN.md")
-            orchestrator.ui = MagicMock()
-            orchestrator._event_logger = MagicMock()
+        orchestrator = make_orchestrator()
 
-            orchestrator._auto_commit_phase(test_phase, success=True)
+        orchestrator._auto_commit_phase(test_phase, success=True)
 
-        # Should have called git add, notes add, and commit
-        assert mock_run.call_count == 3
+        # Should have called git status and git commit -a (no notes dir to add)
+        assert mock_run.call_count == 2
 
     @patch("subprocess.run")
-    def test_skips_commit_when_auto_commit_disabled(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_skips_commit_when_auto_commit_disabled(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase skips commit when config.auto_commit is False."""
-        from debussy.core.orchestrator import Orchestrator
-
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config(auto_commit=False)
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.ui = MagicMock()
-            orchestrator._event_logger = MagicMock()
+        orchestrator = make_orchestrator(Config(auto_commit=False))
 
-            orchestrator._auto_commit_phase(test_phase, success=True)
+        orchestrator._auto_commit_phase(test_phase, success=True)
 
         # Should not have called any git commands
         mock_run.assert_not_called()
 
     @patch("subprocess.run")
-    def test_skips_commit_on_failure_by_default(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_skips_commit_on_failure_by_default(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase skips commit on failure when commit_on_failure is False."""
-        from debussy.core.orchestrator import Orchestrator
+        orchestrator = make_orchestrator(Config(commit_on_failure=False))
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config(commit_on_failure=False)
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.ui = MagicMock()
-            orchestrator._event_logger = MagicMock()
-
-            orchestrator._auto_commit_phase(test_phase, success=False)
+        orchestrator._auto_commit_phase(test_phase, success=False)
 
         # Should not have called any git commands
         mock_run.assert_not_called()
 
     @patch("subprocess.run")
-    def test_commits_on_failure_when_enabled(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_commits_on_failure_when_enabled(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase commits on failure when commit_on_failure is True."""
-        from debussy.core.orchestrator import Orchestrator
-
         # Mock git status showing changes
         mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="M src/file.py\n"),  # git status
-            MagicMock(returncode=0),  # git add
-            MagicMock(returncode=0, stdout="1 file changed"),  # git commit
+            _completed(b" M src/file.py\0"),  # git status
+            _completed("1 file changed"),  # git commit -a
         ]
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config(commit_on_failure=True)
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.master_plan_path = Path("/test/project/plans/MASTER_PLAN.md")
-            orchestrator.ui = MagicMock()
-            orchestrator._event_logger = MagicMock()
+        orchestrator = make_orchestrator(Config(commit_on_failure=True))
 
-            orchestrator._auto_commit_phase(test_phase, success=False)
+        orchestrator._auto_commit_phase(test_phase, success=False)
 
-        # Should have called git add, notes add, and commit
-        assert mock_run.call_count == 3
+        # Should have called git status and git commit -a (no notes dir to add)
+        assert mock_run.call_count == 2
 
     @patch("subprocess.run")
-    def test_skips_commit_when_no_changes(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_skips_commit_when_no_changes(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase skips commit when no changes detected."""
-        from debussy.core.orchestrator import Orchestrator
-
         # Mock git status showing no changes
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
+        mock_run.return_value = _completed(b"")
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config()
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.ui = MagicMock()
-            orchestrator._event_logger = MagicMock()
+        orchestrator = make_orchestrator()
 
-            orchestrator._auto_commit_phase(test_phase, success=True)
+        orchestrator._auto_commit_phase(test_phase, success=True)
 
         # Should only have called git status (not add/commit)
         assert mock_run.call_count == 1
 
     @patch("subprocess.run")
-    def test_commit_message_uses_template(self, mock_run: MagicMock, test_phase: Phase) -> None:
-        """_auto_commit_phase formats commit message using template."""
-        from debussy.core.orchestrator import Orchestrator
+    def test_commits_use_porcelain_z_null_separator(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
+        """_auto_commit_phase checks status with porcelain -z and stages via commit -a."""
+        mock_run.side_effect = [_completed(b" M src/file.py\0"), _completed("1 file changed")]
+
+        make_orchestrator()._auto_commit_phase(test_phase, success=True)
 
+        status_args = mock_run.call_args_list[0][0][0]
+        commit_args = mock_run.call_args_list[1][0][0]
+        assert status_args == ["git", "status", "--porcelain=v1", "-z"]
+        assert commit_args[:3] == ["git", "commit", "-a"]
+
+    @patch("subprocess.run")
+    def test_adds_notes_dir_before_commit(self, mock_run: MagicMock, test_phase: Phase, tmp_path: Path, make_orchestrator: OrchestratorFactory) -> None:
+        """An existing notes directory is staged before the commit."""
+        (tmp_path / "notes").mkdir()
+        mock_run.side_effect = [_completed(b"?? notes/NOTES_phase_1.md\0"), _completed(), _completed("1 file changed")]
+        orchestrator = make_orchestrator()
+        orchestrator.master_plan_path = tmp_path / "MASTER_PLAN.md"
+
+        orchestrator._auto_commit_phase(test_phase, success=True)
+
+        assert mock_run.call_args_list[1][0][0] == ["git", "add", str(tmp_path / "notes")]
+        assert mock_run.call_args_list[2][0][0][:3] == ["git", "commit", "-a"]
+
+    @patch("subprocess.run")
+    def test_commit_message_uses_template(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
+        """_auto_commit_phase formats commit message using template."""
         # Mock git commands
         mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="M src/file.py\n"),  # git status
-            MagicMock(returncode=0),  # git add
-            MagicMock(returncode=0, stdout="1 file changed"),  # git commit
+            _completed(b" M src/file.py\0"),  # git status
+            _completed("1 file changed"),  # git commit -a
         ]
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config()
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.master_plan_path = Path("/test/project/plans/MASTER_PLAN.md")
-            orchestrator.ui = MagicMock()
-            orchestrator._event_logger = MagicMock()
+        orchestrator = make_orchestrator()
 
-            orchestrator._auto_commit_phase(test_phase, success=True)
+        orchestrator._auto_commit_phase(test_phase, success=True)
 
-        # Check commit message contains phase info (commit is now call 3 due to notes add)
+        # Check commit message contains phase info (commit is the last call)
         commit_call = mock_run.call_args_list[-1]
         commit_args = commit_call[0][0]
         assert "git" in commit_args
@@ -213,28 +212,19 @@ class TestAutoCommitPhase:
         assert "Test Phase" in commit_message  # phase_name
 
     @patch("subprocess.run")
-    def test_commit_message_includes_co_author(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_commit_message_includes_co_author(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase includes Co-Authored-By in commit message."""
-        from debussy.core.orchestrator import Orchestrator
-
         # Mock git commands
         mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="M src/file.py\n"),  # git status
-            MagicMock(returncode=0),  # git add
-            MagicMock(returncode=0, stdout="1 file changed"),  # git commit
+            _completed(b" M src/file.py\0"),  # git status
+            _completed("1 file changed"),  # git commit -a
         ]
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config(model="sonnet")
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.master_plan_path = Path("/test/project/plans/MASTER_PLAN.md")
-            orchestrator.ui = MagicMock()
-            orchestrator._event_logger = MagicMock()
+        orchestrator = make_orchestrator(Config(model="sonnet"))
 
-            orchestrator._auto_commit_phase(test_phase, success=True)
+        orchestrator._auto_commit_phase(test_phase, success=True)
 
-        # Check commit message contains Co-Authored-By (commit is now last call due to notes add)
+        # Check commit message contains Co-Authored-By (commit is the last call)
         commit_call = mock_run.call_args_list[-1]
         commit_args = commit_call[0][0]
         commit_message = commit_args[commit_args.index("-m") + 1]
@@ -242,38 +232,24 @@ class TestAutoCommitPhase:
         assert "Claude" in commit_message
 
     @patch("subprocess.run")
-    def test_handles_git_not_found(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_handles_git_not_found(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase handles git not being installed."""
-        from debussy.core.orchestrator import Orchestrator
-
         mock_run.side_effect = FileNotFoundError()
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config()
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.ui = MagicMock()
+        orchestrator = make_orchestrator()
 
-            # Should not raise an exception
-            orchestrator._auto_commit_phase(test_phase, success=True)
+        # Should not raise an exception
+        orchestrator._auto_commit_phase(test_phase, success=True)
 
     @patch("subprocess.run")
-    def test_handles_git_timeout(self, mock_run: MagicMock, test_phase: Phase) -> None:
+    def test_handles_git_timeout(self, mock_run: MagicMock, test_phase: Phase, make_orchestrator: OrchestratorFactory) -> None:
         """_auto_commit_phase handles git command timeout."""
-        import subprocess
-
-        from debussy.core.orchestrator import Orchestrator
-
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=10)
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.config = Config()
-            orchestrator.project_root = Path("/test/project")
-            orchestrator.ui = MagicMock()
+        orchestrator = make_orchestrator()
 
-            # Should not raise an exception
-            orchestrator._auto_commit_phase(test_phase, success=True)
+        # Should not raise an exception
+        orchestrator._auto_commit_phase(test_phase, success=True)
 
 
 class TestCheckCleanWorkingDirectory:
@@ -283,164 +259,85 @@ class TestCheckCleanWorkingDirectory:
     and only counts tracked changes (untracked files are ignored).
     """
 
+    @pytest.mark.parametrize(
+        ("git_outcome", "expected"),
+        [
+            pytest.param(_completed(b""), (True, 0, []), id="clean"),
+            # Porcelain -z records; untracked (??) files are not counted as dirty
+            pytest.param(
+                _completed(b" M file1.py\0 M file2.py\0?? newfile.py\0"),
+                (False, 2, ["file1.py", "file2.py"]),
+                id="dirty",
+            ),
+            pytest.param(FileNotFoundError(), (True, 0, []), id="git-not-available"),
+            pytest.param(subprocess.TimeoutExpired(cmd="git", timeout=10), (True, 0, []), id="timeout"),
+            pytest.param(
+                _completed(returncode=128, stderr="fatal: not a git repository"),
+                (True, 0, []),
+                id="not-a-git-repo",
+            ),
+        ],
+    )
     @patch("subprocess.run")
-    def test_returns_true_for_clean_directory(self, mock_run: MagicMock) -> None:
-        """check_clean_working_directory returns (True, 0, []) for clean directory."""
-        from debussy.core.orchestrator import Orchestrator
-
-        mock_run.return_value = MagicMock(returncode=0, stdout="")
-
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.project_root = Path("/test/project")
+    def test_check_clean_working_directory(
+        self,
+        mock_run: MagicMock,
+        git_outcome: subprocess.CompletedProcess | Exception,
+        expected: tuple[bool, int, list[str]],
+        make_orchestrator: OrchestratorFactory,
+    ) -> None:
+        """check_clean_working_directory reports tracked changes; git failures count as clean."""
+        if isinstance(git_outcome, Exception):
+            mock_run.side_effect = git_outcome
+        else:
+            mock_run.return_value = git_outcome
 
-            is_clean, count, files = orchestrator.check_clean_working_directory()
+        orchestrator = make_orchestrator()
 
-        assert is_clean is True
-        assert count == 0
-        assert files == []
+        assert orchestrator.check_clean_working_directory() == expected
 
+    @pytest.mark.parametrize("file_count", [1, 10_000])
     @patch("subprocess.run")
-    def test_returns_false_for_dirty_directory(self, mock_run: MagicMock) -> None:
-        """check_clean_working_directory returns (False, N, files) for dirty directory.
-
-        Note: Untracked files (??) are no longer counted as dirty.
-        Only tracked modifications (M, A, D, etc.) are counted.
-        """
-        from debussy.core.orchestrator import Orchestrator
-
-        # Use proper porcelain format: "XY file"
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout=" M file1.py\n M file2.py\n?? newfile.py\n",
-        )
+    def test_counts_every_tracked_change(self, mock_run: MagicMock, file_count: int, make_orchestrator: OrchestratorFactory) -> None:
+        """All tracked changes are counted while only the first 10 are listed."""
+        records = [f" M src/file{i}.py".encode() for i in range(file_count)]
+        records += [f"?? new{i}.py".encode() for i in range(file_count)]
+        mock_run.return_value = _completed(b"\0".join(records) + b"\0")
 
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.project_root = Path("/test/project")
+        orchestrator = make_orchestrator()
 
-            is_clean, count, files = orchestrator.check_clean_working_directory()
+        is_clean, count, files = orchestrator.check_clean_working_directory()
 
         assert is_clean is False
-        # Only 2 modified files count, the untracked (??) file is ignored
-        assert count == 2
-        assert set(files) == {"file1.py", "file2.py"}
-
-    @patch("subprocess.run")
-    def test_returns_true_when_git_not_available(self, mock_run: MagicMock) -> None:
-        """check_clean_working_directory returns (True, 0, []) when git not available."""
-        from debussy.core.orchestrator import Orchestrator
-
-        mock_run.side_effect = FileNotFoundError()
-
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.project_root = Path("/test/project")
-
-            is_clean, count, files = orchestrator.check_clean_working_directory()
-
-        assert is_clean is True
-        assert count == 0
-        assert files == []
-
-    @patch("subprocess.run")
-    def test_returns_true_on_timeout(self, mock_run: MagicMock) -> None:
-        """check_clean_working_directory returns (True, 0, []) on timeout."""
-        import subprocess
-
-        from debussy.core.orchestrator import Orchestrator
-
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=10)
-
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.project_root = Path("/test/project")
-
-            is_clean, count, files = orchestrator.check_clean_working_directory()
-
-        assert is_clean is True
-        assert count == 0
-        assert files == []
-
-    @patch("subprocess.run")
-    def test_returns_true_when_not_a_git_repo(self, mock_run: MagicMock) -> None:
-        """check_clean_working_directory returns (True, 0, []) when not a git repo."""
-        from debussy.core.orchestrator import Orchestrator
-
-        mock_run.return_value = MagicMock(
-            returncode=128,
-            stderr="fatal: not a git repository",
-        )
-
-        with patch.object(Orchestrator, "__init__", _noop_init):
-            orchestrator = Orchestrator.__new__(Orchestrator)
-            orchestrator.project_root = Path("/test/project")
-
-            is_clean, count, files = orchestrator.check_clean_working_directory()
-
-        assert is_clean is True
-        assert count == 0
-        assert files == []
+        assert count == file_count
+        assert files == [f"src/file{i}.py" for i in range(min(file_count, 10))]
 
 
 class TestCLIAutoCommitFlags:
     """Tests for CLI auto-commit flags."""
 
-    @pytest.fixture
-    def runner(self) -> CliRunner:
-        """Create CLI test runner."""
-        return CliRunner()
-
-    def test_no_auto_commit_flag_exists(self) -> None:
+    def test_no_auto_commit_flag_exists(self, cli_help: Callable[[str], Result]) -> None:
         """--no-auto-commit flag is available on run command."""
-        from debussy.cli import app
-
-        result = CliRunner().invoke(app, ["run", "--help"])
-        assert "--no-auto-commit" in result.stdout
+        assert "--no-auto-commit" in cli_help("run").stdout
 
-    def test_allow_dirty_flag_exists(self) -> None:
+    def test_allow_dirty_flag_exists(self, cli_help: Callable[[str], Result]) -> None:
         """--allow-dirty flag is available on run command."""
-        from debussy.cli import app
-
-        result = CliRunner().invoke(app, ["run", "--help"])
-        assert "--allow-dirty" in result.stdout
+        assert "--allow-dirty" in cli_help("run").stdout
 
-    def test_no_auto_commit_disables_auto_commit(
-        self,
-        runner: CliRunner,
-        tmp_path: Path,
-    ) -> None:
+    def test_no_auto_commit_disables_auto_commit(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """--no-auto-commit flag sets config.auto_commit to False."""
         from debussy.cli import app
 
-        # Create a mock master plan file with valid structure
         master_plan = tmp_path / "MASTER_PLAN.md"
-        master_plan.write_text("""# Test Plan
-
-## Phases
+        master_plan.write_text("# Test Plan\n\n## Phases\n")
+        monkeypatch.chdir(tmp_path)
 
-| Phase | Title | File |
-|-------|-------|------|
-| 1 | Setup | phase-1.md |
-""")
-
-        # Create phase file
-        phase_file = tmp_path / "phase-1.md"
-        phase_file.write_text("""# Phase 1: Setup
-
-## Gates
-- ruff: `uv run ruff check .`
-""")
-
-        # Run with --no-auto-commit and --dry-run
-        result = runner.invoke(
-            app,
-            ["run", str(master_plan), "--no-auto-commit", "--dry-run"],
-            catch_exceptions=False,
-        )
+        # Call the command function directly: the flag only needs to reach the config
+        run = next(command.callback for command in app.registered_commands if command.callback.__name__ == "run")
+        with patch("debussy.core.orchestrator.run_orchestration", return_value="run-1") as run_orchestration:
+            run(master_plan=master_plan, auto_commit=False, no_interactive=True, accept_risks=True, skip_audit=True)
 
-        # Should use dry-run mode without error
-        assert result.exit_code == 0
+        assert run_orchestration.call_args.kwargs["config"].auto_commit is False
 
 
 class TestAutoCommitMessageFormat:
@@ -448,7 +345,7 @@ class TestAutoCommitMessageFormat:
 
     def test_success_message_has_checkmark(self) -> None:
         """Successful phase commit message includes checkmark."""
-        config = Config()
+        config = _DEFAULT_CONFIG
         message = config.commit_message_template.format(
             phase_id="1",
             phase_name="Test Phase",
@@ -460,7 +357,7 @@ class TestAutoCommitMessageFormat:
 
     def test_failure_message_has_warning(self) -> None:
         """Failed phase commit message includes warning icon."""
-        config = Config()
+        config = _DEFAULT_CONFIG
         message = config.commit_message_template.format(
             phase_id="2",
             phase_name="Build Phase",
@@ -0,0 +1,70 @@
+"""Tests for the `debussy history` and `debussy status` tables."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from debussy.cli import _COMPACT_HISTORY_ROWS, app
+from debussy.core.models import MasterPlan, Phase, PhaseStatus
+from debussy.core.state import StateManager
+
+
+@pytest.fixture
+def state(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> StateManager:
+    """Run the CLI from a temporary project with an empty state database."""
+    monkeypatch.chdir(tmp_path)
+    return StateManager(tmp_path / ".debussy" / "state.db")
+
+
+@pytest.fixture
+def plan(tmp_path: Path) -> MasterPlan:
+    """A one-phase master plan."""
+    return MasterPlan(
+        name="Test Plan",
+        path=tmp_path / "plan.md",
+        phases=[Phase(id="1", title="Setup", path=tmp_path / "phase-1.md", status=PhaseStatus.PENDING)],
+    )
+
+
+class TestHistory:
+    """Tests for `debussy history`."""
+
+    def test_lists_runs_in_bordered_table(self, state: StateManager, plan: MasterPlan) -> None:
+        """A short history is rendered with the regular table borders."""
+        run_id = state.create_run(plan)
+
+        result = CliRunner().invoke(app, ["history"])
+
+        assert result.exit_code == 0
+        assert run_id in result.output
+        assert "Run ID" in result.output
+        assert "┏" in result.output
+
+    def test_long_history_is_compact(self, state: StateManager, plan: MasterPlan) -> None:
+        """Past the row threshold the table is printed without borders."""
+        for _ in range(_COMPACT_HISTORY_ROWS + 1):
+            state.create_run(plan)
+
+        result = CliRunner().invoke(app, ["history", "--limit", str(_COMPACT_HISTORY_ROWS + 1)])
+
+        assert result.exit_code == 0
+        assert "Run ID" in result.output
+        assert "┏" not in result.output
+
+
+class TestStatus:
+    """Tests for `debussy status`."""
+
+    def test_shows_phase_executions(self, state: StateManager, plan: MasterPlan) -> None:
+        """The phase execution table lists each attempt."""
+        run_id = state.create_run(plan)
+        state.create_phase_execution(run_id, "1", attempt=1)
+
+        result = CliRunner().invoke(app, ["status", "--run", run_id])
+
+        assert result.exit_code == 0
+        assert "Phase Executions" in result.output
+        assert "Attempt" in result.output
@@ -0,0 +1,53 @@
+"""Tests that the CLI entry point keeps its import graph small."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+class TestCLIImportGraph:
+    """Heavy modules should only load inside the commands that use them."""
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "debussy.config",
+            "debussy.core.orchestrator",
+            "debussy.core.state",
+            "debussy.parsers.master",
+            "rich.table",
+        ],
+    )
+    def test_cli_import_defers_module(self, module: str) -> None:
+        """Importing debussy.cli should not import the given module."""
+        code = f"import sys, debussy.cli; print({module!r} in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
+
+
+class TestStatusColors:
+    """The module-level status color maps must stay in sync with the enums."""
+
+    def test_every_run_status_has_a_color(self) -> None:
+        """Each RunStatus member should resolve to a color."""
+        from debussy.cli import _RUN_STATUS_COLORS
+        from debussy.core.models import RunStatus
+
+        assert {status: _RUN_STATUS_COLORS.get(status) for status in RunStatus} == {
+            RunStatus.RUNNING: "blue",
+            RunStatus.COMPLETED: "green",
+            RunStatus.FAILED: "red",
+            RunStatus.PAUSED: "yellow",
+        }
+
+    def test_every_phase_status_has_a_color(self) -> None:
+        """Each PhaseStatus member should resolve to a color."""
+        from debussy.cli import _PHASE_STATUS_COLORS
+        from debussy.core.models import PhaseStatus
+
+        assert all(status in _PHASE_STATUS_COLORS for status in PhaseStatus)
+        assert _PHASE_STATUS_COLORS[PhaseStatus.AWAITING_HUMAN] == "magenta"
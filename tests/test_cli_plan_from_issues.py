@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import io
+import re
+from contextlib import ExitStack
+from dataclasses import asdict
+from subprocess import CompletedProcess
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
-from rich.console import Console
+from typer.testing import CliRunner
 
+from debussy.cli import app
+from debussy.core.audit import AuditIssue, AuditResult, AuditSeverity, AuditSummary
+from debussy.planners.analyzer import AnalysisReport, IssueQuality
 from debussy.planners.command import (
     PlanFromIssuesResult,
     _analyze_phase,
@@ -18,22 +27,72 @@ from debussy.planners.command import (
     _get_current_repo,
     plan_from_issues,
 )
-from debussy.planners.models import GitHubIssue, IssueSet
+from debussy.planners.models import IssueSet
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterator
+    from pathlib import Path
+
+    import typer
+    from click.testing import Result
+    from rich.console import Console
+
+    from debussy.planners.models import GitHubIssue
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Shared by tests that need a fetch with no results; never mutate it
+EMPTY_ISSUE_SET = IssueSet(issues=[])
+
+
+class _StubBuilder:
+    """Stands in for PlanBuilder, returning fixed plan files without calling Claude."""
+
+    def __init__(self, *_args: object, **_kwargs: object) -> None:
+        pass
+
+    def set_answers(self, answers: dict[str, str]) -> None:
+        pass
+
+    def generate_all(self) -> dict[str, str]:
+        return {"MASTER_PLAN.md": "# Master Plan", "phase-1.md": "# Phase 1"}
+
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_console() -> Console:
-    """Create a mock console for testing."""
-    return Console(force_terminal=False, quiet=True)
+    """Create a quiet console that skips markup, emoji and highlighting."""
+    from rich.console import Console
+
+    return Console(
+        file=io.StringIO(),
+        width=80,
+        color_system=None,
+        quiet=True,
+        markup=False,
+        emoji=False,
+        highlight=False,
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def null_console() -> Console:
+    """A console stand-in that drops everything printed to it.
+
+    For tests of pipeline stages that only call console.print.
+    """
+    return cast("Console", SimpleNamespace(print=lambda *_args, **_kwargs: None))
+
+
+@pytest.fixture(scope="session")
 def sample_issue() -> GitHubIssue:
     """Create a sample GitHub issue for testing."""
+    from debussy.planners.models import GitHubIssue
+
     return GitHubIssue(
         number=1,
         title="Add user authentication",
@@ -53,7 +112,7 @@ We need user authentication.
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_issue_set(sample_issue: GitHubIssue) -> IssueSet:
     """Create a sample issue set for testing."""
     return IssueSet(
@@ -63,38 +122,70 @@ def sample_issue_set(sample_issue: GitHubIssue) -> IssueSet:
     )
 
 
+@pytest.fixture(scope="session")
+def mock_audit_result_pass() -> AuditResult:
+    """Create a passing audit result."""
+    return AuditResult(passed=True, issues=[], summary=_audit_summary(errors=0))
+
+
+@pytest.fixture(scope="session")
+def mock_audit_result_fail() -> AuditResult:
+    """Create a failing audit result."""
+    issue = AuditIssue(
+        severity=AuditSeverity.ERROR,
+        code="MISSING_GATES",
+        message="Phase 1 has no gates defined",
+        location="phase-1.md",
+        suggestion="Add gates",
+    )
+    return AuditResult(passed=False, issues=[issue], summary=_audit_summary(errors=1))
+
+
 @pytest.fixture
-def mock_audit_result_pass() -> MagicMock:
-    """Create a mock passing audit result."""
-    result = MagicMock()
-    result.passed = True
-    result.issues = []
-    result.summary = MagicMock()
-    result.summary.errors = 0
-    result.summary.warnings = 0
-    return result
+def patched_subprocess_run() -> Iterator[MagicMock]:
+    """Patch subprocess.run; tests set its return_value or side_effect."""
+    with patch("subprocess.run") as mock_run:
+        yield mock_run
+
+
+@pytest.fixture(scope="module")
+def plans_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A plans directory holding a stub master plan, shared by tests that never write to it."""
+    plans = tmp_path_factory.mktemp("plans")
+    (plans / "MASTER_PLAN.md").write_text("# Plan")
+    return plans
+
+
+# plan_from_issues stages patched by patched_pipeline, in PipelinePatches field order
+_PIPELINE_STAGES = ("_fetch_phase", "_analyze_phase", "_generate_phase", "_audit_loop")
+
+
+class PipelinePatches(NamedTuple):
+    """Mocks standing in for the plan-from-issues pipeline stages."""
+
+    fetch: MagicMock
+    analyze: MagicMock
+    generate: MagicMock
+    audit: MagicMock
 
 
 @pytest.fixture
-def mock_audit_result_fail() -> MagicMock:
-    """Create a mock failing audit result."""
-    from debussy.core.audit import AuditIssue, AuditSeverity
-
-    result = MagicMock()
-    result.passed = False
-    result.issues = [
-        AuditIssue(
-            severity=AuditSeverity.ERROR,
-            code="MISSING_GATES",
-            message="Phase 1 has no gates defined",
-            location="phase-1.md",
-            suggestion="Add gates",
-        ),
-    ]
-    result.summary = MagicMock()
-    result.summary.errors = 1
-    result.summary.warnings = 0
-    return result
+def patched_pipeline() -> Iterator[PipelinePatches]:
+    """Patch every plan_from_issues stage; tests set the return values they need."""
+    with ExitStack() as stack:
+        yield PipelinePatches(*(stack.enter_context(patch(f"debussy.planners.command.{stage}")) for stage in _PIPELINE_STAGES))
+
+
+def _audit_summary(errors: int) -> AuditSummary:
+    """A one-phase audit summary with the given error count and no warnings."""
+    return AuditSummary(
+        master_plan="Plan",
+        phases_found=1,
+        phases_valid=1 - errors,
+        gates_total=0,
+        errors=errors,
+        warnings=0,
+    )
 
 
 # =============================================================================
@@ -107,30 +198,34 @@ class TestPlanFromIssuesResult:
 
     def test_default_values(self) -> None:
         """Test default values are set correctly."""
-        result = PlanFromIssuesResult()
-        assert result.success is False
-        assert result.files_created == []
-        assert result.audit_passed is False
-        assert result.audit_attempts == 0
-        assert result.issues_fetched == 0
-        assert result.gaps_found == 0
-        assert result.questions_asked == 0
-        assert result.error_message is None
+        assert asdict(PlanFromIssuesResult()) == {
+            "success": False,
+            "files_created": [],
+            "audit_passed": False,
+            "audit_attempts": 0,
+            "issues_fetched": 0,
+            "gaps_found": 0,
+            "questions_asked": 0,
+            "error_message": None,
+            "completed_features_found": 0,
+            "user_aborted": False,
+        }
 
     def test_custom_values(self) -> None:
         """Test custom values can be set."""
-        result = PlanFromIssuesResult(
-            success=True,
-            files_created=["MASTER_PLAN.md", "phase-1.md"],
-            audit_passed=True,
-            audit_attempts=2,
-            issues_fetched=5,
-            gaps_found=3,
-            questions_asked=2,
-        )
-        assert result.success is True
-        assert len(result.files_created) == 2
-        assert result.audit_attempts == 2
+        custom = {
+            "success": True,
+            "files_created": ["MASTER_PLAN.md", "phase-1.md"],
+            "audit_passed": True,
+            "audit_attempts": 2,
+            "issues_fetched": 5,
+            "gaps_found": 3,
+            "questions_asked": 2,
+        }
+
+        result = PlanFromIssuesResult(**custom)
+
+        assert asdict(result) == asdict(PlanFromIssuesResult()) | custom
 
 
 # =============================================================================
@@ -141,39 +236,30 @@ class TestPlanFromIssuesResult:
 class TestGetCurrentRepo:
     """Test the _get_current_repo function."""
 
-    def test_returns_none_on_failure(self) -> None:
-        """Test that function returns None when git command fails."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="error")
-            result = _get_current_repo()
-            assert result is None
-
-    def test_parses_ssh_url(self) -> None:
-        """Test parsing of SSH git URL."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="git@github.com:owner/repo.git\n",
-            )
-            result = _get_current_repo()
-            assert result == "owner/repo"
-
-    def test_parses_https_url(self) -> None:
-        """Test parsing of HTTPS git URL."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout="https://github.com/owner/repo.git\n",
-            )
-            result = _get_current_repo()
-            assert result == "owner/repo"
+    @pytest.mark.parametrize(
+        ("returncode", "stdout", "error", "expected"),
+        [
+            pytest.param(1, "", None, None, id="git-failure"),
+            pytest.param(0, "git@github.com:owner/repo.git\n", None, "owner/repo", id="ssh-url"),
+            pytest.param(0, "https://github.com/owner/repo.git\n", None, "owner/repo", id="https-url"),
+            pytest.param(0, "", Exception("timeout"), None, id="timeout"),
+        ],
+    )
+    def test_get_current_repo(
+        self,
+        patched_subprocess_run: MagicMock,
+        returncode: int,
+        stdout: str,
+        error: Exception | None,
+        expected: str | None,
+    ) -> None:
+        """Test remote URL parsing and that git failures yield None."""
+        if error is not None:
+            patched_subprocess_run.side_effect = error
+        else:
+            patched_subprocess_run.return_value = CompletedProcess(args=["git"], returncode=returncode, stdout=stdout, stderr="")
 
-    def test_handles_timeout(self) -> None:
-        """Test that timeout exception is handled."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("timeout")
-            result = _get_current_repo()
-            assert result is None
+        assert _get_current_repo() == expected
 
 
 # =============================================================================
@@ -184,36 +270,40 @@ class TestGetCurrentRepo:
 class TestFetchPhase:
     """Test the _fetch_phase function."""
 
-    def test_fetch_by_milestone(self, mock_console: Console, sample_issue_set: IssueSet) -> None:
-        """Test fetching issues by milestone."""
-        with patch("debussy.planners.command.asyncio.run") as mock_run:
-            mock_run.return_value = sample_issue_set
-
-            result = _fetch_phase(
-                repo="owner/repo",
-                milestone="v1.0",
-                labels=None,
-                console=mock_console,
-                verbose=False,
-            )
-
-            assert len(result.issues) == 1
-            mock_run.assert_called_once()
-
-    def test_fetch_by_labels(self, mock_console: Console, sample_issue_set: IssueSet) -> None:
-        """Test fetching issues by labels."""
-        with patch("debussy.planners.command.asyncio.run") as mock_run:
-            mock_run.return_value = sample_issue_set
-
-            result = _fetch_phase(
-                repo="owner/repo",
-                milestone=None,
-                labels=["feature", "auth"],
-                console=mock_console,
-                verbose=False,
-            )
+    @pytest.mark.parametrize(
+        ("milestone", "labels", "fetcher"),
+        [
+            pytest.param("v1.0", None, "fetch_issues_by_milestone", id="milestone"),
+            pytest.param(None, ["feature", "auth"], "fetch_issues_by_labels", id="labels"),
+        ],
+    )
+    def test_fetch(
+        self,
+        null_console: Console,
+        sample_issue_set: IssueSet,
+        milestone: str | None,
+        labels: list[str] | None,
+        fetcher: str,
+    ) -> None:
+        """Test that the matching fetcher's coroutine is handed to the runner."""
+        coroutines: list[Coroutine[Any, Any, IssueSet]] = []
+
+        def run(coro: Coroutine[Any, Any, IssueSet]) -> IssueSet:
+            coroutines.append(coro)
+            coro.close()
+            return sample_issue_set
+
+        result = _fetch_phase(
+            repo="owner/repo",
+            milestone=milestone,
+            labels=labels,
+            console=null_console,
+            verbose=False,
+            runner=run,
+        )
 
-            assert len(result.issues) == 1
+        assert len(result.issues) == 1
+        assert [coro.__name__ for coro in coroutines] == [fetcher]
 
 
 # =============================================================================
@@ -224,18 +314,17 @@ class TestFetchPhase:
 class TestAnalyzePhase:
     """Test the _analyze_phase function."""
 
-    def test_analyze_returns_report(self, mock_console: Console, sample_issue_set: IssueSet) -> None:
+    def test_analyze_returns_report(self, null_console: Console, sample_issue_set: IssueSet) -> None:
         """Test that analyze phase returns an analysis report."""
-        report = _analyze_phase(sample_issue_set, mock_console, verbose=False)
+        report = _analyze_phase(sample_issue_set, null_console, verbose=False)
 
         assert len(report.issues) == 1
         # Sample issue has good structure, so should have some score
         assert report.average_score > 0
 
-    def test_analyze_empty_set(self, mock_console: Console) -> None:
+    def test_analyze_empty_set(self, null_console: Console) -> None:
         """Test analyzing an empty issue set."""
-        empty_set = IssueSet(issues=[])
-        report = _analyze_phase(empty_set, mock_console, verbose=False)
+        report = _analyze_phase(EMPTY_ISSUE_SET, null_console, verbose=False)
 
         assert len(report.issues) == 0
         assert report.total_gaps == 0
@@ -251,23 +340,14 @@ class TestGeneratePhase:
 
     def test_generate_creates_files(
         self,
-        mock_console: Console,
+        null_console: Console,
         sample_issue_set: IssueSet,
         tmp_path: Path,
     ) -> None:
         """Test that generate phase creates plan files."""
-        from debussy.planners.analyzer import AnalysisReport
-
         mock_analysis = AnalysisReport(issues=[])
 
-        with patch("debussy.planners.plan_builder.PlanBuilder") as mock_builder:
-            mock_instance = MagicMock()
-            mock_instance.generate_all.return_value = {
-                "MASTER_PLAN.md": "# Master Plan",
-                "phase-1.md": "# Phase 1",
-            }
-            mock_builder.return_value = mock_instance
-
+        with patch("debussy.planners.plan_builder.PlanBuilder", _StubBuilder):
             output_dir = tmp_path / "plans"
             files = _generate_phase(
                 issues=sample_issue_set,
@@ -276,7 +356,7 @@ class TestGeneratePhase:
                 output_dir=output_dir,
                 model="haiku",
                 timeout=120,
-                console=mock_console,
+                console=null_console,
                 verbose=False,
             )
 
@@ -295,77 +375,73 @@ class TestAuditLoop:
 
     def test_audit_passes_first_try(
         self,
-        mock_console: Console,
-        mock_audit_result_pass: MagicMock,
-        tmp_path: Path,
+        null_console: Console,
+        mock_audit_result_pass: AuditResult,
+        plans_dir: Path,
     ) -> None:
         """Test audit loop passes on first attempt."""
-        output_dir = tmp_path / "plans"
-        output_dir.mkdir()
-        (output_dir / "MASTER_PLAN.md").write_text("# Plan")
-
-        with patch("debussy.planners.command._run_audit") as mock_run_audit:
-            mock_run_audit.return_value = mock_audit_result_pass
-
-            passed, attempts = _audit_loop(
-                output_dir=output_dir,
-                max_retries=3,
-                console=mock_console,
-                verbose=False,
-            )
+        regenerated: list[list[str]] = []
+
+        passed, attempts = _audit_loop(
+            output_dir=plans_dir,
+            max_retries=3,
+            console=null_console,
+            verbose=False,
+            audit=lambda _path: mock_audit_result_pass,
+            regenerate=lambda _dir, errors, _console, _verbose: regenerated.append(errors),
+        )
 
-            assert passed is True
-            assert attempts == 1
+        assert passed is True
+        assert attempts == 1
+        assert regenerated == []
 
     def test_audit_fails_all_retries(
         self,
-        mock_console: Console,
-        mock_audit_result_fail: MagicMock,
-        tmp_path: Path,
+        null_console: Console,
+        mock_audit_result_fail: AuditResult,
+        plans_dir: Path,
     ) -> None:
         """Test audit loop fails after all retries."""
-        output_dir = tmp_path / "plans"
-        output_dir.mkdir()
-        (output_dir / "MASTER_PLAN.md").write_text("# Plan")
-
-        with patch("debussy.planners.command._run_audit") as mock_run_audit, patch("debussy.planners.command._regenerate_with_errors"):
-            mock_run_audit.return_value = mock_audit_result_fail
-
-            passed, attempts = _audit_loop(
-                output_dir=output_dir,
-                max_retries=3,
-                console=mock_console,
-                verbose=False,
-            )
+        regenerated: list[list[str]] = []
+
+        passed, attempts = _audit_loop(
+            output_dir=plans_dir,
+            max_retries=3,
+            console=null_console,
+            verbose=False,
+            audit=lambda _path: mock_audit_result_fail,
+            regenerate=lambda _dir, errors, _console, _verbose: regenerated.append(errors),
+        )
 
-            assert passed is False
-            assert attempts == 3
+        assert passed is False
+        assert attempts == 3
+        # No regeneration after the final attempt
+        assert len(regenerated) == 2
 
     def test_audit_succeeds_on_retry(
         self,
-        mock_console: Console,
-        mock_audit_result_pass: MagicMock,
-        mock_audit_result_fail: MagicMock,
-        tmp_path: Path,
+        null_console: Console,
+        mock_audit_result_pass: AuditResult,
+        mock_audit_result_fail: AuditResult,
+        plans_dir: Path,
     ) -> None:
         """Test audit passes on second try after regeneration."""
-        output_dir = tmp_path / "plans"
-        output_dir.mkdir()
-        (output_dir / "MASTER_PLAN.md").write_text("# Plan")
-
-        with patch("debussy.planners.command._run_audit") as mock_run_audit, patch("debussy.planners.command._regenerate_with_errors"):
-            # First call fails, second succeeds
-            mock_run_audit.side_effect = [mock_audit_result_fail, mock_audit_result_pass]
-
-            passed, attempts = _audit_loop(
-                output_dir=output_dir,
-                max_retries=3,
-                console=mock_console,
-                verbose=False,
-            )
+        # First call fails, second succeeds
+        results = iter([mock_audit_result_fail, mock_audit_result_pass])
+        regenerated: list[list[str]] = []
+
+        passed, attempts = _audit_loop(
+            output_dir=plans_dir,
+            max_retries=3,
+            console=null_console,
+            verbose=False,
+            audit=lambda _path: next(results),
+            regenerate=lambda _dir, errors, _console, _verbose: regenerated.append(errors),
+        )
 
-            assert passed is True
-            assert attempts == 2
+        assert passed is True
+        assert attempts == 2
+        assert regenerated == [_get_audit_errors(mock_audit_result_fail)]
 
 
 # =============================================================================
@@ -376,7 +452,7 @@ class TestAuditLoop:
 class TestGetAuditErrors:
     """Test the _get_audit_errors function."""
 
-    def test_extracts_error_messages(self, mock_audit_result_fail: MagicMock) -> None:
+    def test_extracts_error_messages(self, mock_audit_result_fail: AuditResult) -> None:
         """Test that error messages are extracted correctly."""
         errors = _get_audit_errors(mock_audit_result_fail)
 
@@ -384,7 +460,7 @@ class TestGetAuditErrors:
         assert "MISSING_GATES" in errors[0]
         assert "Phase 1" in errors[0]
 
-    def test_empty_list_on_pass(self, mock_audit_result_pass: MagicMock) -> None:
+    def test_empty_list_on_pass(self, mock_audit_result_pass: AuditResult) -> None:
         """Test that passing audit returns empty list."""
         errors = _get_audit_errors(mock_audit_result_pass)
         assert errors == []
@@ -424,10 +500,8 @@ class TestPlanFromIssues:
 
     def test_no_issues_found(self, mock_console: Console) -> None:
         """Test handling when no issues are found."""
-        empty_set = IssueSet(issues=[])
-
         with patch("debussy.planners.command._fetch_phase") as mock_fetch:
-            mock_fetch.return_value = empty_set
+            mock_fetch.return_value = EMPTY_ISSUE_SET
 
             result = plan_from_issues(
                 source="gh",
@@ -442,72 +516,58 @@ class TestPlanFromIssues:
     def test_skip_qa_flag(
         self,
         mock_console: Console,
+        patched_pipeline: PipelinePatches,
         sample_issue_set: IssueSet,
-        tmp_path: Path,
+        plans_dir: Path,
     ) -> None:
         """Test that --skip-qa skips the Q&A phase."""
-        from debussy.planners.analyzer import AnalysisReport, IssueQuality
-
         mock_analysis = AnalysisReport(issues=[IssueQuality(issue_number=1, score=50, gaps=[])])
 
-        with (
-            patch("debussy.planners.command._fetch_phase") as mock_fetch,
-            patch("debussy.planners.command._analyze_phase") as mock_analyze,
-            patch("debussy.planners.command._generate_phase") as mock_generate,
-            patch("debussy.planners.command._audit_loop") as mock_audit,
-        ):
-            mock_fetch.return_value = sample_issue_set
-            mock_analyze.return_value = mock_analysis
-            mock_generate.return_value = ["MASTER_PLAN.md"]
-            mock_audit.return_value = (True, 1)
+        patched_pipeline.fetch.return_value = sample_issue_set
+        patched_pipeline.analyze.return_value = mock_analysis
+        patched_pipeline.generate.return_value = ["MASTER_PLAN.md"]
+        patched_pipeline.audit.return_value = (True, 1)
 
-            result = plan_from_issues(
-                source="gh",
-                repo="owner/repo",
-                milestone="v1.0",
-                skip_qa=True,
-                output_dir=tmp_path / "plans",
-                console=mock_console,
-            )
+        result = plan_from_issues(
+            source="gh",
+            repo="owner/repo",
+            milestone="v1.0",
+            skip_qa=True,
+            output_dir=plans_dir,
+            console=mock_console,
+        )
 
-            assert result.success is True
-            assert result.questions_asked == 0
+        assert result.success is True
+        assert result.questions_asked == 0
 
     def test_full_pipeline_success(
         self,
         mock_console: Console,
+        patched_pipeline: PipelinePatches,
         sample_issue_set: IssueSet,
-        tmp_path: Path,
+        plans_dir: Path,
     ) -> None:
         """Test successful full pipeline execution."""
-        from debussy.planners.analyzer import AnalysisReport, IssueQuality
-
         mock_analysis = AnalysisReport(issues=[IssueQuality(issue_number=1, score=80, gaps=[])])
 
-        with (
-            patch("debussy.planners.command._fetch_phase") as mock_fetch,
-            patch("debussy.planners.command._analyze_phase") as mock_analyze,
-            patch("debussy.planners.command._generate_phase") as mock_generate,
-            patch("debussy.planners.command._audit_loop") as mock_audit,
-        ):
-            mock_fetch.return_value = sample_issue_set
-            mock_analyze.return_value = mock_analysis
-            mock_generate.return_value = ["MASTER_PLAN.md", "phase-1.md"]
-            mock_audit.return_value = (True, 1)
+        patched_pipeline.fetch.return_value = sample_issue_set
+        patched_pipeline.analyze.return_value = mock_analysis
+        patched_pipeline.generate.return_value = ["MASTER_PLAN.md", "phase-1.md"]
+        patched_pipeline.audit.return_value = (True, 1)
 
-            result = plan_from_issues(
-                source="gh",
-                repo="owner/repo",
-                milestone="v1.0",
-                skip_qa=True,
-                output_dir=tmp_path / "plans",
-                console=mock_console,
-            )
+        result = plan_from_issues(
+            source="gh",
+            repo="owner/repo",
+            milestone="v1.0",
+            skip_qa=True,
+            output_dir=plans_dir,
+            console=mock_console,
+        )
 
-            assert result.success is True
-            assert result.issues_fetched == 1
-            assert len(result.files_created) == 2
-            assert result.audit_passed is True
+        assert result.success is True
+        assert result.issues_fetched == 1
+        assert len(result.files_created) == 2
+        assert result.audit_passed is True
 
 
 # =============================================================================
@@ -515,22 +575,26 @@ class TestPlanFromIssues:
 # =============================================================================
 
 
-class TestCLIIntegration:
-    """Test CLI command integration."""
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """A Typer test runner shared by the CLI tests."""
+    return CliRunner()
 
-    def test_cli_help(self) -> None:
-        """Test that CLI shows help for plan-from-issues command."""
-        import re
 
-        from typer.testing import CliRunner
+@pytest.fixture(scope="session")
+def cli_app() -> typer.Typer:
+    """The debussy Typer application."""
+    return app
 
-        from debussy.cli import app
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["plan-from-issues", "--help"])
+class TestCLIIntegration:
+    """Test CLI command integration."""
 
+    def test_cli_help(self, cli_help: Callable[[str], Result]) -> None:
+        """Test that CLI shows help for plan-from-issues command."""
+        result = cli_help("plan-from-issues")
         # Strip ANSI codes for reliable string matching
-        output = re.sub(r"\x1b\[[0-9;]*m", "", result.output)
+        output = _ANSI_RE.sub("", result.output)
 
         assert result.exit_code == 0
         assert "plan-from-issues" in output.lower() or "issues" in output.lower()
@@ -538,28 +602,19 @@ class TestCLIIntegration:
         assert "--milestone" in output
         assert "--label" in output
 
-    def test_cli_invalid_source(self) -> None:
-        """Test CLI rejects invalid source."""
-        from typer.testing import CliRunner
-
-        from debussy.cli import app
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["plan-from-issues", "--source", "invalid"])
-
-        assert result.exit_code == 1
-
-    def test_cli_jira_not_implemented(self) -> None:
-        """Test CLI shows error for jira source."""
-        from typer.testing import CliRunner
-
-        from debussy.cli import app
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["plan-from-issues", "--source", "jira"])
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            pytest.param("invalid", "invalid source", id="unknown-source"),
+            pytest.param("jira", "not yet implemented", id="jira"),
+        ],
+    )
+    def test_cli_rejects_source(self, cli_runner: CliRunner, cli_app: typer.Typer, source: str, expected: str) -> None:
+        """Test CLI exits with an error for unknown and unimplemented sources."""
+        result = cli_runner.invoke(cli_app, ["plan-from-issues", "--source", source])
 
         assert result.exit_code == 1
-        assert "not" in result.output.lower() or "implement" in result.output.lower()
+        assert expected in result.output.lower()
 
 
 # =============================================================================
@@ -591,15 +646,9 @@ class TestEdgeCases:
         tmp_path: Path,
     ) -> None:
         """Test that output directory is created if it doesn't exist."""
-        from debussy.planners.analyzer import AnalysisReport
-
         mock_analysis = AnalysisReport(issues=[])
 
-        with patch("debussy.planners.plan_builder.PlanBuilder") as mock_builder:
-            mock_instance = MagicMock()
-            mock_instance.generate_all.return_value = {"MASTER_PLAN.md": "# Plan"}
-            mock_builder.return_value = mock_instance
-
+        with patch("debussy.planners.plan_builder.PlanBuilder", _StubBuilder):
             output_dir = tmp_path / "new" / "nested" / "path"
             assert not output_dir.exists()
 
@@ -619,37 +668,30 @@ class TestEdgeCases:
     def test_default_output_dir_from_milestone(
         self,
         mock_console: Console,
+        patched_pipeline: PipelinePatches,
         sample_issue_set: IssueSet,
     ) -> None:
         """Test that output directory is derived from milestone."""
-        from debussy.planners.analyzer import AnalysisReport, IssueQuality
-
         mock_analysis = AnalysisReport(issues=[IssueQuality(issue_number=1, score=80, gaps=[])])
 
-        with (
-            patch("debussy.planners.command._fetch_phase") as mock_fetch,
-            patch("debussy.planners.command._analyze_phase") as mock_analyze,
-            patch("debussy.planners.command._generate_phase") as mock_generate,
-            patch("debussy.planners.command._audit_loop") as mock_audit,
-        ):
-            mock_fetch.return_value = sample_issue_set
-            mock_analyze.return_value = mock_analysis
-            mock_generate.return_value = []
-            mock_audit.return_value = (True, 1)
-
-            # Don't specify output_dir, milestone is "v2.0"
-            plan_from_issues(
-                source="gh",
-                repo="owner/repo",
-                milestone="v2.0",
-                skip_qa=True,
-                output_dir=None,  # Let it derive from milestone
-                console=mock_console,
-            )
+        patched_pipeline.fetch.return_value = sample_issue_set
+        patched_pipeline.analyze.return_value = mock_analysis
+        patched_pipeline.generate.return_value = []
+        patched_pipeline.audit.return_value = (True, 1)
+
+        # Don't specify output_dir, milestone is "v2.0"
+        plan_from_issues(
+            source="gh",
+            repo="owner/repo",
+            milestone="v2.0",
+            skip_qa=True,
+            output_dir=None,  # Let it derive from milestone
+            console=mock_console,
+        )
 
-            # Check that _generate_phase was called with derived path
-            call_args = mock_generate.call_args
-            assert call_args is not None
-            # output_dir is the 4th positional argument (index 3)
-            output_dir_arg = call_args[0][3]
-            assert "v2.0" in str(output_dir_arg).lower()
+        # Check that _generate_phase was called with derived path
+        call_args = patched_pipeline.generate.call_args
+        assert call_args is not None
+        # output_dir is the 4th positional argument (index 3)
+        output_dir_arg = call_args[0][3]
+        assert "v2.0" in str(output_dir_arg).lower()
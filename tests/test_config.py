@@ -0,0 +1,78 @@
+"""Tests for loading and saving the Debussy configuration."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from debussy.config import Config, _read_yaml
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> None:
+    """Start each test with an empty parsed-config cache."""
+    _read_yaml.cache_clear()
+
+
+class TestConfigLoad:
+    """Tests for Config.load()."""
+
+    def test_missing_file_uses_defaults(self, tmp_path: Path) -> None:
+        """A missing config file should yield the default configuration."""
+        config = Config.load(tmp_path / "config.yaml")
+
+        assert config == Config()
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Values written by save() should be read back by load()."""
+        config_path = tmp_path / ".debussy" / "config.yaml"
+        Config(max_retries=5, model="sonnet").save(config_path)
+
+        config = Config.load(config_path)
+
+        assert config.max_retries == 5
+        assert config.model == "sonnet"
+
+    def test_empty_file_uses_defaults(self, tmp_path: Path) -> None:
+        """An empty YAML file should not fail validation."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("")
+
+        assert Config.load(config_path) == Config()
+
+    def test_unchanged_file_parsed_once(self, tmp_path: Path) -> None:
+        """Repeated loads of an unchanged file should reuse the parsed YAML."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("max_retries: 4\n")
+
+        Config.load(config_path)
+        Config.load(config_path)
+
+        assert _read_yaml.cache_info().misses == 1
+        assert _read_yaml.cache_info().hits == 1
+
+    def test_changed_file_reparsed(self, tmp_path: Path) -> None:
+        """Editing the config file should be picked up by the next load."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("max_retries: 4\n")
+        assert Config.load(config_path).max_retries == 4
+
+        config_path.write_text("max_retries: 7\ntimeout: 60\n")
+
+        config = Config.load(config_path)
+        assert config.max_retries == 7
+        assert config.timeout == 60
+
+
+class TestConfigImport:
+    """PyYAML is only loaded when a config file is actually read or written."""
+
+    def test_import_does_not_load_yaml(self) -> None:
+        """Importing debussy.config should not import yaml."""
+        code = "import sys, debussy.config; print('yaml' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
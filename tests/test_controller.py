@@ -10,7 +10,7 @@ from unittest.mock import MagicMock, Mock
 import pytest
 
 from debussy.ui.base import UIState, UserAction
-from debussy.ui.controller import OrchestrationController
+from debussy.ui.controller import _ACTION_QUEUE_MAX, OrchestrationController
 from debussy.ui.messages import (
     HUDMessageSet,
     LogMessage,
@@ -315,6 +315,15 @@ class TestUserActions:
 
         assert len(controller._action_queue) == 0
 
+    def test_action_queue_bounded(self, controller: OrchestrationController) -> None:
+        """Unconsumed actions beyond the bound should drop the oldest."""
+        controller.queue_action(UserAction.SKIP)
+        for _ in range(_ACTION_QUEUE_MAX):
+            controller.queue_action(UserAction.PAUSE)
+
+        assert len(controller._action_queue) == _ACTION_QUEUE_MAX
+        assert UserAction.SKIP not in controller._action_queue
+
 
 class TestVerboseToggle:
     """Test verbose mode toggling."""
@@ -400,6 +409,22 @@ class TestLogging:
         assert msg.message == "test message"
         assert msg.raw is False
 
+    def test_log_message_dropped_when_not_verbose(self, controller: OrchestrationController, mock_app: MagicMock) -> None:
+        """log_message() should not post anything when verbose is off."""
+        controller.context.verbose = False
+
+        controller.log_message("debug noise")
+
+        assert mock_app.posted_messages == []
+
+    def test_log_message_raw_emits_when_not_verbose(self, controller: OrchestrationController, mock_app: MagicMock) -> None:
+        """log_message_raw() should still post when verbose is off."""
+        controller.context.verbose = False
+
+        controller.log_message_raw("important message")
+
+        assert len(mock_app.posted_messages) == 1
+
     def test_log_message_raw_emits_raw(self, controller: OrchestrationController, mock_app: MagicMock) -> None:
         """log_message_raw() should emit LogMessage with raw=True."""
         controller.log_message_raw("important message")
@@ -447,6 +472,14 @@ class TestStatus:
         log_msgs = [m for m in mock_app.posted_messages if isinstance(m, LogMessage)]
         assert all(m.raw is True for m in log_msgs)
 
+    def test_show_status_popup_single_message(self, controller: OrchestrationController, mock_app: MagicMock) -> None:
+        """show_status_popup() should post one message regardless of detail count."""
+        controller.show_status_popup({"Phase": "Setup", "Progress": "50%", "State": "running"})
+
+        log_msgs = [m for m in mock_app.posted_messages if isinstance(m, LogMessage)]
+        assert len(log_msgs) == 1
+        assert log_msgs[0].message.splitlines() == ["[bold]Current Status[/bold]", "  Phase: Setup", "  Progress: 50%", "  State: running"]
+
     def test_confirm_returns_true(self, controller: OrchestrationController) -> None:
         """confirm() should always return True (auto-confirm)."""
         result = controller.confirm("Proceed?")
@@ -765,6 +798,7 @@ class TestTUIMessageHandlers:
             app.on_orchestration_started(message)
 
         assert mock_header.phase_info == "0/5: Starting..."
+        assert mock_header.status_tuple == ("Running", "green")
 
     def test_on_phase_changed_updates_hud(self) -> None:
         """on_phase_changed() should update HUD with phase info."""
@@ -801,8 +835,7 @@ class TestTUIMessageHandlers:
             message = StateChanged(UIState.RUNNING)
             app.on_state_changed(message)
 
-        assert mock_header.status == "Running"
-        assert mock_header.status_style == "green"
+        assert mock_header.status_tuple == ("Running", "green")
 
     def test_on_state_changed_updates_hud_paused(self) -> None:
         """on_state_changed() should update HUD status for PAUSED state."""
@@ -818,8 +851,7 @@ class TestTUIMessageHandlers:
             message = StateChanged(UIState.PAUSED)
             app.on_state_changed(message)
 
-        assert mock_header.status == "Paused"
-        assert mock_header.status_style == "yellow"
+        assert mock_header.status_tuple == ("Paused", "yellow")
 
     def test_on_token_stats_updated_updates_hud(self) -> None:
         """on_token_stats_updated() should update HUD token display."""
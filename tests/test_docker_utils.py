@@ -0,0 +1,100 @@
+"""Tests for docker utility functions."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from debussy.utils import docker
+from debussy.utils.docker import get_docker_command, is_docker_available, normalize_path_for_docker
+
+
+@pytest.fixture(autouse=True)
+def clear_docker_caches() -> Iterator[None]:
+    """Reset the cached PATH lookups around each test."""
+    docker._which_docker.cache_clear()
+    docker._docker_command.cache_clear()
+    yield
+    docker._which_docker.cache_clear()
+    docker._docker_command.cache_clear()
+
+
+class TestGetDockerCommand:
+    """Tests for get_docker_command function."""
+
+    def test_native_docker(self) -> None:
+        """Native docker on PATH is used directly."""
+        with patch("debussy.utils.docker.shutil.which", return_value="/usr/bin/docker"):
+            assert get_docker_command() == ["docker"]
+
+    def test_windows_falls_back_to_wsl(self) -> None:
+        """Windows without native docker goes through WSL."""
+        with (
+            patch("debussy.utils.docker._IS_WINDOWS", True),
+            patch("debussy.utils.docker.shutil.which", side_effect=lambda name: "C:\\wsl.exe" if name == "wsl" else None),
+        ):
+            assert get_docker_command() == ["wsl", "docker"]
+
+    @patch("debussy.utils.docker.shutil.which", return_value="/usr/bin/docker")
+    def test_path_lookup_cached(self, mock_which: MagicMock) -> None:
+        """Repeated calls should not walk PATH again."""
+        get_docker_command()
+        get_docker_command()
+
+        mock_which.assert_called_once_with("docker")
+
+    def test_returns_fresh_list(self) -> None:
+        """Callers mutating the result must not affect later calls."""
+        with patch("debussy.utils.docker.shutil.which", return_value="/usr/bin/docker"):
+            get_docker_command().append("info")
+
+            assert get_docker_command() == ["docker"]
+
+
+class TestIsDockerAvailable:
+    """Tests for is_docker_available function."""
+
+    def test_false_without_docker(self) -> None:
+        """Missing docker binary short-circuits before running docker info."""
+        with (
+            patch("debussy.utils.docker._IS_WINDOWS", False),
+            patch("debussy.utils.docker.shutil.which", return_value=None),
+            patch("debussy.utils.docker.subprocess.run") as mock_run,
+        ):
+            assert is_docker_available() is False
+
+        mock_run.assert_not_called()
+
+    @patch("debussy.utils.docker.shutil.which", return_value="/usr/bin/docker")
+    def test_true_when_daemon_running(self, mock_which: MagicMock) -> None:
+        """A successful docker info means the daemon is available."""
+        with patch("debussy.utils.docker.subprocess.run", return_value=MagicMock(returncode=0)):
+            assert is_docker_available() is True
+
+        mock_which.assert_called_once_with("docker")
+
+
+class TestNormalizePathForDocker:
+    """Tests for normalize_path_for_docker function."""
+
+    def test_unix_path_unchanged(self) -> None:
+        """On Unix the path is returned as-is without resolving."""
+        path = MagicMock(spec=Path)
+        path.__str__.return_value = "/home/user/foo"
+
+        with patch("debussy.utils.docker._IS_WINDOWS", False):
+            assert normalize_path_for_docker(path) == "/home/user/foo"
+
+        path.resolve.assert_not_called()
+
+    def test_windows_drive_path(self) -> None:
+        """Windows drive paths map to /c/... or /mnt/c/... for WSL."""
+        path = MagicMock(spec=Path)
+        path.resolve.return_value = "C:\\Projects\\foo"
+
+        with patch("debussy.utils.docker._IS_WINDOWS", True):
+            assert normalize_path_for_docker(path) == "/c/Projects/foo"
+            assert normalize_path_for_docker(path, use_wsl=True) == "/mnt/c/Projects/foo"
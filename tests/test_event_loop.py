@@ -0,0 +1,41 @@
+"""Unit tests for event loop selection."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+from debussy.utils.event_loop import new_event_loop
+
+
+class TestNewEventLoop:
+    """Test new_event_loop() selection and fallback."""
+
+    def test_falls_back_without_uvloop(self) -> None:
+        """The stock asyncio loop should be used when uvloop is not importable."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            loop = new_event_loop()
+        try:
+            assert type(loop).__module__.startswith("asyncio")
+        finally:
+            loop.close()
+
+    def test_windows_skips_uvloop(self) -> None:
+        """uvloop should never be imported on Windows."""
+        with (
+            patch("debussy.utils.event_loop.sys.platform", "win32"),
+            patch.dict(sys.modules, {"uvloop": None}),
+            patch("debussy.utils.event_loop.asyncio.new_event_loop") as mock_new,
+        ):
+            new_event_loop()
+
+        mock_new.assert_called_once()
+
+    def test_loop_runs_coroutines(self) -> None:
+        """The returned loop should be usable with asyncio.run()."""
+
+        async def answer() -> int:
+            return 42
+
+        assert asyncio.run(answer(), loop_factory=new_event_loop) == 42
@@ -11,6 +11,7 @@ from debussy.utils.git import (
     check_working_directory,
     get_git_status,
     parse_git_status_output,
+    parse_git_status_z,
 )
 
 
@@ -134,6 +135,43 @@ D  removed.py
         assert result.is_clean is True
 
 
+class TestParseGitStatusZ:
+    """Tests for parse_git_status_z (NUL-terminated porcelain v1)."""
+
+    def test_empty_output_returns_clean(self) -> None:
+        """Empty output indicates clean working directory."""
+        result = parse_git_status_z(b"")
+        assert result.untracked == []
+        assert result.modified == []
+
+    def test_untracked_and_modified(self) -> None:
+        """Records are categorized by their XY prefix."""
+        result = parse_git_status_z(b"?? temp.txt\0 M src/main.py\0M  staged.py\0")
+        assert result.untracked == ["temp.txt"]
+        assert result.modified == ["src/main.py", "staged.py"]
+
+    def test_renamed_file_consumes_source_record(self) -> None:
+        """A rename's source path record is skipped, keeping the new path."""
+        result = parse_git_status_z(b"R  new_name.py\0old_name.py\0 M other.py\0")
+        assert result.modified == ["new_name.py", "other.py"]
+
+    def test_copied_file_consumes_source_record(self) -> None:
+        """A copy's source path record is skipped, keeping the copy path."""
+        result = parse_git_status_z(b"C  copy.py\0original.py\0")
+        assert result.modified == ["copy.py"]
+
+    def test_paths_with_spaces_and_arrows_unquoted(self) -> None:
+        """-z paths are raw, so spaces and ' -> ' are kept verbatim."""
+        result = parse_git_status_z(b" M my file.py\0?? a -> b.txt\0")
+        assert result.modified == ["my file.py"]
+        assert result.untracked == ["a -> b.txt"]
+
+    def test_non_utf8_path_decoded_with_fs_encoding(self) -> None:
+        """Undecodable bytes in a path do not raise."""
+        result = parse_git_status_z(b"?? caf\xe9.txt\0")
+        assert len(result.untracked) == 1
+
+
 class TestGitStatusResult:
     """Tests for GitStatusResult dataclass properties."""
 
@@ -170,9 +208,9 @@ class TestGetGitStatus:
     def test_returns_parsed_result_on_success(self, mock_run: patch) -> None:
         """Successful git status returns parsed result."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["git", "status", "--porcelain"],
+            args=["git", "status", "--porcelain=v1", "-z"],
             returncode=0,
-            stdout="?? untracked.txt\n M modified.py\n",
+            stdout=b"?? untracked.txt\0 M modified.py\0",
             stderr="",
         )
 
@@ -187,9 +225,9 @@ class TestGetGitStatus:
     def test_returns_none_on_non_zero_exit(self, mock_run: patch) -> None:
         """Non-zero exit code (not a git repo) returns None."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["git", "status", "--porcelain"],
+            args=["git", "status", "--porcelain=v1", "-z"],
             returncode=128,
-            stdout="",
+            stdout=b"",
             stderr="fatal: not a git repository",
         )
 
@@ -216,9 +254,9 @@ class TestGetGitStatus:
     def test_uses_provided_project_root(self, mock_run: patch) -> None:
         """Uses specified project_root as cwd."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["git", "status", "--porcelain"],
+            args=["git", "status", "--porcelain=v1", "-z"],
             returncode=0,
-            stdout="",
+            stdout=b"",
             stderr="",
         )
 
@@ -317,9 +355,9 @@ class TestGitDirtyCheckIntegration:
     def test_full_flow_clean_repo(self, mock_run: patch) -> None:
         """Clean repository reports as clean."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["git", "status", "--porcelain"],
+            args=["git", "status", "--porcelain=v1", "-z"],
             returncode=0,
-            stdout="",
+            stdout=b"",
             stderr="",
         )
 
@@ -333,13 +371,9 @@ class TestGitDirtyCheckIntegration:
     def test_full_flow_untracked_only(self, mock_run: patch) -> None:
         """Only untracked files does not block."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["git", "status", "--porcelain"],
+            args=["git", "status", "--porcelain=v1", "-z"],
             returncode=0,
-            stdout="""\
-?? notes/session.md
-?? .debussy/
-?? scratch.py
-""",
+            stdout=b"?? notes/session.md\0?? .debussy/\0?? scratch.py\0",
             stderr="",
         )
 
@@ -354,13 +388,9 @@ class TestGitDirtyCheckIntegration:
     def test_full_flow_modified_tracked(self, mock_run: patch) -> None:
         """Modified tracked files trigger dirty warning."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["git", "status", "--porcelain"],
+            args=["git", "status", "--porcelain=v1", "-z"],
             returncode=0,
-            stdout="""\
- M src/debussy/cli.py
-M  tests/test_cli.py
-?? notes/temp.md
-""",
+            stdout=b" M src/debussy/cli.py\0M  tests/test_cli.py\0?? notes/temp.md\0",
             stderr="",
         )
 
@@ -374,18 +404,22 @@ M  tests/test_cli.py
     def test_full_flow_mixed_state(self, mock_run: patch) -> None:
         """Mix of staged, modified, deleted, untracked."""
         mock_run.return_value = subprocess.CompletedProcess(
-            args=["git", "status", "--porcelain"],
+            args=["git", "status", "--porcelain=v1", "-z"],
             returncode=0,
-            stdout="""\
-?? notes/
-?? .coverage
-M  staged_file.py
- M unstaged_change.py
-MM staged_and_changed.py
-D  deleted_file.py
-A  new_staged.py
-R  old_name.py -> renamed.py
-""",
+            stdout=b"\0".join(
+                [
+                    b"?? notes/",
+                    b"?? .coverage",
+                    b"M  staged_file.py",
+                    b" M unstaged_change.py",
+                    b"MM staged_and_changed.py",
+                    b"D  deleted_file.py",
+                    b"A  new_staged.py",
+                    b"R  renamed.py",
+                    b"old_name.py",
+                    b"",
+                ]
+            ),
             stderr="",
         )
 
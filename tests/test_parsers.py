@@ -143,6 +143,52 @@ class TestParserEdgeCases:
         plan = parse_master_plan(plan_path)
         assert len(plan.phases) == 0
 
+    def test_parse_phase_rows_among_other_tables(self, temp_dir: Path) -> None:
+        """Only complete phase rows are parsed; other tables and short rows are skipped."""
+        plan_content = """\
+# Mixed Plan
+
+| Key | Value |
+|-----|-------|
+| 9 | not a phase |
+
+## Phases
+
+| Phase | Title | Focus | Risk | Status |
+|-------|-------|-------|------|--------|
+| 1 | [Setup](phase-1.md) | Base | Low | Completed |
+| 2 | [Short row](phase-2.md) |
+| 3.1 | [Decimal](phase-3-1.md) | More | High | Pending |
+"""
+        plan_path = temp_dir / "mixed-master.md"
+        plan_path.write_text(plan_content)
+
+        plan = parse_master_plan(plan_path)
+
+        assert [p.id for p in plan.phases] == ["1", "3.1"]
+        assert plan.phases[0].status == PhaseStatus.COMPLETED
+        assert plan.phases[1].path == temp_dir / "phase-3-1.md"
+
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("**Depends On:** Phase 1, Phase 2", ["1", "2"]),
+            ("**Depends On:** [Phase 99](phase-99.md)", ["99"]),
+            ("**Depends On:** Phase 3.1 (state model)", ["3.1"]),
+            ("**Depends On:** N/A", []),
+            ("**Depends On:** None (first phase)", []),
+            ("**Depends On:**", []),
+        ],
+    )
+    def test_parse_depends_on_field(self, temp_dir: Path, field: str, expected: list[str]) -> None:
+        """The **Depends On:** header field yields the referenced phase IDs."""
+        phase_path = temp_dir / "phase-5.md"
+        phase_path.write_text(f"# Phase 5: Deps\n\n**Status:** Pending\n{field}\n\n## Tasks\n")
+
+        phase = parse_phase(phase_path)
+
+        assert sorted(phase.depends_on) == expected
+
     def test_parse_phase_no_gates(self, temp_dir: Path) -> None:
         """Test parsing a phase with no gates section."""
         phase_content = """\
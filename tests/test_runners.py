@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -14,8 +17,9 @@ from debussy.core.models import (
     Phase,
     PhaseStatus,
 )
-from debussy.runners.claude import ClaudeRunner
+from debussy.runners.claude import _STDOUT_FLUSH_BYTES, ClaudeRunner
 from debussy.runners.gates import GateRunner
+from debussy.runners.prompt_builder import _render_phase_prompt
 
 
 @pytest.fixture
@@ -366,7 +370,7 @@ class TestClaudeRunnerPrompts:
 
         assert "Execute the implementation phase" in prompt
         assert "test.md" in prompt
-        assert "debussy done --phase 1" in prompt
+        assert "debussy-worker done --phase 1" in prompt
 
     def test_build_phase_prompt_with_agents(
         self,
@@ -403,6 +407,34 @@ class TestClaudeRunnerPrompts:
         assert "Previous Phase Notes" in prompt
         assert "NOTES_phase_0.md" in prompt
 
+    def test_build_phase_prompt_notes_input_appears_once_written(
+        self,
+        claude_runner: ClaudeRunner,
+        temp_dir: Path,
+    ) -> None:
+        """Prompt caching must not hide notes written after the first build."""
+        notes_file = temp_dir / "NOTES_phase_1.md"
+        phase = Phase(id="2", title="Two", path=Path("docs/phase2.md"), status=PhaseStatus.PENDING, notes_input=notes_file)
+
+        before = claude_runner._build_phase_prompt(phase)
+        notes_file.write_text("Previous phase notes")
+        after = claude_runner._build_phase_prompt(phase)
+
+        assert "Previous Phase Notes" not in before
+        assert "Previous Phase Notes" in after
+
+    def test_build_phase_prompt_reuses_rendered_prompt(
+        self,
+        claude_runner: ClaudeRunner,
+        phase_for_prompt: Phase,
+    ) -> None:
+        """Rebuilding the same phase prompt (e.g. on restart) is served from the cache."""
+        first = claude_runner._build_phase_prompt(phase_for_prompt)
+        hits = _render_phase_prompt.cache_info().hits
+
+        assert claude_runner._build_phase_prompt(phase_for_prompt) is first
+        assert _render_phase_prompt.cache_info().hits == hits + 1
+
     def test_build_remediation_prompt(
         self,
         claude_runner: ClaudeRunner,
@@ -1006,12 +1038,11 @@ class TestClaudeRunnerLogFiles:
             runner._write_output("first")
             runner._write_output("second")
             runner._write_output("third")
+            runner._flush_stdout()
 
             # Prefix only on first call
-            assert mock_stdout.call_count == 3
-            assert mock_stdout.call_args_list[0][0][0] == "[Debussy] first"
-            assert mock_stdout.call_args_list[1][0][0] == "second"
-            assert mock_stdout.call_args_list[2][0][0] == "third"
+            written = "".join(call[0][0] for call in mock_stdout.call_args_list)
+            assert written == "[Debussy] firstsecondthird"
 
     def test_write_output_prefix_after_agent_change(
         self,
@@ -1024,10 +1055,227 @@ class TestClaudeRunnerLogFiles:
             runner._write_output("debussy output")
             runner._set_active_agent("Explore")
             runner._write_output("explore output")
+            runner._flush_stdout()
+
+            written = "".join(call[0][0] for call in mock_stdout.call_args_list)
+            assert written == "[Debussy] debussy output[Explore] explore output"
+
+
+class TestClaudeRunnerStdoutBuffering:
+    """Tests for coalesced terminal output."""
+
+    def test_small_writes_coalesced(self, temp_dir: Path) -> None:
+        """Rapid small writes should reach stdout in one write."""
+        runner = ClaudeRunner(temp_dir, output_mode="terminal")
+        runner._last_stdout_flush = float("inf")  # Never hit the time threshold
+
+        with patch("sys.stdout.write") as mock_stdout:
+            for chunk in ("a", "b", "c"):
+                runner._write_single_line(chunk)
+            mock_stdout.assert_not_called()
+            runner._flush_stdout()
+
+        mock_stdout.assert_called_once_with("abc")
+
+    def test_newline_flushes(self, temp_dir: Path) -> None:
+        """A completed line should be written immediately."""
+        runner = ClaudeRunner(temp_dir, output_mode="terminal")
+        runner._last_stdout_flush = float("inf")
+
+        with patch("sys.stdout.write") as mock_stdout:
+            runner._write_single_line("partial ")
+            runner._write_single_line("line", newline=True)
+
+        mock_stdout.assert_called_once_with("partial line\n")
+
+    def test_size_threshold_flushes(self, temp_dir: Path) -> None:
+        """Buffered output past the size threshold should be written."""
+        runner = ClaudeRunner(temp_dir, output_mode="terminal")
+        runner._last_stdout_flush = float("inf")
+
+        with patch("sys.stdout.write") as mock_stdout:
+            runner._write_single_line("x" * _STDOUT_FLUSH_BYTES)
+
+        mock_stdout.assert_called_once()
+
+    def test_flush_without_buffer_is_noop(self, temp_dir: Path) -> None:
+        """_flush_stdout() should not write when nothing is buffered."""
+        runner = ClaudeRunner(temp_dir, output_mode="terminal")
+
+        with patch("sys.stdout.write") as mock_stdout:
+            runner._flush_stdout()
+
+        mock_stdout.assert_not_called()
+
+
+class TestClaudeRunnerSessionLog:
+    """Tests for spooling raw stream output into the session log."""
+
+    async def test_stream_reader_writes_raw_lines(self, temp_dir: Path) -> None:
+        """Every raw stdout line should be written to the output spool."""
+        runner = ClaudeRunner(temp_dir, stream_output=False)
+        stream = asyncio.StreamReader()
+        stream.feed_data(b'{"type": "system"}\n\n{"type": "result", "result": "done"}\n')
+        stream.feed_eof()
+        output = io.StringIO()
+
+        _, was_stopped = await runner._stream_json_reader(stream, output)
+
+        assert was_stopped is False
+        assert output.getvalue() == '{"type": "system"}\n\n{"type": "result", "result": "done"}\n'
+
+    async def test_stream_reader_joins_lines_split_across_chunks(self, temp_dir: Path) -> None:
+        """A line split across reads (and a final unterminated line) is handled whole."""
+        runner = ClaudeRunner(temp_dir, stream_output=False, token_stats_callback=lambda _stats: None)
+        stream = asyncio.StreamReader()
+        stream.feed_data(b'{"type": "content_block_delta", "delta": {"type": "text_delta", "text": "he')
+        stream.feed_data(b'llo"}}\n{"type": "content_block_delta", "delta": {"type": "text_delta", "text": " world"}}')
+        stream.feed_eof()
+        output = io.StringIO()
+
+        text, _ = await runner._stream_json_reader(stream, output)
+
+        assert text == "hello world"
+        assert output.getvalue().count("\n") == 2
+
+    async def test_stream_reader_skips_parsing_without_consumers(self, temp_dir: Path) -> None:
+        """Lines are only recorded when no output or token stats need parsed events."""
+        runner = ClaudeRunner(temp_dir, stream_output=False)
+        stream = asyncio.StreamReader()
+        stream.feed_data(b'{"type": "content_block_delta", "delta": {"type": "text_delta", "text": "hi"}}\n')
+        stream.feed_eof()
+        output = io.StringIO()
+
+        with patch("debussy.runners.stream_parser.JsonStreamParser.parse_line") as parse_line:
+            text, _ = await runner._stream_json_reader(stream, output)
+
+        parse_line.assert_not_called()
+        assert text == ""
+        assert "text_delta" in output.getvalue()
+
+    async def test_stream_reader_stops_mid_chunk(self, temp_dir: Path) -> None:
+        """A stop requested while handling a chunk skips the remaining lines."""
+        runner = ClaudeRunner(temp_dir, stream_output=False)
+        stream = asyncio.StreamReader()
+        stream.feed_data(b'{"type": "system"}\n{"type": "system"}\n{"type": "system"}\n')
+        stream.feed_eof()
+        output = io.StringIO()
+        handled: list[bytes] = []
+
+        def handle_line(line: bytes, _output: io.StringIO, *, parse: bool = True) -> None:  # noqa: ARG001
+            handled.append(line)
+            runner._should_stop = True
+
+        with patch.object(runner, "_handle_stream_line", side_effect=handle_line):
+            _, was_stopped = await runner._stream_json_reader(stream, output)
+
+        assert was_stopped is True
+        assert len(handled) == 1
+
+    async def test_stream_reader_flushes_partial_delta_before_next_read(self, temp_dir: Path) -> None:
+        """A delta without a newline reaches stdout before the reader waits again."""
+        runner = ClaudeRunner(temp_dir, output_mode="terminal")
+        runner._last_stdout_flush = float("inf")  # Never hit the time threshold
+        stream = asyncio.StreamReader()
+        stream.feed_data(b'{"type": "content_block_delta", "delta": {"type": "text_delta", "text": "thinking"}}\n')
+        output = io.StringIO()
+
+        with patch("sys.stdout.write") as mock_stdout:
+            reader = asyncio.create_task(runner._stream_json_reader(stream, output))
+            await asyncio.sleep(0.01)  # Reader is now blocked on the next read
+            written = "".join(call[0][0] for call in mock_stdout.call_args_list)
+            stream.feed_eof()
+            await reader
+
+        assert written.endswith("thinking")
+
+    async def test_execute_phase_reports_jsonl_log_path(self, temp_dir: Path, simple_phase: Phase) -> None:
+        """With file output, the result should point at the raw JSONL log."""
+        log_dir = temp_dir / "logs"
+        runner = ClaudeRunner(temp_dir, output_mode="file", log_dir=log_dir, stream_output=False)
+        script = 'print(\'{"type": "result", "result": "done"}\')'
+
+        with patch.object(runner, "_build_claude_command", return_value=[sys.executable, "-c", script]):
+            result = await runner.execute_phase(simple_phase, "prompt", run_id="run1")
+
+        assert result.success is True
+        assert result.session_log == '{"type": "result", "result": "done"}\n'
+        assert result.session_log_path == log_dir / "run_run1_phase_1.jsonl"
+        assert result.session_log_path.read_text() == result.session_log
+
+    async def test_execute_phase_timeout_reports_jsonl_log_path(self, temp_dir: Path, simple_phase: Phase) -> None:
+        """A timed-out phase should still point at the raw JSONL log."""
+        log_dir = temp_dir / "logs"
+        runner = ClaudeRunner(temp_dir, timeout=1, output_mode="file", log_dir=log_dir, stream_output=False)
+        script = "import time; time.sleep(30)"
+
+        with patch.object(runner, "_build_claude_command", return_value=[sys.executable, "-c", script]):
+            result = await runner.execute_phase(simple_phase, "prompt", run_id="run1")
+
+        assert result.success is False
+        assert result.session_log.startswith("TIMEOUT")
+        assert result.session_log_path == log_dir / "run_run1_phase_1.jsonl"
+
+    async def test_execute_phase_without_log_file_has_no_path(self, temp_dir: Path, simple_phase: Phase) -> None:
+        """Terminal-only runs have no on-disk session log to point at."""
+        runner = ClaudeRunner(temp_dir, output_mode="terminal", stream_output=False)
+
+        with patch.object(runner, "_build_claude_command", return_value=[sys.executable, "-c", "pass"]):
+            result = await runner.execute_phase(simple_phase, "prompt", run_id="run1")
+
+        assert result.session_log_path is None
+
+    def test_read_session_log_appends_stderr(self) -> None:
+        """The session log should contain the spooled output followed by stderr."""
+        output = io.StringIO()
+        output.write('{"type": "system"}\n')
+
+        session_log = ClaudeRunner._read_session_log(output, ["boom\n"])
+
+        assert session_log == '{"type": "system"}\n\n\nSTDERR:\nboom\n'
+
+    def test_read_session_log_without_stderr(self) -> None:
+        """Without stderr the session log is just the spooled output."""
+        output = io.StringIO()
+        output.write("line\n")
+
+        assert ClaudeRunner._read_session_log(output, []) == "line\n"
+
+
+class TestClaudeRunnerKillProcess:
+    """Tests for killing the Claude process tree."""
+
+    async def test_kill_returns_when_pipes_never_close(self, temp_dir: Path) -> None:
+        """A process whose wait() never resolves must not hang the kill."""
+        runner = ClaudeRunner(temp_dir)
+        process = MagicMock(returncode=None, pid=424242)
+
+        async def never_reaped() -> int:
+            await asyncio.Event().wait()
+            return -9
+
+        process.wait = never_reaped
+
+        with (
+            patch("debussy.runners.claude._KILL_WAIT_TIMEOUT", 0.05),
+            patch("debussy.runners.claude._KILL_GRACE_PERIOD", 0.05),
+            patch("debussy.runners.claude.os.killpg"),
+            patch("debussy.runners.claude.os.kill"),
+            patch("debussy.runners.claude.sys.platform", "linux"),
+        ):
+            await asyncio.wait_for(runner._kill_process_tree(process), timeout=5)
+
+    async def test_kill_skips_finished_process(self, temp_dir: Path) -> None:
+        """An already-exited process is left alone."""
+        runner = ClaudeRunner(temp_dir)
+        process = MagicMock(returncode=0, pid=424242)
+        process.wait = AsyncMock()
+
+        with patch("debussy.runners.claude.os.killpg") as mock_killpg:
+            await runner._kill_process_tree(process)
 
-            assert mock_stdout.call_count == 2
-            assert mock_stdout.call_args_list[0][0][0] == "[Debussy] debussy output"
-            assert mock_stdout.call_args_list[1][0][0] == "[Explore] explore output"
+        mock_killpg.assert_not_called()
+        process.wait.assert_not_called()
 
 
 class TestClaudeRunnerStreamEvents:
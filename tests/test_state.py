@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import gc
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -321,6 +325,23 @@ class TestCompletionSignals:
         assert retrieved.report is not None
         assert retrieved.report["tasks_completed"] == 5
 
+    def test_latest_signal_wins(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
+        """Test that the most recent signal for a phase is returned."""
+        run_id = state_manager.create_run(sample_plan)
+        state_manager.record_completion_signal(
+            run_id,
+            CompletionSignal(phase_id="1", status="blocked", signaled_at=datetime(2025, 1, 1, 9, 0, 0)),
+        )
+        state_manager.record_completion_signal(
+            run_id,
+            CompletionSignal(phase_id="1", status="completed", signaled_at=datetime(2025, 1, 1, 10, 0, 0)),
+        )
+
+        retrieved = state_manager.get_completion_signal(run_id, "1")
+        assert retrieved is not None
+        assert retrieved.status == "completed"
+        assert retrieved.signaled_at == datetime(2025, 1, 1, 10, 0, 0)
+
     def test_get_nonexistent_signal(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
         """Test getting a nonexistent completion signal."""
         run_id = state_manager.create_run(sample_plan)
@@ -341,6 +362,26 @@ class TestProgressLogging:
         # Progress is logged for stuck detection
         # This is a fire-and-forget operation
 
+    def test_log_progress_many(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
+        """Test logging several steps at once keeps their order."""
+        run_id = state_manager.create_run(sample_plan)
+        state_manager.log_progress_many(run_id, "1", ["tests:running", "tests:passed", "gates:validating"])
+
+        steps = [step for step, _ in state_manager.get_progress(run_id, "1")]
+        assert steps == ["tests:running", "tests:passed", "gates:validating"]
+
+    def test_log_progress_many_stamps_each_step(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
+        """Each step in a batch gets its own timestamp."""
+        run_id = state_manager.create_run(sample_plan)
+        times = iter([datetime(2026, 1, 1, 12, 0, second) for second in range(3)])
+
+        with patch("debussy.core.state.datetime") as mock_datetime:
+            mock_datetime.now.side_effect = lambda *_args: next(times)
+            state_manager.log_progress_many(run_id, "1", ["a", "b", "c"])
+
+        logged = [logged_at.second for _, logged_at in state_manager.get_progress(run_id, "1")]
+        assert logged == [0, 1, 2]
+
 
 class TestStateMachineIntegrity:
     """Tests for state machine integrity - ensuring no invalid state transitions."""
@@ -599,3 +640,91 @@ class TestResumeAndSkip:
         completed = state_manager.get_completed_phases(run_id)
 
         assert completed == {"1"}
+
+
+class TestIndexes:
+    """Tests for the lookup indexes on the state database."""
+
+    def test_lookup_indexes_created(self, state_manager: StateManager) -> None:
+        """Schema setup should create the per-run lookup indexes."""
+        with closing(sqlite3.connect(state_manager.db_path)) as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+        assert {
+            "idx_runs_status_started",
+            "idx_runs_started",
+            "idx_gate_results_execution",
+            "idx_signals_run_phase",
+            "idx_progress_run_phase",
+        } <= names
+
+    def test_progress_query_uses_index(self, state_manager: StateManager) -> None:
+        """get_progress() lookups should not scan the whole progress log."""
+        with closing(sqlite3.connect(state_manager.db_path)) as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT step, logged_at FROM progress_log WHERE run_id = ? AND phase_id = ? ORDER BY logged_at",
+                ("run", "1"),
+            ).fetchall()
+
+        assert any("idx_progress_run_phase" in row[-1] for row in plan)
+
+    def test_reopening_existing_database(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
+        """A second StateManager on the same database keeps existing data."""
+        run_id = state_manager.create_run(sample_plan)
+
+        reopened = StateManager(state_manager.db_path)
+
+        assert reopened.get_run(run_id) is not None
+
+
+class TestConnection:
+    """Tests for the StateManager's long-lived connection."""
+
+    def test_connection_reused_between_queries(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
+        """Successive operations should share one connection."""
+        run_id = state_manager.create_run(sample_plan)
+        conn = state_manager._conn
+
+        state_manager.get_run(run_id)
+        state_manager.list_runs()
+
+        assert conn is not None
+        assert state_manager._conn is conn
+
+    def test_writes_visible_to_other_managers(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
+        """Each operation commits, so another connection sees it immediately."""
+        other = StateManager(state_manager.db_path)
+        assert other.get_current_run() is None
+
+        run_id = state_manager.create_run(sample_plan)
+
+        current = other.get_current_run()
+        assert current is not None
+        assert current.id == run_id
+
+    def test_failed_operation_rolls_back(self, state_manager: StateManager) -> None:
+        """An error inside a transaction should leave the connection usable."""
+        with pytest.raises(sqlite3.OperationalError), state_manager._connection() as conn:
+            conn.execute("INSERT INTO progress_log (run_id, phase_id, step, logged_at) VALUES ('r', '1', 's', 'now')")
+            conn.execute("SELECT * FROM missing_table")
+
+        assert state_manager.get_progress("r", "1") == []
+
+    def test_close_reopens_on_next_use(self, state_manager: StateManager, sample_plan: MasterPlan) -> None:
+        """close() releases the connection without breaking later calls."""
+        run_id = state_manager.create_run(sample_plan)
+
+        state_manager.close()
+
+        assert state_manager._conn is None
+        assert state_manager.get_run(run_id) is not None
+
+    def test_dropped_manager_closes_connection(self, state_manager: StateManager, recwarn: pytest.WarningsRecorder) -> None:
+        """A manager garbage-collected without close() should not leak its connection."""
+        other = StateManager(state_manager.db_path)
+        other.list_runs()
+
+        del other
+        gc.collect()
+
+        assert not [w for w in recwarn if issubclass(w.category, ResourceWarning)]
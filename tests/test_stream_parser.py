@@ -5,11 +5,11 @@ from __future__ import annotations
 import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from debussy.runners.stream_parser import JsonStreamParser, StreamParserCallbacks
+from debussy.runners.stream_parser import _HANDLED_EVENT_TYPES, JsonStreamParser, StreamParserCallbacks
 
 
 @pytest.fixture
@@ -133,6 +133,50 @@ class TestJsonStreamParserParsing:
         result = parser.parse_line(event)
         assert result is None
 
+    def test_skips_unhandled_types_without_json_parse(self, parser: JsonStreamParser) -> None:
+        """Compact events of unhandled types are dropped before the JSON parse."""
+        with patch("debussy.runners.stream_parser.loads") as mock_loads:
+            assert parser.parse_line('{"type":"system","subtype":"init","tools":[]}') is None
+
+        mock_loads.assert_not_called()
+
+    def test_handled_types_match_dispatch_table(self, parser: JsonStreamParser) -> None:
+        """The peek fast path must never drop an event type that has a handler."""
+        assert frozenset(parser._event_handlers) == _HANDLED_EVENT_TYPES
+
+    def test_parses_compact_handled_event(self, parser: JsonStreamParser) -> None:
+        """Compact (no-space) handled events still go through the full parse."""
+        line = json.dumps({"type": "content_block_delta", "delta": {"type": "text_delta", "text": "hi"}}, separators=(",", ":"))
+
+        assert parser.parse_line(line) == "hi"
+
+    def test_parses_event_with_type_not_first(self, parser: JsonStreamParser) -> None:
+        """Events whose first key is not "type" fall back to a full parse."""
+        line = json.dumps({"delta": {"type": "text_delta", "text": "later"}, "type": "content_block_delta"})
+
+        assert parser.parse_line(line) == "later"
+
+
+class TestJsonStreamParserOrjson:
+    """Tests for parsing with the optional orjson backend."""
+
+    @pytest.fixture(autouse=True)
+    def use_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Swap the module's JSON functions for orjson's, skipping if it is absent."""
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr("debussy.runners.stream_parser.loads", orjson.loads)
+        monkeypatch.setattr("debussy.runners.stream_parser.JSONDecodeError", orjson.JSONDecodeError)
+
+    def test_parses_content_block_delta(self, parser: JsonStreamParser) -> None:
+        """Handled events parse the same with orjson."""
+        event = json.dumps({"type": "content_block_delta", "delta": {"type": "text_delta", "text": "fast"}})
+
+        assert parser.parse_line(event) == "fast"
+
+    def test_handles_invalid_json(self, parser: JsonStreamParser) -> None:
+        """orjson decode errors still fall back to plain text."""
+        assert parser.parse_line('{"type": "assistant", oops') == '{"type": "assistant", oops'
+
 
 class TestJsonStreamParserToolUse:
     """Tests for tool use parsing."""
@@ -158,6 +202,43 @@ class TestJsonStreamParserToolUse:
         collected, _ = text_collector
         assert any("[Read: file.py]" in t for t in collected)
 
+    @pytest.mark.parametrize(
+        ("file_path", "expected"),
+        [
+            ("file.py", "[Edit: file.py]"),
+            ("C:\\src\\pkg\\file.py", "[Edit: file.py]"),
+            ("C:\\src/pkg\\file.py", "[Edit: file.py]"),
+            ("/path/to/dir/", "[Edit: ]"),
+            ("", "[Edit: ?]"),
+        ],
+    )
+    def test_file_tool_filename_extraction(
+        self,
+        parser: JsonStreamParser,
+        text_collector: tuple[list[str], MagicMock],
+        file_path: str,
+        expected: str,
+    ) -> None:
+        """Parser shows only the last path component for POSIX and Windows paths."""
+        event = json.dumps(
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {
+                            "type": "tool_use",
+                            "name": "Edit",
+                            "input": {"file_path": file_path},
+                        }
+                    ]
+                },
+            }
+        )
+        parser.parse_line(event)
+
+        collected, _ = text_collector
+        assert expected + "\n" in collected
+
     def test_displays_bash_tool(self, parser: JsonStreamParser, text_collector: tuple[list[str], MagicMock]) -> None:
         """Parser displays Bash tool use."""
         event = json.dumps(
@@ -0,0 +1,391 @@
+"""Unit tests for DebussyTUI behaviour outside the controller message handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.text import Text
+from textual.widgets import RichLog
+from textual.worker import WorkerState
+
+from debussy.ui.base import UIState, format_duration
+from debussy.ui.controller import OrchestrationController
+from debussy.ui.messages import StateChanged
+from debussy.ui.tui import _LOG_BUFFER_MAX, _LOG_FLUSH_BATCH, _LOG_MAX_LINES, DebussyTUI, HUDHeader, TextualUI
+
+
+class TestUpdateTimer:
+    """Test the 1 Hz HUD timer."""
+
+    def test_update_timer_skips_unchanged_second(self) -> None:
+        """_update_timer() should only write the reactive when the second changes."""
+        app = DebussyTUI()
+        controller = OrchestrationController(app)
+        app.set_controller(controller)
+        controller.context.start_time = 100.0
+        mock_header = MagicMock(spec=HUDHeader)
+
+        with (
+            patch.object(app, "query_one", return_value=mock_header) as mock_query,
+            patch("debussy.ui.tui.time.monotonic", side_effect=[165.2, 165.9, 166.0]),
+        ):
+            app._update_timer()
+            assert mock_header.elapsed == "00:01:05"
+            app._update_timer()
+            app._update_timer()
+
+        assert mock_header.elapsed == "00:01:06"
+        mock_query.assert_called_once()
+
+    def test_update_timer_refreshes_after_phase_restart(self) -> None:
+        """A reset start_time (new phase) should update the display even at a lower second."""
+        app = DebussyTUI()
+        controller = OrchestrationController(app)
+        app.set_controller(controller)
+        controller.context.start_time = 100.0
+        mock_header = MagicMock(spec=HUDHeader)
+
+        with (
+            patch.object(app, "query_one", return_value=mock_header),
+            patch("debussy.ui.tui.time.monotonic", side_effect=[130.0, 131.0]),
+        ):
+            app._update_timer()
+            controller.context.start_time = 130.5
+            app._update_timer()
+
+        assert mock_header.elapsed == "00:00:00"
+
+
+class TestFormatDuration:
+    """Test the HH:MM:SS formatter used by the HUD timer."""
+
+    def test_formats_whole_seconds(self) -> None:
+        """Integer seconds from the timer should format as HH:MM:SS."""
+        assert format_duration(0) == "00:00:00"
+        assert format_duration(3725) == "01:02:05"
+
+    def test_truncates_fractional_seconds(self) -> None:
+        """Fractional elapsed values (status action) should truncate, not round."""
+        assert format_duration(59.9) == "00:00:59"
+
+
+class TestElapsedTimerPausing:
+    """Test that the HUD timer only ticks while orchestration is running."""
+
+    def test_state_change_pauses_and_resumes_timer(self) -> None:
+        """on_state_changed() should pause the timer when paused and resume when running."""
+        app = DebussyTUI()
+        app._elapsed_timer = MagicMock()
+
+        with patch.object(app, "query_one", return_value=MagicMock(spec=HUDHeader)):
+            app.on_state_changed(StateChanged(UIState.PAUSED))
+            app._elapsed_timer.pause.assert_called_once()
+            app.on_state_changed(StateChanged(UIState.RUNNING))
+
+        app._elapsed_timer.resume.assert_called_once()
+
+    def test_worker_finish_pauses_timer(self) -> None:
+        """The timer should stop ticking once the orchestration worker finishes."""
+        app = DebussyTUI()
+        app._elapsed_timer = MagicMock()
+        app._worker = MagicMock()
+
+        with patch.object(app, "write_log"):
+            app.on_worker_state_changed(MagicMock(worker=app._worker, state=WorkerState.SUCCESS))
+
+        app._elapsed_timer.pause.assert_called_once()
+
+
+class TestWorkerDone:
+    """Test the worker completion event used by graceful shutdown."""
+
+    def test_worker_done_set_on_orchestration_worker_finish(self) -> None:
+        """on_worker_state_changed() should set the event for the orchestration worker."""
+        app = DebussyTUI()
+        app._worker = MagicMock()
+        event = MagicMock(worker=app._worker, state=WorkerState.CANCELLED)
+
+        with patch.object(app, "write_log"):
+            app.on_worker_state_changed(event)
+
+        assert app._worker_done.is_set()
+
+    def test_worker_done_ignores_other_workers(self) -> None:
+        """on_worker_state_changed() should ignore unrelated workers (e.g. shutdown)."""
+        app = DebussyTUI()
+        app._worker = MagicMock()
+        event = MagicMock(worker=MagicMock(), state=WorkerState.SUCCESS)
+
+        with patch.object(app, "write_log"):
+            app.on_worker_state_changed(event)
+
+        assert not app._worker_done.is_set()
+
+
+class TestProcessCleanup:
+    """Test orphaned-process cleanup on shutdown."""
+
+    async def test_cleanup_kills_orphans_off_event_loop(self) -> None:
+        """_cleanup_all_processes() should run kill_all in a worker thread."""
+        app = DebussyTUI()
+        kill_threads: list[threading.Thread] = []
+
+        def fake_kill_all() -> list[int]:
+            kill_threads.append(threading.current_thread())
+            return [1234]
+
+        with patch("debussy.ui.tui.pid_registry") as mock_registry:
+            mock_registry.get_active_pids.return_value = {1234}
+            mock_registry.kill_all.side_effect = fake_kill_all
+            await app._cleanup_all_processes()
+
+        assert len(kill_threads) == 1
+        assert kill_threads[0] is not threading.main_thread()
+
+    async def test_verify_cleanup_complete_when_clean(self) -> None:
+        """_verify_cleanup_complete() should return True without killing when clean."""
+        app = DebussyTUI()
+
+        with patch("debussy.ui.tui.pid_registry") as mock_registry:
+            mock_registry.verify_all_dead.return_value = []
+            assert await app._verify_cleanup_complete() is True
+
+        mock_registry.kill_all.assert_not_called()
+
+
+class TestEagerTaskFactory:
+    """Test the eager task factory installed while the app is mounted."""
+
+    async def test_eager_task_factory_set_on_mount_and_restored(self) -> None:
+        """The running loop should use eager tasks while mounted, then revert."""
+        loop = asyncio.get_running_loop()
+        previous = loop.get_task_factory()
+        app = DebussyTUI()
+        app.set_controller(OrchestrationController(app))
+
+        with patch("debussy.ui.tui.pid_registry") as mock_registry:
+            mock_registry.get_active_pids.return_value = set()
+            async with app.run_test():
+                assert loop.get_task_factory() is asyncio.eager_task_factory
+
+        assert loop.get_task_factory() is previous
+
+
+class TestHUDMessageClear:
+    """Test the shared HUD message clear timer."""
+
+    def test_schedule_hud_clear_replaces_pending_timer(self) -> None:
+        """A new clear request should stop the previously scheduled timer."""
+        app = DebussyTUI()
+        first_timer, second_timer = MagicMock(), MagicMock()
+
+        with patch.object(app, "set_timer", side_effect=[first_timer, second_timer]) as mock_set_timer:
+            app._schedule_hud_clear(3.0)
+            app._schedule_hud_clear(5.0)
+
+        assert mock_set_timer.call_count == 2
+        first_timer.stop.assert_called_once()
+        second_timer.stop.assert_not_called()
+        assert app._clear_timer is second_timer
+
+
+class TestWriteLog:
+    """Test buffered log panel writes."""
+
+    @pytest.fixture
+    def app_with_log(self) -> tuple[DebussyTUI, RichLog]:
+        """Create an app whose #log query returns a detached RichLog with a mocked write."""
+        app = DebussyTUI()
+        log = RichLog(highlight=True, markup=True)
+        log.write = MagicMock()  # type: ignore[method-assign]
+        return app, log
+
+    def test_write_log_buffers_until_flush(self, app_with_log: tuple[DebussyTUI, RichLog]) -> None:
+        """write_log() should only buffer; _flush_log() writes all lines at once."""
+        app, log = app_with_log
+
+        with patch.object(app, "query_one", return_value=log):
+            app.write_log("first")
+            app.write_log("second")
+            log.write.assert_not_called()
+            app._flush_log()
+
+        log.write.assert_called_once()
+        assert log.write.call_args[0][0].plain == "first\nsecond"
+        assert not app._log_buffer
+
+    def test_flush_styles_tool_line(self, app_with_log: tuple[DebussyTUI, RichLog]) -> None:
+        """Tool lines should be rendered with the tool span in italic dim."""
+        app, log = app_with_log
+
+        with patch.object(app, "query_one", return_value=log):
+            app.write_log("  [Read: file.py]")
+            app._flush_log()
+
+        written = log.write.call_args[0][0]
+        assert isinstance(written, Text)
+        assert written.plain == "  ⟨Read: file.py⟩"
+        assert any(span.style == "italic dim" for span in written.spans)
+
+    def test_flush_parses_markup(self, app_with_log: tuple[DebussyTUI, RichLog]) -> None:
+        """Non-tool lines should have their Rich markup applied."""
+        app, log = app_with_log
+
+        with patch.object(app, "query_one", return_value=log):
+            app.write_log("[green]Done[/green]")
+            app._flush_log()
+
+        written = log.write.call_args[0][0]
+        assert written.plain == "Done"
+        assert any(span.style == "green" for span in written.spans)
+
+    def test_flush_keeps_invalid_markup_as_plain_text(self, app_with_log: tuple[DebussyTUI, RichLog]) -> None:
+        """A line with broken markup should be written verbatim instead of raising."""
+        app, log = app_with_log
+
+        with patch.object(app, "query_one", return_value=log):
+            app.write_log("closing [/bold] without opening")
+            app._flush_log()
+
+        assert log.write.call_args[0][0].plain == "closing [/bold] without opening"
+
+    def test_flush_without_pending_lines_is_noop(self, app_with_log: tuple[DebussyTUI, RichLog]) -> None:
+        """_flush_log() should not touch the widget when nothing is buffered."""
+        app, log = app_with_log
+
+        with patch.object(app, "query_one", return_value=log) as mock_query:
+            app._flush_log()
+
+        mock_query.assert_not_called()
+        log.write.assert_not_called()
+
+    def test_flush_writes_at_most_one_batch(self, app_with_log: tuple[DebussyTUI, RichLog]) -> None:
+        """_flush_log() should leave lines beyond the per-tick batch queued."""
+        app, log = app_with_log
+        for i in range(_LOG_FLUSH_BATCH + 5):
+            app.write_log(f"line {i}")
+
+        with patch.object(app, "query_one", return_value=log):
+            app._flush_log()
+
+        assert len(app._log_buffer) == 5
+        assert app._log_buffer[0] == f"line {_LOG_FLUSH_BATCH}"
+
+    def test_log_buffer_drops_oldest_when_full(self) -> None:
+        """The log buffer should be bounded, discarding the oldest lines."""
+        app = DebussyTUI()
+
+        for i in range(_LOG_BUFFER_MAX + 1):
+            app.write_log(f"line {i}")
+
+        assert len(app._log_buffer) == _LOG_BUFFER_MAX
+        assert app._log_buffer[0] == "line 1"
+
+    async def test_log_panel_bounded(self) -> None:
+        """The log panel should cap its retained lines."""
+        app = DebussyTUI()
+        app.set_controller(OrchestrationController(app))
+
+        with patch("debussy.ui.tui.pid_registry") as mock_registry:
+            mock_registry.get_active_pids.return_value = set()
+            async with app.run_test():
+                assert app.query_one("#log", RichLog).max_lines == _LOG_MAX_LINES
+
+    def test_write_log_skips_empty(self) -> None:
+        """Empty messages should not be buffered."""
+        app = DebussyTUI()
+
+        app.write_log("")
+
+        assert not app._log_buffer
+
+    def test_welcome_banner_written_once(self) -> None:
+        """The welcome banner, plan name and phase count should be one log write."""
+        app = DebussyTUI()
+
+        with patch.object(app, "write_log") as mock_write:
+            app._write_welcome_banner("my-plan", 4)
+
+        mock_write.assert_called_once()
+        written = mock_write.call_args[0][0]
+        assert "[bold]Plan:[/bold] my-plan" in written
+        assert "[bold]Phases:[/bold] 4" in written
+
+    def test_status_popup_written_once(self) -> None:
+        """show_status_popup() should queue one multi-line log entry."""
+        app = DebussyTUI()
+
+        app.show_status_popup({"Phase": "1", "State": "running"})
+
+        assert list(app._log_buffer) == ["[bold]Current Status[/bold]\n  Phase: 1\n  State: running"]
+
+    async def test_graceful_shutdown_exits_without_delay(self) -> None:
+        """_graceful_shutdown() should queue exit after the cleanup messages, without sleeping."""
+        app = DebussyTUI()
+        calls: list[object] = []
+
+        with (
+            patch("debussy.ui.tui.pid_registry") as mock_registry,
+            patch.object(app, "call_later", side_effect=lambda cb, *_args: calls.append(cb)),
+            patch("debussy.ui.tui.asyncio.sleep") as mock_sleep,
+        ):
+            mock_registry.get_active_pids.return_value = set()
+            mock_registry.verify_all_dead.return_value = []
+            await DebussyTUI._graceful_shutdown.__wrapped__(app)
+
+        mock_sleep.assert_not_called()
+        assert calls[-1] == app.exit
+
+
+class TestTextualUIVerbose:
+    """Test the TextualUI verbose gate."""
+
+    def test_verbose_false_before_app_created(self) -> None:
+        """verbose should be False when there is no controller yet."""
+        assert TextualUI().verbose is False
+
+    def test_log_dropped_when_verbose_off(self) -> None:
+        """log()/log_message() should not reach the app when verbose is off."""
+        ui = TextualUI()
+        app = ui.create_app()
+        ui.context.verbose = False
+
+        with patch.object(app, "log_message") as mock_log:
+            ui.log("hidden")
+            ui.log_message("hidden")
+
+        mock_log.assert_not_called()
+
+    def test_log_forwarded_when_verbose_on(self) -> None:
+        """log() should forward to the app when verbose is on."""
+        ui = TextualUI()
+        app = ui.create_app()
+        ui.context.verbose = True
+
+        with patch.object(app, "log_message") as mock_log:
+            ui.log("shown")
+
+        mock_log.assert_called_once_with("shown")
+
+
+class TestLazyTextualImport:
+    """Test that Textual is only imported when the TUI is used."""
+
+    def test_cli_import_does_not_load_textual(self) -> None:
+        """Importing the CLI should not pull in Textual."""
+        code = "import sys, debussy.cli; print(any(m == 'textual' or m.startswith('textual.') for m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
+
+    def test_ui_package_exports_textual_ui_lazily(self) -> None:
+        """debussy.ui should still expose TextualUI and OrchestrationController."""
+        import debussy.ui
+
+        assert debussy.ui.TextualUI is TextualUI
+        assert debussy.ui.OrchestrationController is OrchestrationController
@@ -0,0 +1,111 @@
+"""Unit tests for the TUI widgets (HUDHeader, HotkeyBar, dialogs)."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from debussy.ui.controller import OrchestrationController
+from debussy.ui.tui import DebussyTUI
+from debussy.ui.widgets import HotkeyBar, HUDHeader, QuitConfirmScreen, ResumeConfirmScreen
+
+
+class TestHUDHeaderRender:
+    """Test HUDHeader rendering and render caching."""
+
+    def test_render_reuses_text_when_unchanged(self) -> None:
+        """render() should return the cached Text when no reactive changed."""
+        header = HUDHeader()
+
+        first = header.render()
+        second = header.render()
+
+        assert first is second
+
+    def test_render_rebuilds_on_change(self) -> None:
+        """render() should rebuild the Text when a reactive value changes."""
+        header = HUDHeader()
+        first = header.render()
+
+        header.elapsed = "00:01:05"
+        second = header.render()
+
+        assert second is not first
+        assert "00:01:05" in second.plain
+
+    def test_render_rebuilds_on_model_change(self) -> None:
+        """render() should include the model in the cache key."""
+        header = HUDHeader()
+        header.render()
+
+        header.model = "opus"
+
+        assert "(opus)" in header.render().plain
+
+
+class TestHotkeyBarRender:
+    """Test HotkeyBar rendering and render caching."""
+
+    def test_render_reuses_text_when_unchanged(self) -> None:
+        """render() should return the cached Text when no reactive changed."""
+        bar = HotkeyBar()
+
+        assert bar.render() is bar.render()
+
+    def test_render_rebuilds_on_message(self) -> None:
+        """render() should rebuild when the transient message changes."""
+        bar = HotkeyBar()
+        first = bar.render()
+
+        bar.message = "Pause requested"
+        second = bar.render()
+
+        assert second is not first
+        assert "Pause requested" in second.plain
+
+    def test_render_rebuilds_on_toggle_state(self) -> None:
+        """render() should reflect verbose and auto-scroll changes."""
+        bar = HotkeyBar()
+        assert "erbose (on)" in bar.render().plain
+
+        bar.verbose = False
+        bar.auto_scroll = True
+        plain = bar.render().plain
+
+        assert "erbose (off)" in plain
+        assert "utoscroll (on)" in plain
+
+    def test_static_segments_not_mutated(self) -> None:
+        """Building a render must not append to the shared static segments."""
+        bar = HotkeyBar()
+        prefix_before = bar._static_prefix.plain
+
+        bar.message = "hello"
+        bar.render()
+
+        assert bar._static_prefix.plain == prefix_before
+
+
+class TestDialogStyles:
+    """Test that dialog styles ship as class-level default CSS."""
+
+    async def test_quit_dialog_layout(self) -> None:
+        """QuitConfirmScreen should be centered with its fixed dialog size."""
+        app = DebussyTUI()
+        app.set_controller(OrchestrationController(app))
+
+        with patch("debussy.ui.tui.pid_registry") as mock_registry:
+            mock_registry.get_active_pids.return_value = set()
+            async with app.run_test() as pilot:
+                app.push_screen(QuitConfirmScreen())
+                await pilot.pause()
+                dialog = app.screen.query_one("#quit-dialog")
+
+                assert app.screen.styles.align == ("center", "middle")
+                assert (dialog.region.width, dialog.region.height) == (50, 12)
+
+    def test_dialogs_use_default_css(self) -> None:
+        """Dialog CSS should be DEFAULT_CSS (registered once per class), not app-level CSS."""
+        assert "#quit-dialog" in QuitConfirmScreen.DEFAULT_CSS
+        assert "#resume-dialog" in ResumeConfirmScreen.DEFAULT_CSS
+        assert not QuitConfirmScreen.CSS
+        assert not ResumeConfirmScreen.CSS
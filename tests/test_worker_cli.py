@@ -0,0 +1,193 @@
+"""Tests for the argparse-based worker CLI (debussy-worker)."""
+
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from debussy.config import get_orchestrator_dir
+from debussy.core.models import MasterPlan, Phase, PhaseStatus
+from debussy.core.state import StateManager
+from debussy.worker_cli import _get_state, _state_for, main, record_done
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches() -> None:
+    """Start each test without memoized state managers."""
+    _state_for.cache_clear()
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run the worker CLI from a temporary project directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def run_id(project_dir: Path) -> str:
+    """Create an active orchestration run in the project state database."""
+    state = StateManager(project_dir / ".debussy" / "state.db")
+    plan = MasterPlan(
+        name="Test Plan",
+        path=project_dir / "plan.md",
+        phases=[Phase(id="1", title="Setup", path=project_dir / "phase-1.md", status=PhaseStatus.PENDING)],
+    )
+    return state.create_run(plan)
+
+
+def _state(project_dir: Path) -> StateManager:
+    return StateManager(project_dir / ".debussy" / "state.db")
+
+
+class TestDone:
+    """Tests for `debussy-worker done`."""
+
+    def test_records_completion_signal(self, project_dir: Path, run_id: str, capsys: pytest.CaptureFixture[str]) -> None:
+        """done should store the signal for the current run."""
+        code = main(["done", "--phase", "1", "--status", "blocked", "--reason", "waiting"])
+
+        assert code == 0
+        signal = _state(project_dir).get_completion_signal(run_id, "1")
+        assert signal is not None
+        assert signal.status == "blocked"
+        assert signal.reason == "waiting"
+        assert "Completion signal recorded for phase 1" in capsys.readouterr().out
+
+    def test_records_json_report(self, project_dir: Path, run_id: str) -> None:
+        """--report should be parsed as JSON."""
+        assert main(["done", "-p", "1", "--report", '{"tests": "passed"}']) == 0
+
+        signal = _state(project_dir).get_completion_signal(run_id, "1")
+        assert signal is not None
+        assert signal.report == {"tests": "passed"}
+
+    @pytest.mark.usefixtures("run_id")
+    def test_invalid_report_fails(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Malformed JSON should exit non-zero with a message."""
+        assert main(["done", "-p", "1", "--report", "{not json"]) == 1
+        assert "Invalid JSON report" in capsys.readouterr().err
+
+    @pytest.mark.usefixtures("project_dir")
+    def test_non_object_report_fails_before_state(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """A report that is not a JSON object is rejected before the run lookup."""
+        assert main(["done", "-p", "1", "--report", "[1, 2]"]) == 1
+        assert "Invalid JSON report" in capsys.readouterr().err
+
+    @pytest.mark.usefixtures("project_dir")
+    def test_no_active_run_fails(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """done without a run should exit non-zero."""
+        assert main(["done", "--phase", "1"]) == 1
+        assert "No active orchestration run found" in capsys.readouterr().err
+
+    def test_rejects_unknown_status(self) -> None:
+        """--status should be limited to the completion statuses."""
+        with pytest.raises(SystemExit):
+            main(["done", "--phase", "1", "--status", "finished"])
+
+
+class TestDoneOrjson:
+    """Tests for report parsing with the optional orjson backend."""
+
+    @pytest.fixture(autouse=True)
+    def use_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Swap the module's JSON functions for orjson's, skipping if it is absent."""
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr("debussy.worker_cli.loads", orjson.loads)
+        monkeypatch.setattr("debussy.worker_cli.JSONDecodeError", orjson.JSONDecodeError)
+
+    def test_records_json_report(self, project_dir: Path, run_id: str) -> None:
+        """The report should be parsed into a dict with orjson."""
+        record_done("1", report='{"tests": "passed"}')
+
+        signal = _state(project_dir).get_completion_signal(run_id, "1")
+        assert signal is not None
+        assert signal.report == {"tests": "passed"}
+
+    @pytest.mark.usefixtures("run_id")
+    def test_invalid_report_raises(self) -> None:
+        """orjson decode errors should surface as ValueError."""
+        with pytest.raises(ValueError, match="Invalid JSON report"):
+            record_done("1", report="{not json")
+
+
+class TestProgress:
+    """Tests for `debussy-worker progress`."""
+
+    def test_logs_progress(self, project_dir: Path, run_id: str) -> None:
+        """progress should append a step to the phase's progress log."""
+        assert main(["progress", "--phase", "1", "--step", "tests:running"]) == 0
+
+        steps = [step for step, _ in _state(project_dir).get_progress(run_id, "1")]
+        assert steps == ["tests:running"]
+
+    def test_logs_repeated_steps(self, project_dir: Path, run_id: str) -> None:
+        """Repeated --step options should all be logged in one call."""
+        assert main(["progress", "-p", "1", "-s", "tests:running", "-s", "tests:passed"]) == 0
+
+        steps = [step for step, _ in _state(project_dir).get_progress(run_id, "1")]
+        assert steps == ["tests:running", "tests:passed"]
+
+    def test_reads_steps_from_stdin(self, project_dir: Path, run_id: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        """--step - should read newline-delimited steps from stdin."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("lint:running\n\nlint:passed\n"))
+
+        assert main(["progress", "-p", "1", "-s", "-"]) == 0
+
+        steps = [step for step, _ in _state(project_dir).get_progress(run_id, "1")]
+        assert steps == ["lint:running", "lint:passed"]
+
+    @pytest.mark.usefixtures("run_id")
+    def test_empty_stdin_fails(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+        """Reading no steps from stdin should exit non-zero."""
+        monkeypatch.setattr("sys.stdin", io.StringIO(""))
+
+        assert main(["progress", "-p", "1", "-s", "-"]) == 1
+        assert "No progress steps given" in capsys.readouterr().err
+
+
+class TestStateCaching:
+    """Repeated worker calls in one process reuse their setup."""
+
+    @pytest.mark.usefixtures("project_dir")
+    def test_state_manager_reused(self) -> None:
+        """_get_state() should build one StateManager per database."""
+        assert _get_state() is _get_state()
+
+    def test_state_manager_follows_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A different project directory should get its own StateManager."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        monkeypatch.chdir(tmp_path / "a")
+        first = _get_state()
+        monkeypatch.chdir(tmp_path / "b")
+
+        second = _get_state()
+
+        assert second is not first
+        assert second.db_path == tmp_path / "b" / ".debussy" / "state.db"
+
+    def test_orchestrator_dir_recreated_after_delete(self, tmp_path: Path) -> None:
+        """get_orchestrator_dir() should recreate a .debussy removed mid-process."""
+        first = get_orchestrator_dir(tmp_path)
+        first.rmdir()
+
+        second = get_orchestrator_dir(tmp_path)
+
+        assert second == tmp_path / ".debussy"
+        assert second.is_dir()
+
+
+class TestImportGraph:
+    """The worker entry point must stay free of Typer and Rich."""
+
+    def test_does_not_import_typer_or_rich(self) -> None:
+        """Importing debussy.worker_cli should not load typer, click or rich."""
+        code = "import sys, debussy.worker_cli; print(sorted(m for m in ('typer', 'click', 'rich') if m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"